@@ -33,8 +33,12 @@ setup(
         'pyyaml >= 6.0.1',
         'schema >= 0.7.5',
         'importlib-metadata >= 8.5.0',
+        'tomli >= 1.1.0; python_version < "3.11"',
     ],
     extras_require={
+        'numpy': [
+            'numpy>=1.22',
+        ],
         'dev': [
             'wheel>=0.41.1',
             'twine>=4.0.2',
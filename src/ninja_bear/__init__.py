@@ -1,12 +1,63 @@
-from .base.info import VERSION  # noqa: F401
-from .base.orchestrator import Orchestrator  # noqa: F401
-from .base.distributor_base import DistributorBase  # noqa: F401
-from .base.distributor_credentials import DistributorCredentials  # noqa: F401
-from .base.language_config_base import LanguageConfigBase  # noqa: F401
-from .base.generator_base import GeneratorBase  # noqa: F401
-from .base.dump_info import DumpInfo  # noqa: F401
-from .base.distribute_info import DistributeInfo  # noqa: F401
-from .base.property import Property  # noqa: F401
-from .base.property_type import PropertyType  # noqa: F401
-from .base.name_converter import NameConverter, NamingConventionType  # noqa: F401
-from .base.plugin_manager import Plugin, PluginType  # noqa: F401
+from __future__ import annotations
+from importlib import import_module
+
+# Don't import typing just for TYPE_CHECKING as the CLI imports this module on every start (type checkers treat a
+# constant with this name the same way).
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .base.info import VERSION  # noqa: F401
+    from .base.orchestrator import Orchestrator  # noqa: F401
+    from .base.distributor_base import DistributorBase  # noqa: F401
+    from .base.distributor_credentials import DistributorCredentials  # noqa: F401
+    from .base.language_config_base import LanguageConfigBase  # noqa: F401
+    from .base.generator_base import GeneratorBase  # noqa: F401
+    from .base.dump_info import DumpInfo  # noqa: F401
+    from .base.distribute_info import DistributeInfo  # noqa: F401
+    from .base.property import Property  # noqa: F401
+    from .base.property_type import PropertyType  # noqa: F401
+    from .base.property_table import PropertyTable  # noqa: F401
+    from .base.transformer import Transformer  # noqa: F401
+    from .base.include_cache import IncludeCache  # noqa: F401
+    from .base.name_converter import NameConverter, NamingConventionType  # noqa: F401
+    from .base.plugin_manager import Plugin, PluginType  # noqa: F401
+
+# Public names are resolved on first access, so importing the package (e.g., by the CLI) doesn't import the whole
+# config machinery and its dependencies.
+_LAZY_IMPORTS = {
+    'VERSION': '.base.info',
+    'Orchestrator': '.base.orchestrator',
+    'DistributorBase': '.base.distributor_base',
+    'DistributorCredentials': '.base.distributor_credentials',
+    'LanguageConfigBase': '.base.language_config_base',
+    'GeneratorBase': '.base.generator_base',
+    'DumpInfo': '.base.dump_info',
+    'DistributeInfo': '.base.distribute_info',
+    'Property': '.base.property',
+    'PropertyType': '.base.property_type',
+    'PropertyTable': '.base.property_table',
+    'Transformer': '.base.transformer',
+    'IncludeCache': '.base.include_cache',
+    'NameConverter': '.base.name_converter',
+    'NamingConventionType': '.base.name_converter',
+    'Plugin': '.base.plugin_manager',
+    'PluginType': '.base.plugin_manager',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_IMPORTS.get(name)
+
+    if not module_name:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(module_name, __name__), name)
+
+    # Store the value in the module's namespace so that __getattr__ is not called again for this name.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,14 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import lru_cache, partial
+import json
+import mmap
 import os
 import re
-from typing import Dict, List, Tuple, Type
-
-import yaml
-from schema import Schema, Use, Optional, Or
+import sys
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, Type
 
 from .plugin_manager import Plugin, PluginManager, PluginType
 from .name_converter import NamingConventionType
@@ -15,6 +19,16 @@ from .language_config_naming_conventions import LanguageConfigNamingConventions
 from .distributor_base import DistributorBase
 from .distributor_credentials import DistributorCredentials
 from .meta_data_settings import MetaDataSettings
+from .transformer import Transformer
+from .include_cache import IncludeCache
+from .info import VERSION
+from .parse_cache import ParseCache
+
+# YAML and the schema library are imported only when a config actually needs to be loaded or validated (e.g., not if
+# the parse result is taken from the ParseCache).
+if TYPE_CHECKING:
+    from schema import Schema
+    from .config_validator import ConfigValidator
 
 # Main keys.
 _KEY_INCLUDES = 'includes'
@@ -33,6 +47,7 @@ _INCLUDE_KEY_PATH = 'path'
 
 # Transformer keys.
 _TRANSFORMER_KEY_TRANSFORMER = 'transformer'
+_TRANSFORMER_KEY_BATCH = 'batch'
 
 # Distributor keys.
 _DISTRIBUTOR_KEY_DISTRIBUTOR = 'distributor'
@@ -61,6 +76,18 @@ _META_KEY_TIME = 'time'
 _META_KEY_VERSION = 'version'
 _META_KEY_LINK = 'link'
 
+# Supported config file formats.
+_FORMAT_YAML = 'yaml'
+_FORMAT_JSON = 'json'
+_FORMAT_TOML = 'toml'
+
+# Version of the config schema. Increase it whenever the schema or the evaluation of the validated object changes to
+# invalidate cached parse results (see ParseCache).
+_SCHEMA_VERSION = '4'
+
+# Marks included files which have not been loaded in advance because they were already cached.
+_NOT_LOADED = object()
+
 
 class UnknownPropertyTypeException(Exception):
     def __init__(self, property_type: str):
@@ -112,6 +139,68 @@ class DistributorAliasNotFoundException(DefinitionAliasNotFoundException):
         super().__init__('distributor', alias)
 
 
+@dataclass
+class _ParsedConfig:
+    validated_object: object
+    properties: List[Property]  # Properties of the config file itself (without namespace).
+
+    def to_data(self) -> tuple:
+        """
+        Converts the parsed config into plain data which can be stored in the ParseCache.
+
+        :return: Plain data representation of the parsed config.
+        :rtype:  tuple
+        """
+        return _ParsedConfig._convert_property_types(self.validated_object, lambda type: type.value), [
+            (p.name, p.value, p.type.value, p.hidden, p.comment, p.namespace) for p in self.properties
+        ]
+
+    @staticmethod
+    def from_data(data: object) -> _ParsedConfig:
+        """
+        Restores a parsed config from the data created by to_data.
+
+        :param data: Plain data representation of the parsed config.
+        :type data:  object
+
+        :return: Parsed config or None if the data doesn't have the expected structure.
+        :rtype:  _ParsedConfig
+        """
+        try:
+            validated_object, properties = data
+            return _ParsedConfig(_ParsedConfig._convert_property_types(validated_object, PropertyType), [
+                Property._unchecked(
+                    sys.intern(name),
+                    value,
+                    PropertyType(type),
+                    hidden,
+                    comment,
+                    sys.intern(namespace) if namespace else namespace,
+                ) for name, value, type, hidden, comment, namespace in properties
+            ])
+        except (TypeError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def _convert_property_types(validated_object: object, convert: Callable[[object], object]) -> object:
+        """
+        Creates a copy of the validated object with converted property types. The validated properties contain
+        PropertyType enums (see Config._property_schema), which can't be stored as plain data.
+
+        :param validated_object: Schema validated config object.
+        :type validated_object:  object
+        :param convert:          Function to convert a property type.
+        :type convert:           Callable[[object], object]
+
+        :return: Validated object with converted property types.
+        :rtype:  object
+        """
+        return {**validated_object, _KEY_PROPERTIES: [
+            {**property, _LANGUAGE_KEY_TYPE: convert(property[_LANGUAGE_KEY_TYPE])}
+            for property in validated_object[_KEY_PROPERTIES]
+        ]}
+
+
 class Config:
     """
     Handles the config evaluation by parsing the provided YAML string via the parse-method.
@@ -122,25 +211,41 @@ class Config:
         path: str,
         distributor_credentials: List[DistributorCredentials]=None,
         plugins: List[Plugin]=None,
+        include_cache: IncludeCache=None,
+        include_workers: int=None,
     ) -> List[LanguageConfigBase]:
         """
-        Reads the provided YAML configuration file and generates a list of language configurations.
+        Reads the provided configuration file and generates a list of language configurations.
 
-        :param path:                    Path to load the YAML file from (see example/test-config.yaml for configuration
-                                        details).
+        :param path:                    Path to load the config file from (see example/test-config.yaml for
+                                        configuration details). Files ending with .json or .toml are read as JSON or
+                                        TOML, all other files are read as YAML.
         :type path:                     str
         :param distributor_credentials: Credentials for distributors, defaults to None
         :type distributor_credentials:  List[DistributorCredentials], optional
         :param plugins:                 Caller-provided plugins (overwrite loaded plugins), defaults to None
         :type plugins:                  List[Plugin], optional
+        :param include_cache:           Cache for included files. Pass the same cache to several read/parse calls to
+                                        read shared includes only once, defaults to None
+        :type include_cache:            IncludeCache, optional
+        :param include_workers:         Maximum number of threads to load included files with. If 1, included
+                                        files are loaded one after another, defaults to None (see
+                                        ThreadPoolExecutor for the default number of threads)
+        :type include_workers:          int, optional
+
+        :raises ValueError: Raised if include_workers is less than 1.
 
         :return: Language configurations which further can be dumped as config files.
         :rtype:  List[LanguageConfigBase]
         """
+        Config._check_include_workers(include_workers)
+
         return Config._read(
             path,
             distributor_credentials=distributor_credentials,
-            plugins=plugins
+            plugins=plugins,
+            include_cache=include_cache,
+            include_workers=include_workers,
         )[0]
 
     @staticmethod
@@ -149,6 +254,9 @@ class Config:
         config_name: str,
         distributor_credentials: List[DistributorCredentials]=None,
         plugins: List[Plugin]=None,
+        include_cache: IncludeCache=None,
+        include_workers: int=None,
+        trusted: bool=False,
     ) -> List[LanguageConfigBase]:
         """
         Parses the provided YAML configuration string and returns the corresponding language configurations.
@@ -163,17 +271,48 @@ class Config:
         :type distributor_credentials:  List[DistributorCredentials], optional
         :param plugins:                 Caller-provided plugins (overwrite loaded plugins), defaults to None
         :type plugins:                  List[Plugin], optional
+        :param include_cache:           Cache for included files. Pass the same cache to several read/parse calls to
+                                        read shared includes only once, defaults to None
+        :type include_cache:            IncludeCache, optional
+        :param include_workers:         Maximum number of threads to load included files with. If 1, included
+                                        files are loaded one after another, defaults to None (see
+                                        ThreadPoolExecutor for the default number of threads)
+        :type include_workers:          int, optional
+        :param trusted:                 If True and content is an already parsed object, it's expected to match the
+                                        config schema (e.g., because it has been validated before) and the structure
+                                        and property name checks are skipped. Only the values get converted, defaults
+                                        to False
+        :type trusted:                  bool, optional
+
+        :raises ValueError: Raised if include_workers is less than 1.
 
         :return: Language configurations which further can be dumped as config files.
         :rtype:  List[LanguageConfigBase]
         """
+        Config._check_include_workers(include_workers)
+
         return Config._parse(
-            content,
+            content if isinstance(content, str) else Config._load(content, trusted=trusted),
             config_name,
             distributor_credentials=distributor_credentials,
-            plugins=plugins
+            plugins=plugins,
+            include_cache=include_cache,
+            include_workers=include_workers,
         )[0]
 
+    @staticmethod
+    def _check_include_workers(include_workers: int) -> None:
+        """
+        Makes sure that the number of include workers can be used for a thread pool.
+
+        :param include_workers: Maximum number of threads to load included files with.
+        :type include_workers:  int
+
+        :raises ValueError: Raised if include_workers is less than 1.
+        """
+        if include_workers is not None and include_workers < 1:
+            raise ValueError(f'include_workers must be at least 1 but is {include_workers}')
+
     @staticmethod
     def _read(
         path: str,
@@ -181,12 +320,15 @@ class Config:
         namespaces: List[str]=None,
         distributor_credentials: List[DistributorCredentials]=None,
         plugins: List[Plugin]=None,
-    ) -> List[LanguageConfigBase]:
+        include_cache: IncludeCache=None,
+        include_workers: int=None,
+    ) -> Tuple[List[LanguageConfigBase], List[Property]]:
         """
-        Reads the provided YAML configuration file and generates a list of language configurations.
+        Reads the provided configuration file and generates a list of language configurations.
 
-        :param path:                    Path to load the YAML file from (see example/test-config.yaml for configuration
-                                        details).
+        :param path:                    Path to load the config file from (see example/test-config.yaml for
+                                        configuration details). Files ending with .json or .toml are read as JSON or
+                                        TOML, all other files are read as YAML.
         :type path:                     str
         :param namespace:               Specifies a namespace for the config. If None or empty, no namespace will
                                         be set.
@@ -197,23 +339,328 @@ class Config:
         :type distributor_credentials:  List[DistributorCredentials], optional
         :param plugins:                 Caller-provided plugins (overwrite loaded plugins), defaults to None
         :type plugins:                  List[Plugin], optional
+        :param include_cache:           Cache for included files, defaults to None
+        :type include_cache:            IncludeCache, optional
+        :param include_workers:         Maximum number of threads to load included files with, defaults to None
+        :type include_workers:          int, optional
 
         :return: Language configurations which further can be dumped as config files.
         :rtype:  List[LanguageConfigBase]
         """
-        with open(path, 'r') as f:
-            content = f.read()
-
         return Config._parse(
-            content,
+            Config._load_file(path),
             path,
             namespace,
             os.path.dirname(path),
             namespaces,
             distributor_credentials,
             plugins,
+            include_cache,
+            include_workers,
         )
 
+    @staticmethod
+    def _load_include(path: str, include_cache: IncludeCache) -> Tuple[Tuple, object]:
+        """
+        Loads an included config file. This method is called concurrently for all includes of a config file, so it
+        must not touch any shared state except the (thread-safe) include cache.
+
+        :param path:          Path of the included file.
+        :type path:           str
+        :param include_cache: Cache for included files.
+        :type include_cache:  IncludeCache
+
+        :return: Tuple of the include cache key and the parsed config (_NOT_LOADED if the file is already cached).
+        :rtype:  Tuple[Tuple, _ParsedConfig]
+        """
+        key = IncludeCache.key(path)
+
+        if key in include_cache:
+            return key, _NOT_LOADED
+        return key, Config._load_file(path)
+
+    @staticmethod
+    def _load_file(path: str) -> _ParsedConfig:
+        """
+        Loads and validates a config file. YAML files are memory-mapped instead of being read into a string, so the
+        loader can stream them (see Config._load_content).
+
+        :param path: Config file path.
+        :type path:  str
+
+        :return: Parsed config.
+        :rtype:  _ParsedConfig
+        """
+        format = Config._format(path)
+
+        if format != _FORMAT_YAML:
+            with open(path, 'r') as f:
+                return Config._load(f.read(), format)
+
+        with open(path, 'rb') as f:
+            # Empty files can't be mapped.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else (
+                nullcontext(b'')
+            ) as content:
+                return Config._load(content, format)
+
+    @staticmethod
+    def _format(path: str) -> str:
+        """
+        Evaluates the config format based on the file extension. Files with unknown extensions are treated as YAML.
+
+        :param path: Config file path.
+        :type path:  str
+
+        :return: Config format (yaml | json | toml).
+        :rtype:  str
+        """
+        extension = os.path.splitext(path)[1].lower()
+
+        if extension == '.json':
+            format = _FORMAT_JSON
+        elif extension == '.toml':
+            format = _FORMAT_TOML
+        else:
+            format = _FORMAT_YAML
+        return format
+
+    @staticmethod
+    def _load_content(
+        content: str | bytes,
+        consume_property: Callable[[int, object], None],
+        format: str=_FORMAT_YAML,
+    ) -> object:
+        """
+        Loads a config string into an object which can be validated against the config schema.
+
+        :param content:          Config string (or bytes for YAML, e.g., a memory-mapped file).
+        :type content:           str | bytes
+        :param consume_property: YAML property items are passed to this function one by one (with their index) while
+                                 the file is loaded and the properties list of the loaded object stays empty. Other
+                                 formats always load the properties as part of the object.
+        :type consume_property:  Callable[[int, object], None]
+        :param format:           Config format (yaml | json | toml), defaults to yaml
+        :type format:            str, optional
+
+        :return: Loaded config object.
+        :rtype:  object
+        """
+        if format == _FORMAT_JSON:
+            loaded_object = json.loads(content)
+        elif format == _FORMAT_TOML:
+            try:
+                import tomllib
+            except ModuleNotFoundError:  # tomllib is only available since Python 3.11.
+                import tomli as tomllib
+            loaded_object = tomllib.loads(content)
+        else:
+            from .streaming_yaml_loader import StreamingYamlLoader
+            loaded_object = StreamingYamlLoader.load(content, _KEY_PROPERTIES, consume_property)
+        return loaded_object
+
+    @staticmethod
+    def _load(content: str | bytes | object, format: str=_FORMAT_YAML, trusted: bool=False) -> _ParsedConfig:
+        """
+        Loads and validates a config. If the on-disk parse cache is enabled, string contents are looked up in the cache
+        first to skip the loading and the validation for unchanged files. The properties of YAML contents are
+        validated and evaluated while the content is loaded, so only one property item exists as YAML node and
+        validated object at a time.
+
+        :param content: Config string (or bytes, e.g., a memory-mapped file) or an already loaded object.
+        :type content:  str | bytes | object
+        :param format:  Config format of string contents (yaml | json | toml), defaults to yaml
+        :type format:   str, optional
+        :param trusted: If True, the loaded object is expected to match the config schema and only its values get
+                        converted (see ConfigValidator.validate), defaults to False
+        :type trusted:  bool, optional
+
+        :return: Parsed config.
+        :rtype:  _ParsedConfig
+        """
+        if isinstance(content, _ParsedConfig):
+            return content
+        raw = isinstance(content, (str, bytes, mmap.mmap))
+        key = ParseCache.key(VERSION, _SCHEMA_VERSION, format, content) if raw and ParseCache.enabled() else None
+        parsed = _ParsedConfig.from_data(ParseCache.get(key)) if key else None
+
+        if not parsed:
+            from .config_validator import ConfigValidationException
+            properties: List[Property] = []
+
+            def consume_property(index: int, property: object) -> None:
+                try:
+                    validated_property = Config._property_validator().validate(property, trusted)
+                except ConfigValidationException as e:
+                    raise e.prepend(index).prepend(_KEY_PROPERTIES) from None
+                property = Config._evaluate_property(validated_property, trusted)
+
+                if property:
+                    properties.append(property)
+
+            loaded_object = Config._load_content(content, consume_property, format) if raw else content
+            validated_object = Config._validator().validate(loaded_object, trusted)
+
+            # Streamed properties have already been evaluated, all others are still part of the validated object.
+            properties.extend(Config._evaluate_properties(validated_object, trusted))
+            parsed = _ParsedConfig(validated_object, properties)
+
+            if key:
+                ParseCache.put(key, parsed.to_data())
+        return parsed
+
+    @staticmethod
+    def _include(
+        path: str,
+        namespace: str,
+        namespaces: List[str],
+        include_cache: IncludeCache,
+        loaded: Tuple[Tuple, object],
+        include_workers: int=None,
+        executor: ThreadPoolExecutor=None,
+    ) -> List[Property]:
+        """
+        Evaluates the properties of an included config file. If the file has already been included before, the cached
+        properties are used instead of parsing it again.
+
+        :param path:            Path of the included file.
+        :type path:             str
+        :param namespace:       Namespace (include alias) of the included file.
+        :type namespace:        str
+        :param namespaces:      List of namespaces.
+        :type namespaces:       List[str]
+        :param include_cache:   Cache for included files.
+        :type include_cache:    IncludeCache
+        :param loaded:          Result of Config._load_include for the included file.
+        :type loaded:           Tuple[Tuple, _ParsedConfig]
+        :param include_workers: Maximum number of threads to load nested includes with, defaults to None
+        :type include_workers:  int, optional
+        :param executor:        Thread pool to load nested includes with, defaults to None
+        :type executor:         ThreadPoolExecutor, optional
+
+        :raises AliasAlreadyInUseException: Raised if a nested include uses an already defined alias.
+
+        :return: Properties of the included file (including the properties of nested includes).
+        :rtype:  List[Property]
+        """
+        key, parsed = loaded
+        cached = include_cache.get(key, namespace)
+
+        if cached:
+            properties, aliases = cached
+
+            # Register the aliases of the nested includes as if the file had been read again.
+            for alias in aliases:
+                if alias in namespaces:
+                    raise AliasAlreadyInUseException(alias)
+                namespaces.append(alias)
+        else:
+            # The cache might have been cleared in the meantime.
+            if parsed is _NOT_LOADED:
+                key, parsed = Config._load_include(path, IncludeCache())
+
+            namespaces_count = len(namespaces)
+            properties = Config._parse(
+                parsed,
+                path,
+                namespace,
+                os.path.dirname(path),
+                namespaces,
+                include_cache=include_cache,
+                include_workers=include_workers,
+                executor=executor,
+            )[1]
+
+            include_cache.add(key, namespace, properties, namespaces[namespaces_count:])
+            properties, _ = include_cache.get(key, namespace)
+        return properties
+
+    @staticmethod
+    def _evaluate_includes(
+        validated_object: object,
+        directory: str,
+        namespaces: List[str],
+        include_cache: IncludeCache,
+        include_workers: int=None,
+        executor: ThreadPoolExecutor=None,
+    ) -> List[Property]:
+        """
+        Evaluates the included config files. The files are loaded concurrently but their properties are merged one
+        after another in the order of the includes.
+
+        :param validated_object: Schema validated config object.
+        :type validated_object:  object
+        :param directory:        Directory to resolve relative include paths against.
+        :type directory:         str
+        :param namespaces:       List of namespaces.
+        :type namespaces:        List[str]
+        :param include_cache:    Cache for included files.
+        :type include_cache:     IncludeCache
+        :param include_workers:  Maximum number of threads to load included files with. If 1, included files are
+                                 loaded one after another, defaults to None
+        :type include_workers:   int, optional
+        :param executor:         Thread pool of the including config, defaults to None
+        :type executor:          ThreadPoolExecutor, optional
+
+        :raises AliasAlreadyInUseException: Raised if an included config file uses an already defined alias.
+
+        :return: Properties of all included files.
+        :rtype:  List[Property]
+        """
+        inclusions: List[Tuple[str, str]] = []
+        properties: List[Property] = []
+
+        for inclusion in validated_object[_KEY_INCLUDES] if _KEY_INCLUDES in validated_object else []:
+            ignore = inclusion[_KEY_IGNORE] if _KEY_IGNORE in inclusion else False
+
+            # If inclusion shall not be ignored, include it.
+            if not ignore:
+                inclusion_path = inclusion[_INCLUDE_KEY_PATH]
+
+                # If the provided path is relative, incorporate the provided directory into the path.
+                if not os.path.isabs(inclusion_path):
+                    inclusion_path = os.path.join(directory, inclusion_path)
+                inclusions.append((inclusion[_KEY_AS], inclusion_path))
+
+        # Only the top-level config creates the thread pool, nested includes re-use it.
+        parallel = len(inclusions) > 0 and include_workers != 1
+        owns_executor = parallel and not executor
+
+        with ThreadPoolExecutor(include_workers) if owns_executor else nullcontext(executor) as executor:
+            # Start loading all includes right away. The results are picked up in order, so errors are raised as if
+            # the includes were loaded one after another.
+            if parallel:
+                loaders = [
+                    executor.submit(Config._load_include, inclusion_path, include_cache).result
+                    for _, inclusion_path in inclusions
+                ]
+            else:
+                loaders = [
+                    partial(Config._load_include, inclusion_path, include_cache) for _, inclusion_path in inclusions
+                ]
+
+            for (inclusion_namespace, inclusion_path), load in zip(inclusions, loaders):
+                # Make sure that a included config file does not re-define an alias.
+                if inclusion_namespace in namespaces:
+                    raise AliasAlreadyInUseException(inclusion_namespace)
+                else:
+                    namespaces.append(inclusion_namespace)
+
+                # Read included config and put properties into property list.
+                for inclusion_property in Config._include(
+                    inclusion_path,
+                    inclusion_namespace,
+                    namespaces,
+                    include_cache,
+                    load(),
+                    include_workers,
+                    executor,
+                ):
+                    inclusion_property.hidden = True  # Included properties are not being exported by default.
+                    properties.append(inclusion_property)
+
+        return properties
+
     @staticmethod
     def _parse(
         content: str | object,
@@ -223,6 +670,9 @@ class Config:
         namespaces: List[str]=None,
         distributor_credentials: List[DistributorCredentials]=None,
         plugins: List[Plugin]=None,
+        include_cache: IncludeCache=None,
+        include_workers: int=None,
+        executor: ThreadPoolExecutor=None,
     ) -> Tuple[List[LanguageConfigBase], List[Property]]:
         """
         Parses the provided YAML configuration string and returns the corresponding language configurations.
@@ -241,6 +691,15 @@ class Config:
         :type distributor_credentials:  List[DistributorCredentials], optional
         :param plugins:                 Caller-provided plugins (overwrite loaded plugins), defaults to None
         :type plugins:                  List[Plugin], optional
+        :param include_cache:           Cache for included files. If None, a new cache is used for the include
+                                        tree, defaults to None
+        :type include_cache:            IncludeCache, optional
+        :param include_workers:         Maximum number of threads to load included files with. If 1, included
+                                        files are loaded one after another, defaults to None
+        :type include_workers:          int, optional
+        :param executor:                Thread pool to load included files with. If None, a new thread pool is
+                                        created for the include tree, defaults to None
+        :type executor:                 ThreadPoolExecutor, optional
 
         :raises AliasAlreadyInUseException: Raised if an included config file uses an already defined alias.
 
@@ -248,14 +707,12 @@ class Config:
         :rtype:  List[LanguageConfigBase]
         """
         plugin_manager = PluginManager(plugins)
-        yaml_object = yaml.safe_load(content) if isinstance(content, str) else content
-        validated_object = Config._schema().validate(yaml_object)
+        parsed = Config._load(content)
+        validated_object = parsed.validated_object
         language_configs: List[LanguageConfigBase] = []
         properties: List[Property] = []
-        language_config_plugins = plugin_manager.get_language_config_plugins()
         transformers = Config._evaluate_transformers(validated_object)
-        distributor_plugins = plugin_manager.get_distributor_plugins()
-        distributors = Config._evaluate_distributors(validated_object, distributor_plugins, distributor_credentials)
+        distributors = Config._evaluate_distributors(validated_object, plugin_manager, distributor_credentials)
         meta_data_settings = Config._evaluate_meta_data_settings(validated_object)
 
         # Since a default list cannot be assigned to parameters in the method header, because it only gets initialized
@@ -267,47 +724,21 @@ class Config:
             distributor_credentials = []
         if not plugins:
             plugins = []
+        if not include_cache:
+            include_cache = IncludeCache()
 
         # Evaluate included files and their properties.
-        if _KEY_INCLUDES in validated_object:
-            for inclusion in validated_object[_KEY_INCLUDES]:
-                ignore = inclusion[_KEY_IGNORE] if _KEY_IGNORE in inclusion else False
-
-                # If inclusion shall not be ignored, include it.
-                if not ignore:
-                    inclusion_namespace = inclusion[_KEY_AS]
-
-                    # Make sure that a included config file does not re-define an alias.
-                    if inclusion_namespace in namespaces:
-                        raise AliasAlreadyInUseException(inclusion_namespace)
-                    else:
-                        namespaces.append(inclusion_namespace)
-                    inclusion_path = inclusion[_INCLUDE_KEY_PATH]
-
-                    # If the provided path is relative, incorporate the provided directory into the path.
-                    if not os.path.isabs(inclusion_path):
-                        inclusion_path = os.path.join(directory, inclusion_path)
-
-                    # Read included config and put properties into property list.
-                    for inclusion_property in Config._read(inclusion_path, inclusion_namespace, namespaces)[1]:
-                        inclusion_property.hidden = True  # Included properties are not being exported by default.
-                        properties.append(inclusion_property)
-                
+        properties.extend(Config._evaluate_includes(
+            validated_object,
+            directory,
+            namespaces,
+            include_cache,
+            include_workers,
+            executor,
+        ))
 
         # Collect properties as they are the same for all languages.
-        for property in validated_object[_KEY_PROPERTIES]:
-            ignore = property[_KEY_IGNORE] if _KEY_IGNORE in property else False
-
-            # If property shall not be ignored, include it.
-            if not ignore:
-                properties.append(Property(
-                    name=property[_LANGUAGE_KEY_NAME],
-                    value=property[_PROPERTY_KEY_VALUE],
-                    property_type=property[_LANGUAGE_KEY_TYPE],
-                    hidden=property[_PROPERTY_KEY_HIDDEN] if _PROPERTY_KEY_HIDDEN in property else None,
-                    comment=property[_PROPERTY_KEY_COMMENT] if _PROPERTY_KEY_COMMENT in property else None,
-                    namespace=namespace,
-                ))
+        properties.extend(Config._namespace_properties(parsed.properties, namespace))
 
         # Evaluate each language setting one by one.
         if _KEY_LANGUAGES in validated_object:
@@ -336,7 +767,7 @@ class Config:
                     naming_conventions.type_naming_convention = Config._evaluate_naming_convention_type(
                         language[_LANGUAGE_KEY_TYPE_NAMING] if _LANGUAGE_KEY_TYPE_NAMING in language else None
                     )
-                    config_type = Config._evaluate_language_config(language_config_plugins, language_name)
+                    config_type = Config._evaluate_language_config(plugin_manager, language_name)
 
                     language_configs.append(config_type(
                         input_path,
@@ -355,13 +786,116 @@ class Config:
         return language_configs, properties
     
     @staticmethod
+    def _evaluate_properties(validated_object: object, trusted: bool=False) -> List[Property]:
+        """
+        Evaluates the properties of a config. The properties don't get a namespace assigned yet, as it depends on
+        how the config is used (see _namespace_properties).
+
+        :param validated_object: Schema validated config object.
+        :type validated_object:  object
+        :param trusted:          If True, the property names are not checked again, defaults to False
+        :type trusted:           bool, optional
+
+        :return: List of properties.
+        :rtype:  List[Property]
+        """
+        properties: List[Property] = []
+
+        for property in validated_object[_KEY_PROPERTIES]:
+            property = Config._evaluate_property(property, trusted)
+
+            if property:
+                properties.append(property)
+        return properties
+
+    @staticmethod
+    def _evaluate_property(validated_property: object, trusted: bool=False) -> Property:
+        """
+        Evaluates a single property of a config (without namespace).
+
+        :param validated_property: Schema validated property object.
+        :type validated_property:  object
+        :param trusted:            If True, the property name is not checked again, defaults to False
+        :type trusted:             bool, optional
+
+        :return: Property or None if the property shall be ignored.
+        :rtype:  Property
+        """
+        ignore = validated_property[_KEY_IGNORE] if _KEY_IGNORE in validated_property else False
+
+        # If property shall be ignored, skip it.
+        if ignore:
+            return None
+        return Property(
+            name=validated_property[_LANGUAGE_KEY_NAME],
+            value=validated_property[_PROPERTY_KEY_VALUE],
+            property_type=validated_property[_LANGUAGE_KEY_TYPE],
+            hidden=validated_property[_PROPERTY_KEY_HIDDEN] if _PROPERTY_KEY_HIDDEN in validated_property else None,
+            comment=validated_property[_PROPERTY_KEY_COMMENT] if _PROPERTY_KEY_COMMENT in validated_property else None,
+            trusted=trusted,
+        )
+
+    @staticmethod
+    def _namespace_properties(properties: List[Property], namespace: str) -> List[Property]:
+        """
+        Creates copies of the provided properties with the namespace assigned.
+
+        :param properties: Properties evaluated by _evaluate_properties.
+        :type properties:  List[Property]
+        :param namespace:  Namespace to assign.
+        :type namespace:   str
+
+        :raises InvalidNamespaceException: Raised if an invalid namespace has been provided.
+
+        :return: List of property copies.
+        :rtype:  List[Property]
+        """
+        namespaced_properties = []
+
+        if properties:
+            Property._validate_namespace(namespace)
+            namespace = sys.intern(namespace) if namespace else namespace
+
+        for property in properties:
+            property = property._copy()
+            property.namespace = namespace
+            namespaced_properties.append(property)
+        return namespaced_properties
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _validator() -> ConfigValidator:
+        """
+        Returns the compiled config validator. It only gets compiled once.
+
+        :return: Config validator.
+        :rtype:  ConfigValidator
+        """
+        from .config_validator import ConfigValidator
+        return ConfigValidator(Config._schema())
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _property_validator() -> ConfigValidator:
+        """
+        Returns the compiled validator for single property items (used to validate streamed properties).
+
+        :return: Property validator.
+        :rtype:  ConfigValidator
+        """
+        from .config_validator import ConfigValidator
+        return ConfigValidator(Config._property_schema())
+
+    @staticmethod
+    @lru_cache(maxsize=None)
     def _schema() -> Schema:
         """
-        Returns the config validation schema.
+        Returns the config validation schema. It only gets built once.
 
         :return: Config validation schema.
         :rtype:  Schema
         """
+        from schema import Schema, Optional
         return Schema({
             Optional(_KEY_INCLUDES): [{
                 _INCLUDE_KEY_PATH: str,
@@ -371,6 +905,7 @@ class Config:
             Optional(_KEY_TRANSFORMERS): [{
                 _TRANSFORMER_KEY_TRANSFORMER: str,
                 _KEY_AS: str,
+                Optional(_TRANSFORMER_KEY_BATCH): bool,
                 Optional(_KEY_IGNORE): bool,
             }],
             Optional(_KEY_DISTRIBUTORS): [{
@@ -388,14 +923,7 @@ class Config:
                 Optional(_KEY_IGNORE): bool,
                 Optional(object): object  # Collect other properties.
             }],
-            _KEY_PROPERTIES: [{
-                _LANGUAGE_KEY_TYPE: Use(Config._evaluate_data_type),
-                _LANGUAGE_KEY_NAME: str,
-                _PROPERTY_KEY_VALUE: Or(str, bool, int, float),
-                Optional(_PROPERTY_KEY_HIDDEN): bool,
-                Optional(_PROPERTY_KEY_COMMENT): str,
-                Optional(_KEY_IGNORE): bool,
-            }],
+            _KEY_PROPERTIES: [Config._property_schema()],
             Optional(_KEY_META): {
                 Optional(_META_KEY_USER): bool,
                 Optional(_META_KEY_DATE): bool,
@@ -405,6 +933,25 @@ class Config:
             },
         })
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _property_schema() -> Dict:
+        """
+        Returns the validation schema of a single property item. It only gets built once.
+
+        :return: Property validation schema.
+        :rtype:  Dict
+        """
+        from schema import Use, Optional, Or
+        return {
+            _LANGUAGE_KEY_TYPE: Use(Config._evaluate_data_type),
+            _LANGUAGE_KEY_NAME: str,
+            _PROPERTY_KEY_VALUE: Or(str, bool, int, float),
+            Optional(_PROPERTY_KEY_HIDDEN): bool,
+            Optional(_PROPERTY_KEY_COMMENT): str,
+            Optional(_KEY_IGNORE): bool,
+        }
+
     @staticmethod
     def _plugin_names(prefix: str, plugin_name: str) -> List[str]:
         NINJA_BEAR_PLUGIN_PREFIX = 'ninja-bear-'
@@ -457,14 +1004,14 @@ class Config:
         return meta_data_settings
 
     @staticmethod
-    def _evaluate_language_config(language_plugins: List[Plugin], language_name: str) -> Type[LanguageConfigBase]:
+    def _evaluate_language_config(plugin_manager: PluginManager, language_name: str) -> Type[LanguageConfigBase]:
         """
-        Evaluates the corresponding language config from a language plugin list for the given language name.
+        Evaluates the corresponding language config from the available plugins for the given language name.
 
-        :param language_plugins: List of language plugins to search in.
-        :type language_plugins:  List[Plugin]
-        :param language_name:    Language name to look for.
-        :type language_name:     str
+        :param plugin_manager: Plugin manager to search in.
+        :type plugin_manager:  PluginManager
+        :param language_name:  Language name to look for.
+        :type language_name:   str
 
         :raises SeveralLanguagePluginsException: Raised if several plugins were found for the requested language.
         :raises NoLanguagePluginException:       Raised if an unsupported language was used in the config.
@@ -472,24 +1019,15 @@ class Config:
         :return: The corresponding language config class.
         :rtype:  Type[LanguageConfigBase]
         """
-        language_config_type = None
-
-        # Make sure only language configs get processed.
-        language_plugins = [p for p in language_plugins if p.get_type() == PluginType.LANGUAGE_CONFIG]
-
         # Create possible language names.
         language_names = Config._plugin_names('language', language_name)
+        language_plugins = plugin_manager.find_plugins(PluginType.LANGUAGE_CONFIG, language_names)
 
-        for plugin in language_plugins:
-            if plugin.get_name() in language_names:
-                if not language_config_type:
-                    language_config_type = plugin.get_class_type()
-                else:
-                    raise SeveralLanguagePluginsException(language_name)
-
-        if not language_config_type:
+        if len(language_plugins) > 1:
+            raise SeveralLanguagePluginsException(language_name)
+        if not language_plugins:
             raise NoLanguagePluginException(language_names)
-        return language_config_type
+        return language_plugins[0].get_class_type()
 
     
     @staticmethod
@@ -512,15 +1050,15 @@ class Config:
         return type
     
     @staticmethod
-    def _evaluate_transformers(validated_object: object) -> Dict[str, DistributorBase]:
+    def _evaluate_transformers(validated_object: object) -> Dict[str, Transformer]:
         """
         Evaluates specified transformers.
 
         :param validated_object: Schema validated config object.
         :type validated_object:  object
 
-        :return: Dictionary of defined transformer-scripts where the key is the alias.
-        :rtype:  Dict[str, str]
+        :return: Dictionary of defined transformers where the key is the alias.
+        :rtype:  Dict[str, Transformer]
         """
         transformers = {}
 
@@ -536,9 +1074,10 @@ class Config:
                         return transformer_config[key] if key in transformer_config else None
 
                     transformer_script = from_config(_TRANSFORMER_KEY_TRANSFORMER)
+                    batch = from_config(_TRANSFORMER_KEY_BATCH)
                     alias = from_config(_KEY_AS)
 
-                    transformers[alias] = transformer_script
+                    transformers[alias] = Transformer(transformer_script, batch=bool(batch))
 
         return transformers
     
@@ -586,18 +1125,18 @@ class Config:
     @staticmethod
     def _evaluate_language_transformers(
         language_config: Dict[str, any],
-        transformers: Dict[str, str]
-    ) -> List[str]:
+        transformers: Dict[str, Transformer]
+    ) -> List[Transformer]:
         """
         Evaluates specified transformers of a language.
 
         :param language_config: Language config object.
         :type language_config:  Dict[str, any]
-        :param distributors:    Dictionary of defined transformer scripts where the key is the alias.
-        :type distributors:     Dict[str, str], optional
+        :param distributors:    Dictionary of defined transformers where the key is the alias.
+        :type distributors:     Dict[str, Transformer], optional
 
-        :return: List of evaluated transformer scripts for the given language.
-        :rtype:  List[str]
+        :return: List of evaluated transformers for the given language.
+        :rtype:  List[Transformer]
         """
         return Config._evaluate_language_referenced_definitions(
             language_config,
@@ -609,7 +1148,7 @@ class Config:
     @staticmethod
     def _evaluate_distributors(
         validated_object: object,
-        distributor_plugins: List[Plugin]=None,
+        plugin_manager: PluginManager=None,
         distributor_credentials: List[DistributorCredentials]=None
     ) -> Dict[str, DistributorBase]:
         """
@@ -617,8 +1156,9 @@ class Config:
 
         :param validated_object:        Schema validated config object.
         :type validated_object:         object
-        :param distributor_plugins:     List of all discovered distributor plugins, defaults to None
-        :type distributor_plugins:      List[Plugin], optional
+        :param plugin_manager:          Plugin manager to search the distributors in, defaults to None (installed
+                                        plugins only)
+        :type plugin_manager:           PluginManager, optional
         :param distributor_credentials: Potentially required credentials, defaults to None
         :type distributor_credentials:  List[DistributorCredential], optional
 
@@ -635,14 +1175,11 @@ class Config:
             # initialized once and then the list gets re-used (see https://stackoverflow.com/a/1145781), make
             # sure to set undefined variables to list (see also
             # https://docs.python.org/3/reference/compound_stmts.html#function-definitions).
-            if not distributor_plugins:
-                distributor_plugins = []
+            if not plugin_manager:
+                plugin_manager = PluginManager()
             if not distributor_credentials:
                 distributor_credentials = []
 
-            # Make sure only language configs get processed.
-            distributor_plugins = [p for p in distributor_plugins if p.get_type() == PluginType.DISTRIBUTOR]
-
             # Map credential list to dictionary based on the credential alias for easer access.
             for distributor_credential in distributor_credentials:
                 credentials_map[distributor_credential.distributor_alias] = distributor_credential
@@ -661,8 +1198,8 @@ class Config:
                     distributor_names = Config._plugin_names('distributor', distributor_name)
 
                     found_distributors_classes = [
-                        plugin.get_class_type() for plugin in distributor_plugins if
-                        plugin.get_name() in distributor_names
+                        plugin.get_class_type() for plugin in
+                        plugin_manager.find_plugins(PluginType.DISTRIBUTOR, distributor_names)
                     ]
                     alias = from_config(_KEY_AS)
                     length = len(found_distributors_classes)
@@ -725,4 +1262,8 @@ class Config:
                 naming_convention = NamingConventionType.PASCAL_CASE
             elif naming_convention == 'kebap':
                 naming_convention = NamingConventionType.KEBAP_CASE
+            elif naming_convention == 'dot':
+                naming_convention = NamingConventionType.DOT_CASE
+            elif naming_convention == 'train':
+                naming_convention = NamingConventionType.TRAIN_CASE
         return naming_convention
@@ -0,0 +1,266 @@
+from __future__ import annotations
+from typing import Callable, Dict, List, Tuple
+
+from schema import Optional, Or, Schema, SchemaError, Use
+
+_Validator = Callable[[any], any]
+
+
+class ConfigValidationException(SchemaError):
+    def __init__(self, reason: str, path: Tuple[str | int, ...]=()):
+        location = ''.join(
+            f'[{segment}]' if isinstance(segment, int) else (f'.{segment}' if i > 0 else str(segment))
+            for i, segment in enumerate(path)
+        )
+        self.reason = reason
+        self.path = path
+
+        super().__init__(f'{location}: {reason}' if location else reason)
+
+    def prepend(self, segment: str | int) -> ConfigValidationException:
+        """
+        Creates a new exception with the provided segment put in front of the path.
+
+        :param segment: Dictionary key or list index.
+        :type segment:  str | int
+
+        :return: New exception instance.
+        :rtype:  ConfigValidationException
+        """
+        return ConfigValidationException(self.reason, (segment, *self.path))
+
+
+class ConfigValidator:
+    """
+    Compiles a Schema into nested validation functions which are specialized for the schema's structure (e.g., a
+    dictionary schema becomes a key lookup instead of trying to match each key against every schema key). The
+    validation result is the same as of Schema.validate, but errors name the path of the failing key
+    (e.g., properties[2].value). Schema parts which can't be compiled are validated by the schema library.
+    """
+
+    def __init__(self, schema: Schema):
+        """
+        Constructor
+
+        :param schema: Schema to compile.
+        :type schema:  Schema
+        """
+        self._validate, self._convert = ConfigValidator._compile(schema)
+
+    def validate(self, data: any, trusted: bool=False) -> any:
+        """
+        Validates the provided data.
+
+        :param data:    Data to validate.
+        :type data:     any
+        :param trusted: If True, the data is expected to match the schema and only the value conversions (Use) get
+                        applied, defaults to False
+        :type trusted:  bool, optional
+
+        :raises ConfigValidationException: Raised if the data does not match the schema.
+
+        :return: Validated data.
+        :rtype:  any
+        """
+        if not trusted:
+            return self._validate(data)
+        return self._convert(data) if self._convert else data
+
+    @staticmethod
+    def _compile(schema: any) -> Tuple[_Validator, _Validator]:
+        """
+        Compiles a schema part.
+
+        :param schema: Schema part to compile.
+        :type schema:  any
+
+        :return: Tuple of the validation function and the conversion function (None if the schema part doesn't
+                 convert any values).
+        :rtype:  Tuple[_Validator, _Validator]
+        """
+        schema_type = type(schema)
+
+        # Unwrap plain schemas.
+        if schema_type is Schema and not schema._error and not schema._ignore_extra_keys and not schema._name:
+            return ConfigValidator._compile(schema.schema)
+
+        if schema is object:
+            compiled = ConfigValidator._compile_any()
+        elif schema_type is type:
+            compiled = ConfigValidator._compile_type((schema,))
+        elif schema_type in [str, int, float, bool]:
+            compiled = ConfigValidator._compile_literal(schema)
+        elif schema_type is list and len(schema) == 1:
+            compiled = ConfigValidator._compile_list(schema[0])
+        elif schema_type is dict:
+            compiled = ConfigValidator._compile_dict(schema)
+        elif schema_type is Or and not schema.only_one and not schema._error:
+            compiled = ConfigValidator._compile_or(schema.args)
+        elif schema_type is Use and not schema._error:
+            compiled = ConfigValidator._compile_use(schema._callable)
+        else:
+            compiled = None
+
+        return compiled if compiled else ConfigValidator._compile_fallback(schema)
+
+    @staticmethod
+    def _compile_any() -> Tuple[_Validator, _Validator]:
+        return (lambda data: data), None
+
+    @staticmethod
+    def _compile_type(types: Tuple[type, ...]) -> Tuple[_Validator, _Validator]:
+        # Like the schema library, don't accept booleans as integers.
+        exclude_bool = int in types and bool not in types
+        names = ' or '.join(repr(type.__name__) for type in types)
+
+        def validate(data: any) -> any:
+            if not isinstance(data, types) or (exclude_bool and isinstance(data, bool)):
+                raise ConfigValidationException(f'{data!r} should be instance of {names}')
+            return data
+        return validate, None
+
+    @staticmethod
+    def _compile_literal(literal: any) -> Tuple[_Validator, _Validator]:
+        def validate(data: any) -> any:
+            if data != literal:
+                raise ConfigValidationException(f'{literal!r} does not match {data!r}')
+            return data
+        return validate, None
+
+    @staticmethod
+    def _compile_list(item_schema: any) -> Tuple[_Validator, _Validator]:
+        validate_item, convert_item = ConfigValidator._compile(item_schema)
+
+        def validate(data: any) -> List[any]:
+            if not isinstance(data, list):
+                raise ConfigValidationException(f'{data!r} should be instance of \'list\'')
+            items = []
+
+            for i, item in enumerate(data):
+                try:
+                    items.append(validate_item(item))
+                except ConfigValidationException as e:
+                    raise e.prepend(i) from None
+            return items
+
+        def convert(data: List[any]) -> List[any]:
+            items = []
+
+            for i, item in enumerate(data):
+                try:
+                    items.append(convert_item(item))
+                except ConfigValidationException as e:
+                    raise e.prepend(i) from None
+            return items
+        return validate, convert if convert_item else None
+
+    @staticmethod
+    def _compile_dict(schema: Dict[any, any]) -> Tuple[_Validator, _Validator]:
+        fields: Dict[str, Tuple[_Validator, _Validator]] = {}
+        required = []
+        extra: Tuple[_Validator, _Validator] = None
+
+        for key, value_schema in schema.items():
+            optional = type(key) is Optional
+
+            # Only support keys without defaults.
+            if optional and hasattr(key, 'default'):
+                return None
+            key_schema = key.schema if optional else key
+
+            if type(key_schema) is str:
+                fields[key_schema] = ConfigValidator._compile(value_schema)
+
+                if not optional:
+                    required.append(key_schema)
+            elif key_schema is object and optional:
+                extra = ConfigValidator._compile(value_schema)  # Accepts all other keys.
+            else:
+                return None
+
+        validators = {key: validate for key, (validate, _) in fields.items()}
+        converters = {key: convert for key, (_, convert) in fields.items() if convert}
+        validate_extra, convert_extra = extra if extra else (None, None)
+
+        def validate(data: any) -> Dict[any, any]:
+            if not isinstance(data, dict):
+                raise ConfigValidationException(f'{data!r} should be instance of \'dict\'')
+            validated = {}
+
+            for key, value in data.items():
+                validate_value = validators.get(key, validate_extra)
+
+                if validate_value:
+                    try:
+                        validated[key] = validate_value(value)
+                    except ConfigValidationException as e:
+                        raise e.prepend(key) from None
+
+            missing_keys = [key for key in required if key not in validated]
+
+            if missing_keys:
+                raise ConfigValidationException(
+                    f'Missing key{"s" if len(missing_keys) > 1 else ""}: '
+                    f'{", ".join(repr(key) for key in sorted(missing_keys))}'
+                )
+            if len(validated) != len(data):
+                wrong_keys = [key for key in data if key not in validated]
+                raise ConfigValidationException(
+                    f'Wrong key{"s" if len(wrong_keys) > 1 else ""} {", ".join(repr(key) for key in wrong_keys)}'
+                )
+            return validated
+
+        def convert(data: Dict[any, any]) -> Dict[any, any]:
+            converted = dict(data)
+
+            for key, value in data.items():
+                convert_value = converters.get(key) if key in validators else convert_extra
+
+                if convert_value:
+                    try:
+                        converted[key] = convert_value(value)
+                    except ConfigValidationException as e:
+                        raise e.prepend(key) from None
+            return converted
+        return validate, convert if converters or convert_extra else None
+
+    @staticmethod
+    def _compile_or(schemas: Tuple[any, ...]) -> Tuple[_Validator, _Validator]:
+        # Alternatives which are types only can be checked at once.
+        if all(type(schema) is type and schema is not object for schema in schemas):
+            return ConfigValidator._compile_type(tuple(schemas))
+        compiled = [ConfigValidator._compile(schema) for schema in schemas]
+
+        # Converting requires to know which alternative matches, so only support alternatives without conversion.
+        if any(convert for _, convert in compiled):
+            return None
+        validators = [validate for validate, _ in compiled]
+
+        def validate(data: any) -> any:
+            for validate_alternative in validators:
+                try:
+                    return validate_alternative(data)
+                except ConfigValidationException:
+                    pass
+            raise ConfigValidationException(f'{data!r} did not match any of {", ".join(map(repr, schemas))}')
+        return validate, None
+
+    @staticmethod
+    def _compile_use(callable: Callable[[any], any]) -> Tuple[_Validator, _Validator]:
+        def validate(data: any) -> any:
+            try:
+                return callable(data)
+            except Exception as e:
+                raise ConfigValidationException(str(e)) from e
+        return validate, validate
+
+    @staticmethod
+    def _compile_fallback(schema: any) -> Tuple[_Validator, _Validator]:
+        wrapped = Schema(schema)
+
+        def validate(data: any) -> any:
+            try:
+                return wrapped.validate(data)
+            except SchemaError as e:
+                raise ConfigValidationException(str(e)) from e
+        return validate, validate
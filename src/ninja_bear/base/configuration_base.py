@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import List
 from .meta_data_settings import MetaDataSettings
+from .transformer import Transformer
 
 
 _DEFAULT_INDENT = 4
@@ -15,15 +16,17 @@ class ConfigurationBase:
     """
     Whitespace indent before each property, defaults to _DEFAULT_INDENT
     """
-    transformers: List[str] = None
+    transformers: List[str | Transformer] = None
     """
-    Python scripts which can transform the provided value. The script has access to the following variables.
+    Python scripts which can transform the provided value. Plain strings are treated as per-property scripts which
+    have access to the following variables.
     - name: Property name.
     - value: Property value.
     - type: Property type value (see values PropertyType).
     - properties: List of all properties (must not be modified).
 
-    To reflect changes to the outside of the script, the value variable must be modified.
+    To reflect changes to the outside of the script, the value variable must be modified. For batch transformers,
+    which run only once for all properties, see Transformer.
     """
     meta_data_settings: MetaDataSettings = None
     """
@@ -1,11 +1,15 @@
+from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 from .property import Property
 
+if TYPE_CHECKING:
+    from .property_table import PropertyTable
+
 
 @dataclass  # https://stackoverflow.com/a/70259423
 class DumpInfo:
     type_name: str
-    properties: List[Property]
+    properties: List[Property] | PropertyTable  # PropertyTable if the generator uses one (see GeneratorBase).
     indent: int
     additional_props: Dict
@@ -1,9 +1,10 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-import copy
+import dataclasses
 import datetime
 import getpass
-from typing import Dict, List
+from types import CodeType
+from typing import Callable, Dict, Iterator, List, TextIO, Tuple
 
 from .info import VERSION
 from .configuration_base import _DEFAULT_INDENT
@@ -11,7 +12,12 @@ from .generator_configuration import GeneratorConfiguration
 from .generator_naming_conventions import GeneratorNamingConventions
 from .name_converter import NamingConventionType, NameConverter
 from .property import Property
+from .property_overlay import PropertyOverlay
+from .property_resolution import PropertyResolution
+from .substitution_resolver import SubstitutionResolver
 from .dump_info import DumpInfo
+from .transformer import Transformer
+from .transformer_cache import TransformerCache
 
 
 class PropertyAlreadyExistsException(Exception):
@@ -29,6 +35,77 @@ class InvalidDumpTypeException(Exception):
         super().__init__('The returned dump value is not a string')
 
 
+class InvalidBatchTransformerResultException(Exception):
+    def __init__(self, property_count: int):
+        super().__init__(f'A batch transformer must provide a values list with {property_count} entries')
+
+
+class _PropertyList(list):
+    """
+    List of the generator properties. Deriving classes might modify the list directly (e.g., append or sort), so it
+    notifies the generator about each modification to keep the generator's property index up to date. The contained
+    properties notify the list about in-place modifications (see Property._add_owner), which get forwarded to the
+    generator as well.
+    """
+    __slots__ = ('_on_change', '_on_property_change', '__weakref__')
+
+    def __init__(self, on_change: Callable[[], None], on_property_change: Callable[[str], None]):
+        super().__init__()
+        self._on_change = on_change
+        self._on_property_change = on_property_change
+
+    def _property_changed(self, property: Property, name: str) -> None:
+        self._on_property_change(name)
+
+
+class _AdditionalProps(dict):
+    """
+    Additional props of the generator. Deriving classes might modify them directly, so the dict notifies the
+    generator about each modification to keep its state (see GeneratorBase.state_key) up to date.
+    """
+    __slots__ = ('_on_change',)
+
+    def __init__(self, on_change: Callable[[], None], props: Dict[str, any]):
+        super().__init__(props)
+        self._on_change = on_change
+
+
+def _notify_change(base: type, name: str) -> Callable:
+    method = getattr(base, name)
+
+    def modify(self: _PropertyList | _AdditionalProps, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._on_change()
+        return result
+
+    modify.__name__ = name
+    return modify
+
+
+for _name in [
+    'append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse', '__setitem__', '__delitem__',
+    '__iadd__', '__imul__',
+]:
+    setattr(_PropertyList, _name, _notify_change(list, _name))
+
+for _name in ['update', 'setdefault', 'pop', 'popitem', 'clear', '__setitem__', '__delitem__', '__ior__']:
+    setattr(_AdditionalProps, _name, _notify_change(dict, _name))
+
+
+# Methods which determine how the properties get resolved (see GeneratorBase.resolution_key).
+_RESOLUTION_METHODS = (
+    '_resolved_properties', '_resolve_properties', '_apply_transformations', '_apply_property_transformers',
+    '_apply_batch_transformer', '_transformers_key',
+)
+
+
+def _references(code: CodeType, name: str) -> bool:
+    # Checks if the compiled script (or any function or comprehension within it) uses the provided name.
+    return name in code.co_names or name in code.co_varnames or name in code.co_freevars or any(
+        _references(constant, name) for constant in code.co_consts if isinstance(constant, CodeType)
+    )
+
+
 class GeneratorBase(ABC):
     """
     Abstract class that acts as the base for all Generator implementations.
@@ -63,16 +140,50 @@ class GeneratorBase(ABC):
 
         self.transformers = config.transformers
         self._meta_data_settings = config.meta_data_settings
-        self._properties: List[Property] = []
+        self._property_list = _PropertyList(self._index_properties, self._property_changed)
+        self._property_map: Dict[Tuple[str, str], Property] = {}  # Index of _properties by (namespace, name).
+        self._version = 0  # Changes whenever the properties, the properties list or the additional props change.
+        self._property_ids: Tuple[int, Tuple] = None  # Property IDs of the resolution key and their version.
         self._naming_conventions = \
             config.naming_conventions if config.naming_conventions else GeneratorNamingConventions()
-        self._additional_props = additional_props
+        self._additional_props = _AdditionalProps(self._increase_version, additional_props)
+        self._property_resolution: PropertyResolution = None
+        self._resolution_key: Tuple = None  # Key of the last shared resolution (to drop it once it's superseded).
 
         self._set_type_name(type_name)
         self.set_indent(indent)
 
-        # Add properties one by one.
-        [self.add_property(property) for property in properties]
+        # Add all properties at once.
+        self.add_properties(properties)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # A deriving class must implement either _dump or _dump_iter. If it only implements _dump_iter, provide _dump
+        # before ABCMeta collects the abstract methods, so only classes which implement neither stay abstract.
+        if getattr(cls._dump, '__isabstractmethod__', False) and cls._dump_iter is not GeneratorBase._dump_iter:
+            cls._dump = GeneratorBase._dump_joined
+
+        # Generators of different classes can only share resolved properties if they resolve them the same way, so
+        # remember the class which implements the resolution (see resolution_key).
+        cls._resolution_type = next(
+            base for base in cls.__mro__ if any(name in vars(base) for name in _RESOLUTION_METHODS)
+        )
+
+    @property
+    def _properties(self) -> List[Property]:
+        """
+        Returns all properties in the order they have been added. The list can be modified directly, the property
+        index is kept up to date. However, add_property(ies) should be preferred as it checks for duplicates.
+
+        :return: List of properties.
+        :rtype:  List[Property]
+        """
+        return self._property_list
+
+    @_properties.setter
+    def _properties(self, properties: List[Property]):
+        self._property_list[:] = properties
 
     def add_property(self, property: Property):
         """
@@ -86,15 +197,40 @@ class GeneratorBase(ABC):
         :return: The current generator instance.
         :rtype:  Self
         """
-        found_property = len([
-            p for p in self._properties if p.name == property.name and p.namespace == property.namespace
-        ]) > 0
+        return self.add_properties([property])
+
+    def add_properties(self, properties: List[Property]):
+        """
+        Adds several properties to the properties list. The whole batch gets validated before any property is added.
+        IMPORTANT: Property names must be unique.
 
-        # Make sure that the name doesn't already exist.
-        if found_property:
-            raise PropertyAlreadyExistsException(property.name)
+        :param properties: Properties to add.
+        :type properties:  List[Property]
 
-        self._properties.append(property)
+        :raises PropertyAlreadyExistsException: Raised if the instance or the batch already contains a property with
+                                                the same name.
+
+        :return: The current generator instance.
+        :rtype:  Self
+        """
+        batch: Dict[Tuple[str, str], Property] = {}
+
+        for property in properties:
+            key = (property.namespace, property.name)
+
+            # Make sure that the name doesn't already exist.
+            if key in self._property_map or key in batch:
+                raise PropertyAlreadyExistsException(property.name)
+            batch[key] = property
+
+        # Extend the list via the list class itself as the index gets updated right away.
+        list.extend(self._property_list, batch.values())
+        self._property_map.update(batch)
+        self._version += 1
+
+        # Get notified about in-place modifications of the added properties.
+        for property in batch.values():
+            property._add_owner(self._property_list)
         return self
 
     def set_indent(self, indent: int):
@@ -117,47 +253,145 @@ class GeneratorBase(ABC):
         :return: Config file string.
         :rtype:  str
         """
-        
-        # Create copies of the properties to avoid messing around with the originals.
-        properties_copy = [copy.deepcopy(property) for property in self._properties]
+        return ''.join(self.dump_iter())
 
-        # Transform properties if transform function was provided.
-        self._apply_transformations(properties_copy)
+    def dump_to(self, stream: TextIO):
+        """
+        Generates the config and writes it to the provided stream fragment by fragment. This keeps the memory
+        footprint low for big configs as the whole config string never has to be held in memory (as long as the
+        deriving class implements _dump_iter).
 
-        # Substitute property values.
-        for property in properties_copy:
-            Property.substitute(property, properties_copy)
+        :param stream: Stream to write the config to (e.g., a file object).
+        :type stream:  TextIO
 
-        # Remove hidden properties.
-        properties_copy = [property for property in properties_copy if not property.hidden]
+        :return: The current generator instance.
+        :rtype:  Self
+        """
+        for fragment in self.dump_iter():
+            stream.write(fragment)
+        return self
+
+    def dump_iter(self) -> Iterator[str]:
+        """
+        Generates the config as a sequence of string fragments.
 
+        :raises InvalidDumpTypeException: Raised if the deriving class provided something else than strings.
+
+        :return: Config string fragments.
+        :rtype:  Iterator[str]
+        """
         # If not naming conventation has been provided, use camel-case as default.
         if not self._naming_conventions.properties_naming_convention:
             self._naming_conventions.properties_naming_convention = self._default_property_naming_convention()
+        naming_convention = self._naming_conventions.properties_naming_convention
+
+        if self._use_property_table():
+            from .property_table import PropertyTable  # Imported here as it might import NumPy.
+
+            # Hand the properties over column-wise and convert all names at once instead of copying each property.
+            properties = PropertyTable.from_properties(self._resolved_properties()).convert_names(naming_convention)
+        else:
+            # Create a copy-on-write view of the resolved properties to avoid messing around with the originals (which
+            # might be shared with other generators). Properties only get copied if they are actually changed.
+            overlay = PropertyOverlay(self._resolved_properties())
+
+            # Update property names according to naming convention.
+            names = NameConverter.convert_many([property.name for property in overlay], naming_convention)
+
+            for i, name in enumerate(names):
+                overlay.update(i, name=name)
 
-        # Update property names according to naming convention.
-        for property in properties_copy:
-            property.name = NameConverter.convert(
-                property.name, 
-                self._naming_conventions.properties_naming_convention
-            )
+            # The deriving class might modify the properties, so make sure it only gets copies (the resolved properties
+            # are shared with other generators and might still be the originals).
+            properties = overlay.copy_all().to_list()
 
-        s = self._dump(DumpInfo(
+        last_character = ''
+
+        for fragment in self._dump_iter(DumpInfo(
             self._type_name,
-            properties_copy,
+            properties,
             self._indent,
             self._additional_props,
-        ))
+        )):
+            # Make sure a string has been provided by the deriving class.
+            if not isinstance(fragment, str):
+                raise InvalidDumpTypeException()
+
+            if fragment:
+                last_character = fragment[-1]
+                yield fragment
 
-        # Make sure a string has been returned from _dump.
-        if not isinstance(s, str):
-            raise InvalidDumpTypeException()
-        
         # Add meta data if required.
-        s = self._add_meta_data(s)
+        meta_data_comments = self._meta_data_comments()
+
+        if meta_data_comments:
+            # Separate the meta data from the config by an empty line.
+            yield '\n' if last_character == '\n' else '\n\n'
+
+            for comment in meta_data_comments:
+                yield self._add_newline(comment)
+            last_character = '\n'
+
+        # Add a trailing newline if required.
+        if last_character != '\n':
+            yield '\n'
+
+    def resolution_key(self) -> Tuple:
+        """
+        Returns a key which identifies the resolved properties of this generator. Generators with the same key use
+        the same properties, the same transformer chain and the same resolution implementation (which is the same
+        for all generators whose class doesn't override it) and therefore produce the same resolved properties.
+
+        :return: Resolution key.
+        :rtype:  Tuple
+        """
+        property_ids = self._property_ids
+
+        # Only collect the property IDs again if the properties changed.
+        if not property_ids or property_ids[0] != self._version:
+            property_ids = (self._version, tuple(id(property) for property in self._properties))
+            self._property_ids = property_ids
+
+        return self._resolution_type, self._transformers_key(), property_ids[1]
+
+    def state_key(self) -> Tuple:
+        """
+        Returns a key which identifies the current state of the generator (properties, transformers and settings).
+        As long as the key doesn't change, the generator produces the same output (apart from meta data like time).
+        Properties and additional props are tracked by a version counter instead of their contents (they notify the
+        generator about modifications), so creating and comparing the key doesn't depend on the number of properties.
+
+        :return: State key.
+        :rtype:  Tuple
+        """
+        naming_conventions = self._naming_conventions
+        meta_data_settings = self._meta_data_settings
+
+        return (
+            self._version,
+            self._transformers_key(),
+            self._type_name,
+            self._indent,
+            naming_conventions.properties_naming_convention,
+            naming_conventions.type_naming_convention,
+            dataclasses.astuple(meta_data_settings) if meta_data_settings else None,
+        )
+
+    def set_property_resolution(self, resolution: PropertyResolution):
+        """
+        Sets a property resolution which is shared with other generators to resolve the properties only once for
+        all generators with the same resolution key.
+
+        :param resolution: Shared property resolution. If None, the properties get resolved on each dump.
+        :type resolution:  PropertyResolution
+
+        :return: The current generator instance.
+        :rtype:  Self
+        """
+        self._property_resolution = resolution
+        self._resolution_key = None
+        return self
 
-        return self._add_newline(s)
-    
     def get_type_name(self) -> str:
         """
         Returns the evaluated type name.
@@ -193,7 +427,8 @@ class GeneratorBase(ABC):
     @abstractmethod
     def _dump(self, info: DumpInfo) -> str:
         """
-        Abstract method which must be implemented by the deriving class to create a type string.
+        Abstract method which must be implemented by the deriving class to create a type string. Deriving classes
+        which implement _dump_iter instead don't need to implement it (see __init_subclass__).
 
         :param type_name:  Contains to required information to dump language specific code.
         :type type_name:   DumpInfo
@@ -203,6 +438,123 @@ class GeneratorBase(ABC):
         """
         pass
 
+    def _dump_iter(self, info: DumpInfo) -> Iterator[str]:
+        """
+        Method which can be implemented by the deriving class instead of _dump to create the type string as a
+        sequence of fragments. This allows to write big configs without holding the whole string in memory. By
+        default, the result of _dump is used as single fragment.
+
+        :param type_name:  Contains to required information to dump language specific code.
+        :type type_name:   DumpInfo
+
+        :return: Dumped type string fragments.
+        :rtype:  Iterator[str]
+        """
+        yield self._dump(info)
+
+    def _dump_joined(self, info: DumpInfo) -> str:
+        """
+        Implementation of _dump for deriving classes which only implement _dump_iter.
+
+        :param type_name:  Contains to required information to dump language specific code.
+        :type type_name:   DumpInfo
+
+        :return: Dumped type string.
+        :rtype:  str
+        """
+        return ''.join(self._dump_iter(info))
+
+    def _use_property_table(self) -> bool:
+        """
+        Method which can be overridden by the deriving class to receive the properties in DumpInfo as PropertyTable
+        instead of a list. The table provides the properties column-wise and supports bulk operations (e.g.,
+        grouping by type) for configs with a lot of properties. NumPy gets used if it's installed.
+
+        :return: True to use a PropertyTable, defaults to False.
+        :rtype:  bool
+        """
+        return False
+
+    def _resolved_properties(self) -> List[Property]:
+        """
+        Returns the transformed and substituted properties without the hidden ones. If a shared property resolution
+        has been set, the properties get only resolved once for all generators with the same resolution key.
+
+        :return: Resolved properties.
+        :rtype:  List[Property]
+        """
+        resolution = self._property_resolution
+
+        if resolution:
+            key = self.resolution_key()
+
+            # Drop the entry of the previous key if it has been superseded (e.g., because the properties changed).
+            # Otherwise, the resolution would keep each outdated property set alive.
+            if key != self._resolution_key:
+                if self._resolution_key is not None:
+                    resolution.discard(self._resolution_key)
+                self._resolution_key = key
+            return resolution.get(key, self._properties, self._resolve_properties)
+        return self._resolve_properties()
+
+    def _resolve_properties(self) -> List[Property]:
+        """
+        Transforms and substitutes the properties and removes the hidden ones.
+
+        :return: Resolved properties.
+        :rtype:  List[Property]
+        """
+        # Create a copy-on-write view of the properties to avoid messing around with the originals. Properties only
+        # get copied if they are actually changed.
+        properties = PropertyOverlay(self._properties)
+
+        # Transform properties if transform function was provided.
+        self._apply_transformations(properties)
+
+        # Substitute property values. The resolver indexes all properties once and resolves them in reference order.
+        for i, value in enumerate(SubstitutionResolver(properties).resolve()):
+            properties.update(i, value=value)
+
+        # Remove hidden properties.
+        return properties.filter(lambda property: not property.hidden).to_list()
+
+    def _transformers_key(self) -> Tuple[Transformer]:
+        transformers = self.transformers if self.transformers else []
+        return tuple(Transformer.from_definition(transformer) for transformer in transformers)
+
+    def _index_properties(self):
+        """
+        Rebuilds the property index after the properties list has been modified directly.
+        """
+        self._property_map = {(property.namespace, property.name): property for property in self._property_list}
+        self._version += 1
+
+        # Get notified about in-place modifications of added properties. Removed properties might still notify the
+        # generator, which only leads to an unnecessary regeneration.
+        for property in self._property_list:
+            property._add_owner(self._property_list)
+
+    def _property_changed(self, name: str):
+        """
+        Gets called whenever one of the properties has been modified in place.
+
+        :param name: Name of the modified property attribute.
+        :type name:  str
+        """
+        # The index uses the name and the namespace, so it needs to be rebuilt if one of them changed.
+        if name == 'name' or name == 'namespace':
+            self._index_properties()
+        else:
+            self._version += 1
+
+        # The resolved properties are outdated but the resolution key didn't change, so drop them.
+        if self._property_resolution and self._resolution_key is not None:
+            self._property_resolution.discard(self._resolution_key)
+            self._resolution_key = None
+
+    def _increase_version(self):
+        self._version += 1
+
     def _default_property_naming_convention(self) -> NamingConventionType:
         return NamingConventionType.CAMEL_CASE
 
@@ -216,13 +568,14 @@ class GeneratorBase(ABC):
         :return: Updated string.
         :rtype:  str
         """
-        if s[-1] != '\n':
+        if not s.endswith('\n'):
             s += '\n'
         return s
     
     def _add_meta_data(self, s: str) -> str:
         """
-        Adds a meta data comment to the generated config string.
+        Adds a meta data comment to the generated config string. The dump itself doesn't use this method anymore (see
+        dump_iter), it's kept for deriving classes which build config strings on their own.
 
         :param s: Config string.
         :type s:  str
@@ -230,7 +583,24 @@ class GeneratorBase(ABC):
         :return: Updated config string.
         :rtype:  str
         """
+        meta_data_comments = self._meta_data_comments()
+
+        if meta_data_comments:
+            s = self._add_newline(s) + '\n'
+
+            for comment in meta_data_comments:
+                s += self._add_newline(comment)
+        return s
+
+    def _meta_data_comments(self) -> List[str]:
+        """
+        Creates the meta data comment lines according to the meta data settings.
+
+        :return: Meta data comment lines.
+        :rtype:  List[str]
+        """
         settings = self._meta_data_settings
+        comments = []
 
         if settings:
             meta_data = {}
@@ -246,16 +616,8 @@ class GeneratorBase(ABC):
             if settings.link:
                 meta_data['link'] = 'https://pypi.org/project/ninja-bear/'
 
-            items = meta_data.items()
-            
-            if len(items):
-                s = self._add_newline(s) + '\n'
-
-                for attribute, value in items:
-                    s += self._add_newline(
-                        self._line_comment(f'{attribute}: {str(value)}')
-                    )
-        return s
+            comments = [self._line_comment(f'{attribute}: {str(value)}') for attribute, value in meta_data.items()]
+        return comments
 
     def _set_type_name(self, name: str):
         """
@@ -285,39 +647,104 @@ class GeneratorBase(ABC):
         )
         return self
     
-    def _apply_transformations(self, properties_copy: List[Property]) -> None:
+    def _apply_transformations(self, properties: PropertyOverlay) -> None:
         """
         Applies the user defined value transformation to each property value.
 
-        :param properties_copy: Copy of all properties (to prevent modification of original).
-        :type properties_copy:  List[Property]
+        :param properties: Copy-on-write view of all properties (to prevent modification of original).
+        :type properties:  PropertyOverlay
         """
         if self.transformers:
+            transformers = [Transformer.from_definition(transformer) for transformer in self.transformers]
+            property_transformers = []
+
+            # Run consecutive per-property transformers together and batch transformers on their own to keep the
+            # declaration order.
+            for transformer in transformers:
+                if transformer.batch:
+                    self._apply_property_transformers(properties, property_transformers)
+                    self._apply_batch_transformer(properties, transformer)
+
+                    property_transformers = []
+                else:
+                    property_transformers.append(transformer)
+            self._apply_property_transformers(properties, property_transformers)
+
+    def _apply_property_transformers(self, properties: PropertyOverlay, transformers: List[Transformer]) -> None:
+        """
+        Applies per-property transformers to each property value.
+
+        :param properties:   Copy-on-write view of all properties (to prevent modification of original).
+        :type properties:    PropertyOverlay
+        :param transformers: Per-property transformers to apply.
+        :type transformers:  List[Transformer]
+        """
+        if transformers:
             NAME_KEY = 'name'
             VALUE_KEY = 'value'
             TYPE_KEY = 'type'
             PROPERTIES_KEY = 'properties'
 
-            for i, property in enumerate(properties_copy):
+            # Compile the transformer scripts only once (they are cached process-wide).
+            code_objects = [TransformerCache.compile(transformer.script) for transformer in transformers]
+
+            # Scripts which access the properties might modify them directly, so they must only see copies.
+            if any(_references(code, PROPERTIES_KEY) for code in code_objects):
+                properties.copy_all()
+
+            for i, property in enumerate(properties):
                 # Create dictionary for local variables. This dictionary will also be used
                 # to get the modified value afterwards (https://stackoverflow.com/a/67824076).
                 local_variables = {
                     NAME_KEY: property.name,
                     VALUE_KEY: property.value,
                     TYPE_KEY: property.type.value,
-                    PROPERTIES_KEY: properties_copy,
+                    PROPERTIES_KEY: properties,
                 }
 
                 # Execute user defined Python scripts to transform properties.
-                for transformer in self.transformers:
-                    exec(transformer, None, local_variables)
-                    
-                    # Create new property from modified value.
-                    properties_copy[i] = Property(
-                        name=property.name,
-                        value=local_variables[VALUE_KEY],
-                        property_type=property.type,
-                        hidden=property.hidden,
-                        comment=property.comment,
-                        namespace=property.namespace,
-                    )
+                for code in code_objects:
+                    exec(code, None, local_variables)
+
+                    # Update the property with the modified value (only copies the property if the value changed).
+                    properties.update(i, value=Property._convert_value(local_variables[VALUE_KEY], property.type))
+
+    def _apply_batch_transformer(self, properties: PropertyOverlay, transformer: Transformer) -> None:
+        """
+        Applies a batch transformer which processes all property values at once.
+
+        :param properties:  Copy-on-write view of all properties (to prevent modification of original).
+        :type properties:   PropertyOverlay
+        :param transformer: Batch transformer to apply.
+        :type transformer:  Transformer
+
+        :raises InvalidBatchTransformerResultException: Raised if the transformer didn't provide a value list of the
+                                                        same length as the property list.
+        """
+        NAMES_KEY = 'names'
+        VALUES_KEY = 'values'
+        TYPES_KEY = 'types'
+        PROPERTIES_KEY = 'properties'
+
+        code = TransformerCache.compile(transformer.script)
+
+        # Scripts which access the properties might modify them directly, so they must only see copies.
+        if _references(code, PROPERTIES_KEY):
+            properties.copy_all()
+
+        local_variables = {
+            NAMES_KEY: [property.name for property in properties],
+            VALUES_KEY: [property.value for property in properties],
+            TYPES_KEY: [property.type.value for property in properties],
+            PROPERTIES_KEY: properties,
+        }
+        exec(code, None, local_variables)
+        values = local_variables[VALUES_KEY]
+
+        # Make sure a value has been provided for each property.
+        if not isinstance(values, list) or len(values) != len(properties):
+            raise InvalidBatchTransformerResultException(len(properties))
+
+        for i, (property, value) in enumerate(zip(properties, values)):
+            # Update the property with the modified value (only copies the property if the value changed).
+            properties.update(i, value=Property._convert_value(value, property.type))
@@ -0,0 +1,102 @@
+from __future__ import annotations
+import os
+import sys
+import threading
+from typing import Dict, List, Tuple
+
+from .property import Property
+
+
+class IncludeCache:
+    """
+    Caches the properties of included config files for the duration of a run. An included file gets read, parsed and
+    validated only once, no matter how often it's included (e.g., a shared base config which is included by several
+    configs). Entries are keyed by the file's real path, modification time and size.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple, Tuple[str, List[Property], List[str]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str) -> Tuple:
+        """
+        Creates the cache key for an include path.
+
+        :param path: Path of the included file.
+        :type path:  str
+
+        :raises FileNotFoundError: Raised if the file does not exist.
+
+        :return: Cache key.
+        :rtype:  Tuple
+        """
+        stat = os.stat(path)
+
+        # Relative includes of the included file get resolved relative to the directory of the provided path. Since
+        # the path might be a symlink, add the directory as well.
+        return (
+            os.path.realpath(path),
+            os.path.realpath(os.path.dirname(path)),
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+
+    def __contains__(self, key: Tuple) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: Tuple, namespace: str) -> Tuple[List[Property], List[str]]:
+        """
+        Returns copies of the cached properties for the provided key. The properties which belong to the included file
+        itself get the provided namespace, the properties of nested includes keep their namespace.
+
+        :param key:       Cache key (see IncludeCache.key).
+        :type key:        Tuple
+        :param namespace: Namespace (include alias) to assign.
+        :type namespace:  str
+
+        :return: Tuple of the properties and the aliases of all nested includes (in inclusion order) or None if the
+                 file has not been cached yet.
+        :rtype:  Tuple[List[Property], List[str]]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if not entry:
+            return None
+        cached_namespace, cached_properties, aliases = entry
+        namespace = sys.intern(namespace) if namespace else namespace
+        properties = []
+
+        for cached_property in cached_properties:
+            property = cached_property._copy()
+
+            # Aliases are unique within an include tree, so the nested properties never use the cached namespace.
+            if property.namespace == cached_namespace:
+                property.namespace = namespace
+            properties.append(property)
+        return properties, list(aliases)
+
+    def add(self, key: Tuple, namespace: str, properties: List[Property], aliases: List[str]) -> None:
+        """
+        Adds the properties of an included file to the cache.
+
+        :param key:        Cache key (see IncludeCache.key).
+        :type key:         Tuple
+        :param namespace:  Namespace (include alias) the properties have been read with.
+        :type namespace:   str
+        :param properties: Properties of the included file (including the properties of nested includes).
+        :type properties:  List[Property]
+        :param aliases:    Aliases of all nested includes (in inclusion order).
+        :type aliases:     List[str]
+        """
+        with self._lock:
+            self._entries[key] = (namespace, [property._copy() for property in properties], list(aliases))
+
+    def clear(self) -> None:
+        """
+        Removes all cached entries.
+        """
+        with self._lock:
+            self._entries.clear()
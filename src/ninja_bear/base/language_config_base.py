@@ -1,7 +1,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 import re
-from typing import List, Type
+from typing import List, TextIO, Tuple, Type
 
 from .configuration_base import _DEFAULT_INDENT
 from .generator_base import GeneratorBase
@@ -13,6 +13,7 @@ from .config_file_info import ConfigFileInfo
 from .name_converter import NameConverter
 from .property import Property
 from .meta_data_settings import MetaDataSettings
+from .transformer import Transformer
 
 
 class InvalidFileNameException(Exception):
@@ -37,7 +38,7 @@ class LanguageConfigBase(ABC):
         input_path: str,
         properties: List[Property],
         indent: int = _DEFAULT_INDENT,
-        transformers: List[str] = None,
+        transformers: List[str | Transformer] = None,
         naming_conventions: LanguageConfigNamingConventions = None,
         distributors: List[DistributorBase] = None,
         meta_data_settings: MetaDataSettings = None,
@@ -53,7 +54,7 @@ class LanguageConfigBase(ABC):
         :param indent:             Property indent for the generated config, defaults to _DEFAULT_INDENT
         :type indent:              int, optional
         :param transformers:       Python functions which can transform the provided value, defaults to None
-        :type transformers:        List[str], optional
+        :type transformers:        List[str | Transformer], optional
         :param naming_conventions: Naming convention to use for the generated config file, defaults to None
         :type naming_conventions:  LanguageConfigNamingConventions, optional
         :param distributors:       List of distributors, defaults to None
@@ -95,19 +96,58 @@ class LanguageConfigBase(ABC):
             config.file_extension,
         )
         self.distributors = distributors if distributors else []
+        self._dump_cache: Tuple[Tuple, str] = None
 
         # Check output file naming.
         self._check_file_name()
 
     def dump(self) -> str:
         """
-        Generates a config file string.
+        Generates a config file string. The result is cached and re-used (e.g., by write and distribute) as long as
+        the generator's properties and settings don't change.
 
         :return: Config file string.
         :rtype:  str
         """
-        return self.generator.dump()
-    
+        data = self._cached_dump()
+
+        if data is None:
+            data = self.generator.dump()
+
+            # Evaluate the state after dumping as the generator might apply default settings while dumping.
+            self._dump_cache = (self.generator.state_key(), data)
+        return data
+
+    def dump_to(self, stream: TextIO):
+        """
+        Generates the config and writes it to the provided stream fragment by fragment. If the config has already
+        been generated, the cached result is written instead.
+
+        :param stream: Stream to write the config to (e.g., a file object).
+        :type stream:  TextIO
+
+        :return: The current LanguageConfigBase instance.
+        :rtype:  LanguageConfigBase
+        """
+        data = self._cached_dump()
+
+        if data is None:
+            self.generator.dump_to(stream)
+        else:
+            stream.write(data)
+        return self
+
+    def invalidate(self):
+        """
+        Discards the cached config string. Usually, this is not required as changes of the properties (even in place)
+        and of the generator settings are detected automatically (see GeneratorBase.state_key).
+
+        :return: The current LanguageConfigBase instance.
+        :rtype:  LanguageConfigBase
+        """
+        self._dump_cache = None
+        return self
+
     def write(self, path: str = ''):
         """
         Generates a config file string and writes the config file to the provided directory.
@@ -122,12 +162,18 @@ class LanguageConfigBase(ABC):
         path = f'{path}/{self.config_info.file_name_full}'
 
         with open(path, 'w') as f:
-            f.write(self.dump())
+            # If the config gets distributed later on, the whole config string is needed anyway. Therefore, generate
+            # it via dump to cache it. Otherwise, stream it directly into the file to not hold it in memory.
+            if self.distributors:
+                f.write(self.dump())
+            else:
+                self.dump_to(f)
         return self
     
     def distribute(self):
         """
-        Distributes the generated config file via the specified distributors.
+        Distributes the generated config file via the specified distributors. If the config has already been
+        generated (e.g., by write), the cached result is used.
 
         :return: The current LanguageConfigBase instance.
         :rtype:  LanguageConfigBase
@@ -141,6 +187,21 @@ class LanguageConfigBase(ABC):
         ) for distributor in self.distributors]            
         return self
 
+    def _cached_dump(self) -> str:
+        """
+        Returns the cached config string if the generator's state didn't change since it was generated.
+
+        :return: Cached config string or None if there's no valid cached config string.
+        :rtype:  str
+        """
+        if self._dump_cache:
+            state_key, data = self._dump_cache
+
+            if state_key == self.generator.state_key():
+                return data
+            self._dump_cache = None
+        return None
+
     @abstractmethod
     def _file_extension(self) -> str:
         pass
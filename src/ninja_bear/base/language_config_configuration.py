@@ -7,6 +7,7 @@ from .generator_base import GeneratorBase
 from .distributor_base import DistributorBase
 from .generator_configuration import GeneratorConfiguration
 from .meta_data_settings import MetaDataSettings
+from .transformer import Transformer
 
 
 class NoConfigNameProvidedException(Exception):
@@ -55,7 +56,7 @@ class LanguageConfigConfiguration(ConfigurationBase):
         file_extension: str,
         generator_type: Type[GeneratorBase],
         indent: int=_DEFAULT_INDENT,
-        transformers: List[str]=None,
+        transformers: List[str | Transformer]=None,
         naming_conventions: LanguageConfigNamingConventions=None,
         distributors: List[DistributorBase]=None,
         meta_data_settings: MetaDataSettings=None
@@ -1,5 +1,8 @@
+from __future__ import annotations
 from enum import IntEnum, auto
-import re
+from functools import lru_cache
+import string
+from typing import Callable, Dict, List
 
 
 class NamingConventionType(IntEnum):
@@ -11,6 +14,8 @@ class NamingConventionType(IntEnum):
     CAMEL_CASE = auto()
     PASCAL_CASE = auto()
     KEBAP_CASE = auto()
+    DOT_CASE = auto()
+    TRAIN_CASE = auto()
 
 
 class UnknownNamingConventionException(Exception):
@@ -18,9 +23,15 @@ class UnknownNamingConventionException(Exception):
         super().__init__(f'Unknown naming convention type {naming_convention_type}')
 
 
+_UNDERLINE = '_'
+_ALPHANUMERIC_ASCII_CHARACTERS = frozenset(string.ascii_letters + string.digits)
+_CACHE_SIZE = 2 ** 14
+
+
 class NameConverter:
     """
-    Is used to convert a provided string into a specific string case (e.g., snake-case, camel-case, ...).
+    Is used to convert a provided string into a specific string case (e.g., snake-case, camel-case, ...). Conversion
+    results are cached (with bounded LRU eviction) as the same names usually get converted for several languages.
     """
 
     @staticmethod
@@ -38,34 +49,136 @@ class NameConverter:
         :return: Converted string.
         :rtype:  str
         """
-        UNDERLINE = '_'
-
-        # Handle Camel- or Pascal-cased strings by adding an underline in front of all first uppercase letters
-        # and lowercasing the whole string afterwards.
-        name = re.sub(r'(?<!^)(?<![A-Z_])([A-Z])', lambda match: f'{UNDERLINE}{match.group(1)}', name).lower()
-
-        # Replace all special characters by underline for easier further processing.
-        name = re.sub(r'\W+', UNDERLINE, name)
-
-        if type == NamingConventionType.SNAKE_CASE:
-            name = name.lower()
-        elif type == NamingConventionType.SCREAMING_SNAKE_CASE:
-            name = name.upper()
-        elif type == NamingConventionType.CAMEL_CASE or type == NamingConventionType.PASCAL_CASE:
-            # Replace all special characters followed by a letter by the uppercase version of the letter.
-            compare_name = ''
-            while compare_name != name:
-                compare_name = name
-                name = re.sub(rf'{UNDERLINE}+([a-zA-Z0-9])',
-                    lambda match: match.group(1).upper(), name # Thanks for the hint: https://stackoverflow.com/a/8934655.
-                )
-
-            # If Pascal-case, uppercase the first letter.
-            if type == NamingConventionType.PASCAL_CASE:
-                name = f'{name[0].upper()}{name[1:]}'
-        elif type == NamingConventionType.KEBAP_CASE:
-            name = re.sub(rf'{UNDERLINE}+', '-', name)
+        return _convert_cached(name, type)
+
+    @staticmethod
+    def convert_many(names: List[str], type: NamingConventionType) -> List[str]:
+        """
+        Converts all provided strings to the convention specified by type.
+
+        :param names: Strings to convert.
+        :type names:  List[str]
+        :param type:  Naming convention to use.
+        :type type:   NamingConventionType
+
+        :raises UnknownNamingConventionException: Raised if an unknown naming convention type is used.
+
+        :return: Converted strings in the same order as the provided strings.
+        :rtype:  List[str]
+        """
+        return [_convert_cached(name, type) for name in names]
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clears the conversion cache.
+        """
+        _convert_cached.cache_clear()
+
+
+class _NameTokens:
+    """
+    Lowercased words of a name and the separators between them. separators[i] holds the number of separator
+    characters in front of words[i], the last entry holds the number of trailing separator characters.
+    """
+
+    def __init__(self, words: List[str], separators: List[int]):
+        self.words = words
+        self.separators = separators
+
+    @staticmethod
+    def tokenize(name: str) -> _NameTokens:
+        # Mark word boundaries of Camel- or Pascal-cased strings by adding an underline in front of all first
+        # uppercase letters. The string gets lowercased as a whole to respect context-sensitive lowercasing rules.
+        marked_characters = []
+        previous_character = ''
+
+        for i, character in enumerate(name):
+            if 'A' <= character <= 'Z' and i > 0 and not ('A' <= previous_character <= 'Z' or
+                                                          previous_character == _UNDERLINE):
+                marked_characters.append(_UNDERLINE)
+            marked_characters.append(character)
+            previous_character = character
+        marked_name = ''.join(marked_characters).lower()
+
+        # Split the name into words in a single scan. Each underline and each run of special characters counts as
+        # one separator.
+        words = []
+        separators = [0]
+        word_start = None
+        in_special_characters = False
+
+        for i, character in enumerate(marked_name):
+            is_underline = character == _UNDERLINE
+
+            if is_underline or not character.isalnum():
+                if word_start is not None:
+                    words.append(marked_name[word_start:i])
+                    separators.append(0)
+                    word_start = None
+
+                if is_underline or not in_special_characters:
+                    separators[-1] += 1
+                in_special_characters = not is_underline
+            else:
+                if word_start is None:
+                    word_start = i
+                in_special_characters = False
+
+        if word_start is not None:
+            words.append(marked_name[word_start:])
+            separators.append(0)
+
+        return _NameTokens(words, separators)
+
+    def join(self, separator: str, collapse: bool, transform: Callable[[str], str]=None) -> str:
+        parts = []
+
+        for separator_count, word in zip(self.separators, self.words + ['']):
+            if separator_count:
+                parts.append(separator if collapse else separator * separator_count)
+            parts.append(transform(word) if transform and word else word)
+        return ''.join(parts)
+
+
+def _render_camel_case(tokens: _NameTokens) -> str:
+    parts = []
+
+    # Remove the separators in front of each word which starts with an alphanumeric character and uppercase that
+    # character instead.
+    for separator_count, word in zip(tokens.separators, tokens.words + ['']):
+        if separator_count and word and word[0] in _ALPHANUMERIC_ASCII_CHARACTERS:
+            word = f'{word[0].upper()}{word[1:]}'
         else:
-            raise UnknownNamingConventionException(type)
-            
-        return name
+            parts.append(_UNDERLINE * separator_count)
+        parts.append(word)
+    return ''.join(parts)
+
+
+def _render_pascal_case(tokens: _NameTokens) -> str:
+    name = _render_camel_case(tokens)
+    return f'{name[0].upper()}{name[1:]}' if name else name
+
+
+def _capitalize(word: str) -> str:
+    return f'{word[0].upper()}{word[1:]}'
+
+
+_RENDERERS: Dict[NamingConventionType, Callable[[_NameTokens], str]] = {
+    NamingConventionType.SNAKE_CASE: lambda tokens: tokens.join(_UNDERLINE, False, str.lower),
+    NamingConventionType.SCREAMING_SNAKE_CASE: lambda tokens: tokens.join(_UNDERLINE, False, str.upper),
+    NamingConventionType.CAMEL_CASE: _render_camel_case,
+    NamingConventionType.PASCAL_CASE: _render_pascal_case,
+    NamingConventionType.KEBAP_CASE: lambda tokens: tokens.join('-', True),
+    NamingConventionType.DOT_CASE: lambda tokens: tokens.join('.', True),
+    NamingConventionType.TRAIN_CASE: lambda tokens: tokens.join('-', True, _capitalize),
+}
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _convert_cached(name: str, type: NamingConventionType) -> str:
+    renderer = _RENDERERS.get(type)
+
+    if not renderer:
+        raise UnknownNamingConventionException(type)
+    return renderer(_NameTokens.tokenize(name))
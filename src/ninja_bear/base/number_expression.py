@@ -0,0 +1,190 @@
+from __future__ import annotations
+import ast
+from functools import lru_cache
+import operator
+from typing import Callable, List, Tuple
+
+_VALIDATION_NUMBER = '1'  # Put in place of the references to validate an expression.
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.BitAnd: operator.and_,
+    ast.BitOr: operator.or_,
+    ast.BitXor: operator.xor,
+    ast.LShift: operator.lshift,
+    ast.RShift: operator.rshift,
+}
+
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+    ast.Not: operator.not_,
+    ast.Invert: operator.invert,
+}
+
+_COMPARISON_OPERATORS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+_Evaluator = Callable[[], any]
+
+
+class InvalidNumberExpressionException(Exception):
+    def __init__(self, expression: str, reason: str):
+        super().__init__(f'{expression} is not a valid number expression ({reason})')
+
+
+class NumberExpression:
+    """
+    Arithmetic/boolean expression of a number or boolean property value (e.g., ${myInteger} * ${myFloat}). Like a
+    plain text substitution, the input values are put in place of the references and the resulting text gets
+    evaluated, so references next to each other or next to digits are concatenated (e.g., ${a}${b} with a=1 and b=2
+    results in 12). Each distinct text is parsed only once into a tree of closures which gets evaluated without using
+    eval. Only numbers, booleans and arithmetic, bitwise, comparison and boolean operators are supported.
+    """
+
+    def __init__(self, literals: Tuple[str, ...]):
+        """
+        Constructor. Use NumberExpression.compile to create a validated expression.
+
+        :param literals: Literal segments of the expression.
+        :type literals:  Tuple[str, ...]
+        """
+        self._literals = literals
+        self.input_count = len(literals) - 1
+
+    @staticmethod
+    def compile(literals: Tuple[str, ...]) -> NumberExpression:
+        """
+        Compiles an expression from its literal segments. Between each two literals an input value gets inserted
+        (see SubstitutionTemplate). The expression is valid if it results in a valid constant expression when each
+        input is a number. The results are cached, so compiling the same expression again is cheap.
+
+        :param literals: Literal segments of the expression.
+        :type literals:  Tuple[str, ...]
+
+        :raises InvalidNumberExpressionException: Raised if the expression contains unsupported elements.
+
+        :return: Compiled expression.
+        :rtype:  NumberExpression
+        """
+        return _compile_expression_cached(tuple(literals))
+
+    @staticmethod
+    def evaluate_constant(value: str) -> any:
+        """
+        Evaluates a constant expression string (e.g., '42' or '1.5').
+
+        :param value: Constant expression string.
+        :type value:  str
+
+        :raises InvalidNumberExpressionException: Raised if the expression contains unsupported elements.
+
+        :return: Evaluated value.
+        :rtype:  any
+        """
+        return _compile_cached(value)()
+
+    def evaluate(self, inputs: List[any]) -> any:
+        """
+        Evaluates the expression for the provided input values.
+
+        :param inputs: Input values in the same order as the references. They are put into the expression as text.
+        :type inputs:  List[any]
+
+        :raises InvalidNumberExpressionException: Raised if the expression text with the inputs put in is not a valid
+                                                  constant expression.
+
+        :return: Evaluation result.
+        :rtype:  any
+        """
+        literals = self._literals
+        parts = [literals[0]]
+
+        for input, literal in zip(inputs, literals[1:]):
+            parts.append(f'{input}')
+            parts.append(literal)
+        return NumberExpression.evaluate_constant(''.join(parts))
+
+
+@lru_cache(maxsize=2 ** 12)
+def _compile_expression_cached(literals: Tuple[str, ...]) -> NumberExpression:
+    # Validate the expression with a number in place of each reference.
+    _compile_cached(_VALIDATION_NUMBER.join(literals))
+    return NumberExpression(literals)
+
+
+@lru_cache(maxsize=2 ** 12)
+def _compile_cached(source: str) -> _Evaluator:
+    source = source.strip()
+
+    try:
+        tree = ast.parse(source, mode='eval')
+    except SyntaxError as e:
+        raise InvalidNumberExpressionException(source, e.msg)
+
+    return _compile_node(tree.body, source)
+
+
+def _compile_node(node: ast.AST, source: str) -> _Evaluator:
+    def compile_child(child: ast.AST) -> _Evaluator:
+        return _compile_node(child, source)
+
+    if isinstance(node, ast.Constant) and type(node.value) in [int, float, bool]:
+        value = node.value
+        return lambda: value
+    elif isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        binary_operator = _BINARY_OPERATORS[type(node.op)]
+        left = compile_child(node.left)
+        right = compile_child(node.right)
+
+        return lambda: binary_operator(left(), right())
+    elif isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        unary_operator = _UNARY_OPERATORS[type(node.op)]
+        operand = compile_child(node.operand)
+
+        return lambda: unary_operator(operand())
+    elif isinstance(node, ast.BoolOp):
+        operands = [compile_child(value) for value in node.values]
+        is_and = isinstance(node.op, ast.And)
+
+        # Mimic Python's short-circuit evaluation which returns the deciding operand.
+        def evaluate_bool() -> any:
+            for operand in operands:
+                result = operand()
+
+                if bool(result) != is_and:
+                    break
+            return result
+        return evaluate_bool
+    elif isinstance(node, ast.Compare) and all(type(op) in _COMPARISON_OPERATORS for op in node.ops):
+        left = compile_child(node.left)
+        comparisons = [
+            (_COMPARISON_OPERATORS[type(op)], compile_child(comparator))
+            for op, comparator in zip(node.ops, node.comparators)
+        ]
+
+        def evaluate_compare() -> bool:
+            left_value = left()
+
+            for comparison_operator, right in comparisons:
+                right_value = right()
+
+                if not comparison_operator(left_value, right_value):
+                    return False
+                left_value = right_value
+            return True
+        return evaluate_compare
+
+    raise InvalidNumberExpressionException(source, f'unsupported element {type(node).__name__}')
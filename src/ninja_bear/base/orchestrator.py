@@ -1,10 +1,13 @@
 from __future__ import annotations
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 from .language_config_base import LanguageConfigBase
 from .config import Config
+from .include_cache import IncludeCache
 from .distributor_credentials import DistributorCredentials
 from .plugin_manager import Plugin
+from .property_resolution import PropertyResolution
 
 class Orchestrator:
     def __init__(self, language_configs: List[LanguageConfigBase]):
@@ -14,6 +17,16 @@ class Orchestrator:
 
         self.language_configs = language_configs
 
+        # Group language configs by their transformer chain to transform and substitute the properties only once per
+        # group. Only the naming-convention step and the actual dump remain per language.
+        resolutions: Dict[Tuple, PropertyResolution] = {}
+
+        for config in language_configs:
+            generator = config.generator
+            generator.set_property_resolution(
+                resolutions.setdefault(generator.resolution_key(), PropertyResolution())
+            )
+
     def dump(self) -> List[str]:
         """
         Dumps all language configs into a list of strings.
@@ -23,17 +36,33 @@ class Orchestrator:
         """
         return [config.dump() for config in self.language_configs]
     
-    def write(self, path: str = ''):
+    def write(self, path: str = '', jobs: int = 1):
         """
         Writes all language configs to the specified output path.
 
         :param path: Path to write the configs to (the directory must exist), defaults to ''
         :type path:  str, optional
+        :param jobs: Maximum number of language configs to dump and write concurrently. If None, the default number
+                     of threads of ThreadPoolExecutor is used, defaults to 1 (one after another)
+        :type jobs:  int, optional
+
+        :raises ValueError: Raised if jobs is less than 1.
 
         :return: The current Orchestrator instance.
         :rtype:  Orchestrator
         """
-        [config.write(path) for config in self.language_configs]
+        if jobs is not None and jobs < 1:
+            raise ValueError(f'jobs must be at least 1 but is {jobs}')
+
+        if jobs == 1 or len(self.language_configs) < 2:
+            [config.write(path) for config in self.language_configs]
+        else:
+            with ThreadPoolExecutor(jobs) as executor:
+                futures = [executor.submit(config.write, path) for config in self.language_configs]
+
+            # All configs have been written at this point. Pick up the results in order, so if several configs
+            # failed, always the error of the first one is raised (no matter which one failed first).
+            [future.result() for future in futures]
         return self
     
     def distribute(self):
@@ -51,17 +80,28 @@ class Orchestrator:
         path: str,
         distributor_credentials: List[DistributorCredentials]=None,
         plugins: List[Plugin]=None,
+        include_cache: IncludeCache=None,
+        include_workers: int=None,
     ):
         """
         Reads the provided YAML configuration file and generates a list of language configurations.
 
-        :param path: Path to load the YAML file from (see example/test-config.yaml for configuration details).
-        :type path:  str
+        :param path:            Path to load the YAML file from (see example/test-config.yaml for configuration
+                                details).
+        :type path:             str
+        :param include_cache:   Cache for included files. Pass the same cache when reading several configs to read
+                                shared includes only once, defaults to None
+        :type include_cache:    IncludeCache, optional
+        :param include_workers: Maximum number of threads to load included files with. If 1, included files are
+                                loaded one after another, defaults to None
+        :type include_workers:  int, optional
+
+        :raises ValueError: Raised if include_workers is less than 1.
 
         :return: Orchestrator instance.
         :rtype:  Orchestrator
         """
-        return Orchestrator(Config.read(path, distributor_credentials, plugins))
+        return Orchestrator(Config.read(path, distributor_credentials, plugins, include_cache, include_workers))
 
     @staticmethod
     def parse_config(
@@ -69,20 +109,42 @@ class Orchestrator:
         config_name: str,
         distributor_credentials: List[DistributorCredentials]=None,
         plugins: List[Plugin]=None,
+        include_cache: IncludeCache=None,
+        include_workers: int=None,
+        trusted: bool=False,
     ):
         """
         Parses the provided YAML configuration string and generates a list of language configurations. 
 
-        :param config:      YAML configuration string (see example/test-config.yaml for configuration details).
-        :type config:       str
-        :param config_name: Name of the generated type and config. HINT: This acts more like a template for the
-                            type name than the real name as some conventions must be met and therefore the default
-                            convention specified by the deriving class of GeneratorBase will be used if no naming
-                            convention for the type name was provided (see
-                            GeneratorBase._default_type_naming_convention).
-        :type config_name:  str
+        :param config:          YAML configuration string (see example/test-config.yaml for configuration details).
+        :type config:           str
+        :param config_name:     Name of the generated type and config. HINT: This acts more like a template for the
+                                type name than the real name as some conventions must be met and therefore the default
+                                convention specified by the deriving class of GeneratorBase will be used if no naming
+                                convention for the type name was provided (see
+                                GeneratorBase._default_type_naming_convention).
+        :type config_name:      str
+        :param include_cache:   Cache for included files. Pass the same cache when parsing several configs to read
+                                shared includes only once, defaults to None
+        :type include_cache:    IncludeCache, optional
+        :param include_workers: Maximum number of threads to load included files with. If 1, included files are
+                                loaded one after another, defaults to None
+        :type include_workers:  int, optional
+        :param trusted:         If True and config is an already parsed object, it's expected to match the config
+                                schema and the structure and property name checks are skipped, defaults to False
+        :type trusted:          bool, optional
+
+        :raises ValueError: Raised if include_workers is less than 1.
 
         :return: Orchestrator instance.
         :rtype:  Orchestrator
         """
-        return Orchestrator(Config.parse(config, config_name, distributor_credentials, plugins))
+        return Orchestrator(Config.parse(
+            config,
+            config_name,
+            distributor_credentials,
+            plugins,
+            include_cache,
+            include_workers,
+            trusted,
+        ))
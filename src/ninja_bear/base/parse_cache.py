@@ -0,0 +1,159 @@
+from __future__ import annotations
+import hashlib
+import marshal
+import os
+import threading
+import warnings
+
+_CACHE_SUB_DIRECTORY = 'configs'
+_CACHE_FILE_EXTENSION = 'bin'
+_DEFAULT_MAX_SIZE = 64 * 1024 * 1024  # 64 MiB.
+
+
+class ParseCache:
+    """
+    Opt-in on-disk cache for parsed and validated config files. Entries are keyed by a hash over the file content and
+    everything else the parse result depends on (e.g., the ninja-bear version). The cache size is bounded, if it
+    grows too big, the least recently used entries get removed. Entries are stored with marshal instead of pickle, so
+    only plain data (dict, list, tuple, str, int, float, bool, None) can be cached and loading an entry never runs
+    code, even if someone else can write to the cache directory.
+    """
+    _cache_dir: str = None
+    _max_size: int = _DEFAULT_MAX_SIZE
+
+    @staticmethod
+    def set_cache_dir(directory: str, max_size: int=None) -> None:
+        """
+        Enables the on-disk cache. The entries are stored in a subdirectory of the provided directory.
+
+        :param directory: Cache directory. If None or empty, the on-disk cache gets disabled.
+        :type directory:  str
+        :param max_size:  Maximum size of all entries in bytes, defaults to None (64 MiB)
+        :type max_size:   int, optional
+        """
+        ParseCache._cache_dir = os.path.join(directory, _CACHE_SUB_DIRECTORY) if directory else None
+        ParseCache._max_size = max_size if max_size is not None else _DEFAULT_MAX_SIZE
+
+    @staticmethod
+    def enabled() -> bool:
+        """
+        Returns if the on-disk cache is enabled.
+
+        :return: True if a cache directory has been set.
+        :rtype:  bool
+        """
+        return bool(ParseCache._cache_dir)
+
+    @staticmethod
+    def key(*parts: str | bytes) -> str:
+        """
+        Creates a cache key from the provided parts. Parts can also be bytes-like objects (e.g., a memory-mapped file)
+        to hash them without decoding.
+
+        :return: Cache key.
+        :rtype:  str
+        """
+        hash = hashlib.sha256()
+
+        for part in parts:
+            data = part.encode('utf-8') if isinstance(part, str) else part
+
+            # Add the length to make sure that different splits of the same string don't collide.
+            hash.update(f'{len(data)}:'.encode('utf-8'))
+            hash.update(data)
+        return hash.hexdigest()
+
+    @staticmethod
+    def get(key: str) -> object:
+        """
+        Loads an entry from the cache and marks it as recently used.
+
+        :param key: Cache key (see ParseCache.key).
+        :type key:  str
+
+        :return: Cached data or None if the entry does not exist (or the cache is disabled).
+        :rtype:  object
+        """
+        value = None
+
+        if ParseCache._cache_dir:
+            path = ParseCache._cache_file_path(key)
+
+            try:
+                with open(path, 'rb') as f:
+                    value = marshal.load(f)
+
+                # Use the modification time to track the last usage as the access time is not reliable (e.g., noatime).
+                os.utime(path)
+            except (OSError, EOFError, ValueError, TypeError):
+                # Nothing to do here, the file just gets parsed again.
+                pass
+        return value
+
+    @staticmethod
+    def put(key: str, value: object) -> None:
+        """
+        Stores an entry in the cache (if enabled) and removes the least recently used entries if the cache grew too
+        big.
+
+        :param key:   Cache key (see ParseCache.key).
+        :type key:    str
+        :param value: Plain data to cache (see ParseCache). If it contains other objects, it doesn't get cached and a
+                      warning is issued.
+        :type value:  object
+        """
+        if ParseCache._cache_dir:
+            try:
+                data = marshal.dumps(value)
+            except ValueError as e:
+                warnings.warn(f'Parse result could not be cached ({e})', RuntimeWarning, stacklevel=2)
+                return
+
+            path = ParseCache._cache_file_path(key)
+            temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'  # Unique per process and thread.
+
+            try:
+                os.makedirs(ParseCache._cache_dir, exist_ok=True)
+
+                # Write to a temporary file first to make sure other processes never read a half-written file.
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+                ParseCache._evict()
+            except OSError:
+                # The cache is just an optimization, so don't fail if it can't be written.
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _cache_file_path(key: str) -> str:
+        return os.path.join(ParseCache._cache_dir, f'{key}.{_CACHE_FILE_EXTENSION}')
+
+    @staticmethod
+    def _evict() -> None:
+        """
+        Removes the least recently used entries until the cache fits into the maximum size.
+        """
+        entries = []
+        size = 0
+
+        with os.scandir(ParseCache._cache_dir) as iterator:
+            for entry in iterator:
+                if entry.name.endswith(f'.{_CACHE_FILE_EXTENSION}'):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue  # Probably removed by another process.
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    size += stat.st_size
+
+        for _, entry_size, entry_path in sorted(entries):
+            if size <= ParseCache._max_size:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass  # Probably removed by another process.
+            size -= entry_size
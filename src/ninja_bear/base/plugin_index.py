@@ -0,0 +1,157 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import TYPE_CHECKING, List
+
+from .info import VERSION
+
+# Since importlib.metadata changes way too often, use importlib_metadata. It's imported only when required, as a warm
+# start gets the entry points from the index.
+if TYPE_CHECKING:
+    from importlib_metadata import EntryPoint
+
+_PLUGIN_GROUP_PATTERN = 'ninja(-|_)bear(-|_).+'
+_METADATA_DIRECTORY_SUFFIXES = ('.dist-info', '.egg-info', '.egg-link')
+_INDEX_FILE_NAME = 'plugins.json'
+
+_KEY_FINGERPRINT = 'fingerprint'
+_KEY_ENTRY_POINTS = 'entry_points'
+_KEY_NAME = 'name'
+_KEY_GROUP = 'group'
+_KEY_VALUE = 'value'
+
+
+class PluginIndex:
+    """
+    Opt-in on-disk index of the installed ninja-bear plugin entry points. Enumerating the entry points requires to
+    read the metadata of every installed distribution, which is slow in large environments. The index is invalidated
+    by a fingerprint of the distribution metadata directories on sys.path, so a warm start only needs to list these
+    directories instead of reading all metadata.
+    """
+    _cache_dir: str = None
+
+    @staticmethod
+    def set_cache_dir(directory: str) -> None:
+        """
+        Enables the on-disk index. The index is stored in the provided directory.
+
+        :param directory: Cache directory. If None or empty, the on-disk index gets disabled.
+        :type directory:  str
+        """
+        PluginIndex._cache_dir = directory if directory else None
+
+    @staticmethod
+    def entry_points() -> List[EntryPoint]:
+        """
+        Returns the entry points of all installed plugins. If the index is enabled and up to date, the entry points
+        are taken from the index, otherwise they are discovered again (and the index gets rebuilt).
+
+        :return: List of plugin entry points.
+        :rtype:  List[EntryPoint]
+        """
+        plugin_entry_points = PluginIndex._load() if PluginIndex._cache_dir else None
+        return plugin_entry_points if plugin_entry_points is not None else PluginIndex.rebuild()
+
+    @staticmethod
+    def rebuild() -> List[EntryPoint]:
+        """
+        Discovers the entry points of all installed plugins and writes them to the index (if enabled).
+
+        :return: List of plugin entry points.
+        :rtype:  List[EntryPoint]
+        """
+        import importlib_metadata
+
+        fingerprint = PluginIndex.fingerprint() if PluginIndex._cache_dir else None
+        plugin_entry_points = [e for e in importlib_metadata.entry_points() if re.match(_PLUGIN_GROUP_PATTERN, e.group)]
+
+        if fingerprint:
+            PluginIndex._store(fingerprint, plugin_entry_points)
+        return plugin_entry_points
+
+    @staticmethod
+    def fingerprint() -> str:
+        """
+        Creates a fingerprint of the installed distributions. It changes whenever a distribution gets installed,
+        updated or removed.
+
+        :return: Fingerprint of the installed distributions.
+        :rtype:  str
+        """
+        hash = hashlib.sha256(f'{VERSION}\n{sys.version}\n'.encode('utf-8'))
+
+        for path in sys.path:
+            try:
+                with os.scandir(path or '.') as iterator:
+                    entries = [entry for entry in iterator if entry.name.endswith(_METADATA_DIRECTORY_SUFFIXES)]
+
+                hash.update(f'{path}\n{os.stat(path or ".").st_mtime_ns}\n'.encode('utf-8'))
+
+                for entry in sorted(entries, key=lambda entry: entry.name):
+                    hash.update(f'{entry.name}\n{entry.stat().st_mtime_ns}\n'.encode('utf-8'))
+            except OSError:
+                # Path doesn't exist or isn't a directory (e.g., a zip file), so there are no metadata directories.
+                hash.update(f'{path}\n'.encode('utf-8'))
+        return hash.hexdigest()
+
+    @staticmethod
+    def _index_file_path() -> str:
+        return os.path.join(PluginIndex._cache_dir, _INDEX_FILE_NAME)
+
+    @staticmethod
+    def _load() -> List[EntryPoint]:
+        """
+        Loads the entry points from the index.
+
+        :return: List of plugin entry points or None if the index does not exist or is outdated.
+        :rtype:  List[EntryPoint]
+        """
+        plugin_entry_points = None
+
+        try:
+            with open(PluginIndex._index_file_path(), 'r') as f:
+                index = json.load(f)
+
+            if index[_KEY_FINGERPRINT] == PluginIndex.fingerprint():
+                from importlib_metadata import EntryPoint
+
+                plugin_entry_points = [
+                    EntryPoint(name=e[_KEY_NAME], value=e[_KEY_VALUE], group=e[_KEY_GROUP])
+                    for e in index[_KEY_ENTRY_POINTS]
+                ]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Nothing to do here, the plugins just get discovered again.
+            pass
+        return plugin_entry_points
+
+    @staticmethod
+    def _store(fingerprint: str, plugin_entry_points: List[EntryPoint]) -> None:
+        """
+        Writes the entry points to the index.
+
+        :param fingerprint:         Fingerprint of the installed distributions.
+        :type fingerprint:          str
+        :param plugin_entry_points: List of plugin entry points.
+        :type plugin_entry_points:  List[EntryPoint]
+        """
+        path = PluginIndex._index_file_path()
+        temp_path = f'{path}.{os.getpid()}.tmp'
+
+        try:
+            os.makedirs(PluginIndex._cache_dir, exist_ok=True)
+
+            # Write to a temporary file first to make sure other processes never read a half-written file.
+            with open(temp_path, 'w') as f:
+                json.dump({
+                    _KEY_FINGERPRINT: fingerprint,
+                    _KEY_ENTRY_POINTS: [
+                        {_KEY_NAME: e.name, _KEY_GROUP: e.group, _KEY_VALUE: e.value} for e in plugin_entry_points
+                    ],
+                }, f)
+            os.replace(temp_path, path)
+        except OSError:
+            # The index is just an optimization, so don't fail if it can't be written.
+            pass
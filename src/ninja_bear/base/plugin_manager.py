@@ -1,10 +1,14 @@
+from __future__ import annotations
 from enum import IntEnum, auto
-from importlib_metadata import entry_points  # Since importlib.metadata changes way too often, use importlib_metadata.
-import re
-from typing import List, Type
+import threading
+from typing import TYPE_CHECKING, Dict, List, Type
 
 from .distributor_base import DistributorBase
 from .language_config_base import LanguageConfigBase
+from .plugin_index import PluginIndex
+
+if TYPE_CHECKING:
+    from importlib_metadata import EntryPoint
 
 
 class PluginType(IntEnum):
@@ -47,62 +51,248 @@ class Plugin:
         return self._inherits(DistributorBase, check_class)
 
 
-class PluginManager:
+class _LazyPlugin:
+    """
+    Installed plugin which only gets imported when it's accessed for the first time. If it replaces another plugin
+    with the same name, the replaced plugin is kept as fallback, because it's not known yet if the entry point
+    provides a valid plugin.
+    """
+
+    def __init__(self, entry_point: EntryPoint, fallback: Plugin | _LazyPlugin=None) -> None:
+        self._entry_point = entry_point
+        self._fallback = fallback
+        self._plugin: Plugin = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def get_name(self) -> str:
+        return self._entry_point.group
+
+    def load(self) -> Plugin:
+        """
+        Imports the plugin class. The result is cached, so the plugin only gets imported once.
+
+        :return: The loaded plugin, the fallback if the entry point didn't provide a valid plugin class or None if
+                 there's no fallback.
+        :rtype:  Plugin
+        """
+        with self._lock:
+            if not self._loaded:
+                plugin_class = self._entry_point.load()
+                plugin = Plugin(self.get_name(), plugin_class) if plugin_class else None
+
+                if not plugin or plugin.get_type() == PluginType.UNKNOWN:
+                    fallback = self._fallback
+                    plugin = fallback.load() if isinstance(fallback, _LazyPlugin) else fallback
+
+                self._plugin = plugin
+                self._fallback = None
+                self._loaded = True
+            return self._plugin
+
+    def replacing(self, plugin: Plugin | _LazyPlugin) -> _LazyPlugin:
+        """
+        Creates a lazy plugin for the same entry point which falls back to the provided plugin.
+
+        :param plugin: Plugin which gets replaced.
+        :type plugin:  Plugin | _LazyPlugin
+
+        :return: Lazy plugin with the provided plugin as fallback.
+        :rtype:  _LazyPlugin
+        """
+        return _LazyPlugin(self._entry_point, plugin)
+
+
+class PluginRegistry:
+    """
+    Index of plugins by type and normalized name. The installed plugins are discovered only once per process (see
+    PluginRegistry.default) and only get imported when they are requested (see find). Caller-provided plugins are
+    added to copies of that registry (see overlay), so the process-wide registry never changes.
+    """
+    _default: PluginRegistry = None
+    _default_lock = threading.Lock()
+
     def __init__(self, plugins: List[Plugin]=None) -> None:
-        self._plugins: List[Plugin] = []
+        """
+        Constructor
 
-        # Since a default list cannot be assigned to parameters in the method header, because it only gets initialized
-        # once and then the list gets re-used (see https://stackoverflow.com/a/1145781), make sure to set undefined
-        # variables to list (see also https://docs.python.org/3/reference/compound_stmts.html#function-definitions).
-        if not plugins:
-            plugins = []
+        :param plugins: Plugins to add, defaults to None
+        :type plugins:  List[Plugin], optional
+        """
+        self._plugins: List[Plugin | _LazyPlugin] = []
+        self._indices: Dict[str, int] = {}  # Maps normalized names to the plugin's position in _plugins.
+        self._lock = threading.Lock()
 
-        self._load_plugins()
-        self.add_plugins(plugins)
+        if plugins:
+            self.add(plugins)
 
-    def add_plugins(self, plugins: List[Plugin], replace=True):
-        def plugin_name(plugin: Plugin):
-            return plugin.get_name().replace('-', '_').strip()
+    @staticmethod
+    def default() -> PluginRegistry:
+        """
+        Returns the process-wide registry of installed plugins. The plugins are discovered on the first call, but not
+        imported yet.
+
+        :return: Process-wide plugin registry.
+        :rtype:  PluginRegistry
+        """
+        with PluginRegistry._default_lock:
+            if not PluginRegistry._default:
+                PluginRegistry._default = PluginRegistry(PluginRegistry._discover())
+            return PluginRegistry._default
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Discards the process-wide registry, so the installed plugins get discovered again on the next access (e.g.,
+        after new plugins have been installed).
+        """
+        with PluginRegistry._default_lock:
+            PluginRegistry._default = None
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """
+        Normalizes a plugin name, so dashes and underscores are treated the same.
+
+        :param name: Plugin name.
+        :type name:  str
 
-        # Added plugins overwrite loaded ones if names match, doubles are removed.
-        for plugin in [p for p in plugins if p and p.get_type() != PluginType.UNKNOWN]:
-            found = False
+        :return: Normalized plugin name.
+        :rtype:  str
+        """
+        return name.replace('-', '_').strip()
 
-            if replace:
-                for i, plugin_temp in enumerate(self._plugins):
-                    if plugin_name(plugin_temp) == plugin_name(plugin):
+    def overlay(self, plugins: List[Plugin]=None) -> PluginRegistry:
+        """
+        Creates a copy of the registry with the provided plugins added. If no plugins are provided, the registry
+        itself is returned.
 
-                        # If not found yet, replace the plugin, otherwise remove it.
-                        if not found:
-                            self._plugins[i] = plugin
-                        else:
-                            del self._plugins[i]
-                        found = True
+        :param plugins: Plugins to add, defaults to None
+        :type plugins:  List[Plugin], optional
 
-            # If not found, append the plugin to the list.
-            if not found:
-                self._plugins.append(plugin)
+        :return: Registry with the provided plugins added.
+        :rtype:  PluginRegistry
+        """
+        return self._copy().add(plugins) if plugins else self
 
+    def add(self, plugins: List[Plugin | _LazyPlugin], replace: bool=True) -> PluginRegistry:
+        """
+        Adds plugins to the registry. Plugins of an unknown type are ignored.
+
+        :param plugins: Plugins to add.
+        :type plugins:  List[Plugin | _LazyPlugin]
+        :param replace: If True, added plugins replace existing plugins with the same normalized name, otherwise
+                        they are appended, defaults to True. As the type of lazy plugins is only known after
+                        loading them, they only replace an existing plugin if they turn out to be valid.
+        :type replace:  bool, optional
+
+        :return: The current PluginRegistry instance.
+        :rtype:  PluginRegistry
+        """
+        with self._lock:
+            for plugin in [p for p in plugins if PluginRegistry._is_valid(p)]:
+                name = PluginRegistry.normalize_name(plugin.get_name())
+                index = self._indices.get(name) if replace else None
+
+                if index is not None:
+                    existing = self._plugins[index]
+                    self._plugins[index] = plugin.replacing(existing) if isinstance(plugin, _LazyPlugin) else plugin
+                else:
+                    self._indices.setdefault(name, len(self._plugins))
+                    self._plugins.append(plugin)
         return self
 
-    def get_plugins(self) -> List[Type[Plugin]]:
-        return self._plugins
+    def get_plugins(self, type: PluginType=None) -> List[Plugin]:
+        """
+        Returns the registered plugins. HINT: This imports all installed plugins, to only import the required ones,
+        use find.
 
-    def get_language_config_plugins(self) -> List[Type[Plugin]]:
-        return self._get_plugins_by_type(PluginType.LANGUAGE_CONFIG)
+        :param type: If provided, only plugins of this type are returned, defaults to None
+        :type type:  PluginType, optional
 
-    def get_distributor_plugins(self) -> List[Type[Plugin]]:
-        return self._get_plugins_by_type(PluginType.DISTRIBUTOR)
-    
-    def _get_plugins_by_type(self, type: PluginType):
-        return [plugin for plugin in self._plugins if plugin.get_type() == type]
+        :return: List of plugins.
+        :rtype:  List[Plugin]
+        """
+        with self._lock:
+            entries = list(self._plugins)
+        return PluginRegistry._load(entries, type)
+
+    def find(self, type: PluginType, names: List[str]) -> List[Plugin]:
+        """
+        Returns the plugins of the given type which match one of the provided names.
+
+        :param type:  Plugin type.
+        :type type:   PluginType
+        :param names: Possible plugin names.
+        :type names:  List[str]
+
+        :return: List of matching plugins (in registration order).
+        :rtype:  List[Plugin]
+        """
+        with self._lock:
+            indices = set(self._indices.get(PluginRegistry.normalize_name(name)) for name in names)
+            indices.discard(None)
+            entries = [self._plugins[index] for index in sorted(indices)]
+
+        # Only import the matching plugins (outside the lock, as importing might take a while).
+        return PluginRegistry._load(entries, type)
+
+    def _copy(self) -> PluginRegistry:
+        registry = PluginRegistry()
+
+        with self._lock:
+            registry._plugins = list(self._plugins)
+            registry._indices = dict(self._indices)
+        return registry
 
-    def _load_plugins(self):
+    @staticmethod
+    def _is_valid(plugin: Plugin | _LazyPlugin) -> bool:
+        # The type of lazy plugins is only known after loading them.
+        return isinstance(plugin, _LazyPlugin) or (plugin and plugin.get_type() != PluginType.UNKNOWN)
+
+    @staticmethod
+    def _load(entries: List[Plugin | _LazyPlugin], type: PluginType=None) -> List[Plugin]:
         plugins = []
 
-        for entry_point in [e for e in entry_points() if re.match('ninja(-|_)bear(-|_).+', e.group)]:
-            plugin_class = entry_point.load()
+        for entry in entries:
+            plugin = entry.load() if isinstance(entry, _LazyPlugin) else entry
+
+            if plugin and (type is None or plugin.get_type() == type):
+                plugins.append(plugin)
+        return plugins
+
+    @staticmethod
+    def _discover() -> List[_LazyPlugin]:
+        """
+        Discovers all installed plugins via their entry points (see PluginIndex). The plugins are not imported yet.
+
+        :return: List of installed plugins.
+        :rtype:  List[_LazyPlugin]
+        """
+        return [_LazyPlugin(entry_point) for entry_point in PluginIndex.entry_points()]
+
+
+class PluginManager:
+    def __init__(self, plugins: List[Plugin]=None) -> None:
+        # Caller-provided plugins overwrite the installed ones with the same name.
+        self._registry = PluginRegistry.default().overlay(plugins)
+
+    def add_plugins(self, plugins: List[Plugin], replace=True):
+        # Make sure the process-wide registry doesn't get modified.
+        if self._registry is PluginRegistry.default():
+            self._registry = self._registry._copy()
+        self._registry.add(plugins, replace)
+
+        return self
+
+    def get_plugins(self) -> List[Type[Plugin]]:
+        return self._registry.get_plugins()
+
+    def get_language_config_plugins(self) -> List[Type[Plugin]]:
+        return self._registry.get_plugins(PluginType.LANGUAGE_CONFIG)
+
+    def get_distributor_plugins(self) -> List[Type[Plugin]]:
+        return self._registry.get_plugins(PluginType.DISTRIBUTOR)
 
-            if plugin_class:
-                plugins.append(Plugin(entry_point.group, plugin_class))
-        self.add_plugins(plugins)
+    def find_plugins(self, type: PluginType, names: List[str]) -> List[Plugin]:
+        return self._registry.find(type, names)
@@ -1,9 +1,22 @@
 from __future__ import annotations
-import copy
-import random
 import re
-from typing import Callable, List
+import sys
+from typing import List
+from weakref import ref
 from .property_type import PropertyType
+from .number_expression import InvalidNumberExpressionException
+from .substitution_template import _SUBSTITUTION_PATTERN, SubstitutionTemplate
+
+_NAMING_PATTERN = r'^(_|[a-zA-Z])(\w|-)*$'  # Define a general naming pattern.
+_NAMING_REGEX = re.compile(_NAMING_PATTERN)
+_INTEGER_REGEX = re.compile(r'\d+')
+_FLOAT_REGEX = re.compile(r'\d+(\.\d+)?')
+_FALSE_STRINGS = frozenset(['0', 'false', 'no', 'off'])
+
+
+def _naming_regex(pattern: str) -> re.Pattern:
+    # The naming patterns of the Property class might be changed, so only use the precompiled regex for the default.
+    return _NAMING_REGEX if pattern is _NAMING_PATTERN else re.compile(pattern)
 
 
 class UnknownSubstitutionException(Exception):
@@ -27,8 +40,13 @@ class InvalidNamespaceException(Exception):
 
 
 class Property:
-    _PROPERTY_SUBSTITUTION_PATTERN = r'\${((_|[a-zA-Z])(\w|-)*((\.(_|[a-zA-Z])(\w|-)*))?)}'
-    _NAMING_PATTERN = r'^(_|[a-zA-Z])(\w|-)*$'  # Define a general naming pattern.
+    # Properties exist in large numbers (copied for each generator), so don't give them a __dict__.
+    __slots__ = (
+        'name', 'type', 'value', 'hidden', 'comment', 'namespace', '_template', '_template_value', '_owners',
+    )
+
+    _PROPERTY_SUBSTITUTION_PATTERN = _SUBSTITUTION_PATTERN
+    _NAMING_PATTERN = _NAMING_PATTERN
     _PROPERTY_NAME_PATTERN = _NAMING_PATTERN
     _NAMESPACE_NAME_PATTERN = _NAMING_PATTERN
 
@@ -46,6 +64,7 @@ class Property:
         hidden: bool = False,
         comment: str = None,
         namespace: str = None,
+        trusted: bool = False,
     ):
         """
         Constructor
@@ -64,32 +83,155 @@ class Property:
                               None to avoid collision with other properties with the same name (e.g., imported from
                               other files).
         :type namespace:      str, optional
+        :param trusted:       If True, the name and the namespace are expected to be valid (e.g., because they have
+                              been validated before) and are not checked again, defaults to False
+        :type trusted:        bool, optional
 
         :raises InvalidVariableNameException: Raised if an invalid variable name has been provided.
         :raises InvalidNamespaceException:    Raised if an invalid namespace has been provided.
         """
-        # Check if the key is a valid variable name.
-        if not re.match(Property._PROPERTY_NAME_PATTERN, name):
-            raise InvalidVariableNameException(name)
-        
-        # Check if the key is a valid variable name.
-        if namespace and not re.match(Property._NAMESPACE_NAME_PATTERN, namespace):
-            raise InvalidNamespaceException(namespace)
-        
+        if not trusted:
+            # Check if the key is a valid variable name.
+            if not _naming_regex(Property._PROPERTY_NAME_PATTERN).match(name):
+                raise InvalidVariableNameException(name)
+
+            # Check if the namespace is a valid variable name.
+            Property._validate_namespace(namespace)
+
         # Make sure that the provided value is valid even if it's a string.
         value = Property._convert_value(value, property_type)
-        
-        self.name = name
-        self.type = property_type
-        self.value = value
-        self.hidden = hidden
-        self.comment = comment
-        self.namespace = namespace
+
+        # Initializing a property is not a modification, so bypass __setattr__.
+        set_attribute = object.__setattr__
+
+        # Names and namespaces are compared a lot (e.g., by substitutions) and namespaces repeat for each property of
+        # an included file, so intern them.
+        set_attribute(self, 'name', sys.intern(name))
+        set_attribute(self, 'type', property_type)
+        set_attribute(self, 'value', value)
+        set_attribute(self, 'hidden', hidden)
+        set_attribute(self, 'comment', comment)
+        set_attribute(self, 'namespace', sys.intern(namespace) if namespace else namespace)
+        set_attribute(self, '_template', None)
+        set_attribute(self, '_template_value', None)
+        set_attribute(self, '_owners', None)  # Weak references to the owners which get notified about changes.
+
+    def __setattr__(self, name: str, value: any):
+        object.__setattr__(self, name, value)
+        owners = getattr(self, '_owners', None)
+
+        # Only properties which have been added to a generator need to notify anybody. Private attributes (e.g., the
+        # cached template) don't change the property itself.
+        if owners and not name.startswith('_'):
+            for owner in owners:
+                owner = owner()
+
+                if owner is not None:
+                    owner._property_changed(self, name)
+
+    def __getstate__(self) -> dict:
+        # The owners only belong to this very property, so copies (e.g., by pickle or copy) must not notify them.
+        state = {slot: getattr(self, slot) for slot in Property.__slots__ if slot != '_owners'}
+
+        # Subclasses might not define slots.
+        if hasattr(self, '__dict__'):
+            state.update(self.__dict__)
+        return state
+
+    def __setstate__(self, state: dict):
+        # Restoring a property is not a modification, so bypass __setattr__.
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+        object.__setattr__(self, '_owners', None)
+
+    @property
+    def template(self) -> SubstitutionTemplate:
+        """
+        Returns the pre-parsed substitution template of the property value. The template gets cached on the property
+        and is only parsed again if the value changed.
+
+        :return: Substitution template or None if the value is not a string.
+        :rtype:  SubstitutionTemplate
+        """
+        value = self.value
+
+        if not isinstance(value, str):
+            return None
+        if self._template is None or self._template_value is not value:
+            self._template = SubstitutionTemplate.parse(value)
+            self._template_value = value
+        return self._template
+
+    def _copy(self) -> Property:
+        """
+        Creates a shallow copy of the property without running the validation again as the values of the
+        original have already been validated.
+
+        :return: Property copy.
+        :rtype:  Property
+        """
+        property_copy = object.__new__(type(self))
+
+        # Copying is not a modification, so bypass __setattr__. The copy doesn't belong to the owners of the original.
+        for slot in Property.__slots__:
+            object.__setattr__(property_copy, slot, getattr(self, slot) if slot != '_owners' else None)
+
+        # Subclasses might not define slots.
+        if hasattr(self, '__dict__'):
+            property_copy.__dict__.update(self.__dict__)
+        return property_copy
+
+    @staticmethod
+    def _unchecked(
+        name: str,
+        value: str | bool | int | float,
+        property_type: PropertyType,
+        hidden: bool,
+        comment: str,
+        namespace: str,
+    ) -> Property:
+        """
+        Creates a property from values which have already been validated and converted (e.g., by a PropertyTable)
+        without running the validation and the conversion again.
+
+        :return: New property.
+        :rtype:  Property
+        """
+        property = object.__new__(Property)
+        set_attribute = object.__setattr__  # Creating a property is not a modification, so bypass __setattr__.
+
+        set_attribute(property, 'name', name)
+        set_attribute(property, 'type', property_type)
+        set_attribute(property, 'value', value)
+        set_attribute(property, 'hidden', hidden)
+        set_attribute(property, 'comment', comment)
+        set_attribute(property, 'namespace', namespace)
+        set_attribute(property, '_template', None)
+        set_attribute(property, '_template_value', None)
+        set_attribute(property, '_owners', None)
+
+        return property
+
+    def _add_owner(self, owner: any) -> None:
+        """
+        Registers an owner (e.g., the property list of a generator) which gets notified about each in-place
+        modification of the property via its _property_changed method. The owner is only referenced weakly.
+
+        :param owner: Owner to notify.
+        :type owner:  any
+        """
+        owners = self._owners if self._owners else ()
+
+        if not any(existing() is owner for existing in owners):
+            # Drop owners which don't exist anymore.
+            owners = tuple(existing for existing in owners if existing() is not None) + (ref(owner),)
+            object.__setattr__(self, '_owners', owners)
 
     @staticmethod
     def substitute(property: Property, properties: List[Property]) -> None:
         """
-        Substitutes the referenced property references.
+        Substitutes the referenced property references. HINT: To substitute a whole property set, use the
+        SubstitutionResolver directly as it resolves each property only once.
 
         :param property:   Property which's value shall be updated.
         :type property:    Property
@@ -98,93 +240,48 @@ class Property:
 
         :raises UnknownSubstitutionException:   Raised if the requested substitution property does not exist.
         :raises RecursiveSubstitutionException: Raised if a property referenced itself as substitution.
+        :raises CircularSubstitutionException:  Raised if properties reference each other in a circle.
         """
-        # Copy properties to avoid messing around with the originals.
-        properties_copy = copy.deepcopy(properties)
-
-        def replace(match, _: Property):
-
-            def add_namespace(property_name, namespace):
-                return f'{namespace}.{property_name}'
-
-            # Incorporate namespace into property name.
-            def prepared_property_name(propertyTemp):
-                return add_namespace(propertyTemp.name, propertyTemp.namespace) \
-                    if propertyTemp.namespace else propertyTemp.name
-
-            substitution_property_value = match.group(1)  # E.g. myReplaceString or ti.myReplaceString.
-            property_name = prepared_property_name(property)
-            
-            if property.namespace:
-                substitution_property_value = add_namespace(substitution_property_value, property.namespace)
-            
-            # Substitute property only if it's not the same property as the one which is currently being processed.
-            if substitution_property_value != property_name:
-                found_properties = [
-                    search_property.value for search_property in properties_copy if
-                    prepared_property_name(search_property) == substitution_property_value
-                ]
-
-                if not found_properties:
-                    raise UnknownSubstitutionException(substitution_property_value)
-                replacement = found_properties[0]
-            else:
-                # TODO: Handle indirect self reference.
-                raise RecursiveSubstitutionException(
-                    f'Property {property_name} must not reference itself!'
-                )
-            return f'{replacement}'
-        
-        original_value = property.value
-        Property._replace_property_value(property, replace)
-
-        # Check if value changed due to substitution.
-        if property.value != original_value:
-            # IF type is some kind of number or boolean, evaluate the new string and assign the result to the
-            # current property.
-            if property.type in [PropertyType.INT, PropertyType.FLOAT, PropertyType.DOUBLE, PropertyType.BOOL]:
-                property.value = Property._convert_value(eval(property.value), property.type)
+        from .substitution_resolver import SubstitutionResolver  # Imported here to avoid circular imports.
+
+        property.value = SubstitutionResolver(properties).resolve_property(property)
+
+    @staticmethod
+    def _validate_namespace(namespace: str) -> None:
+        """
+        Checks if the provided namespace is valid.
+
+        :param namespace: Namespace to check. None or empty namespaces are valid.
+        :type namespace:  str
+
+        :raises InvalidNamespaceException: Raised if an invalid namespace has been provided.
+        """
+        if namespace and not _naming_regex(Property._NAMESPACE_NAME_PATTERN).match(namespace):
+            raise InvalidNamespaceException(namespace)
 
     @staticmethod
     def _convert_value(value: any, property_type: PropertyType) -> any:
         if isinstance(value, str):
             if property_type == PropertyType.BOOL:
                 # Correct boolean property value to 'true' or 'false'.
-                value = False if value.lower() in ['0', 'false', 'no', 'off'] else True
+                value = value.lower() not in _FALSE_STRINGS
             elif property_type == PropertyType.INT:
                 # If numbers can be substituted validly and produce another number, keep it as string.
                 if not Property._is_valid_number_substitution(value):
-                    match = re.match(r'\d+', value)
+                    match = _INTEGER_REGEX.match(value)
                     value = int(match.group(0)) if match else 0  # Remove everything that comes after the integer.
             elif property_type == PropertyType.FLOAT or property_type == PropertyType.DOUBLE:
                 # If numbers can be substituted validly and produce another number, keep it as string.
                 if not Property._is_valid_number_substitution(value):
-                    match = re.match(r'\d+(\.\d+)?', value)
+                    match = _FLOAT_REGEX.match(value)
                     value = float(match.group(0)) if match else 0  # Remove everything that comes after the float.
         return value
 
-    @staticmethod
-    def _replace_property_value(property: Property, callout: Callable[[re.Match, Property], str]) -> None:
-        """
-        Replaces the substitution strings of a property value by using the provided callout function.
-
-        :param property: Property of which the value shall be be processed.
-        :type property:  Property
-        :param callout:  Callout function to which the RegEx match is passed. It must return a replacement string.
-        :type callout:   Callable[[re.Match], str]
-        """
-        def callout_wrapper(match: re.Match) -> str:
-            return callout(match, property)
-
-        if isinstance(property.value, str):
-            # Replace all occurrences.
-            property.value = re.sub(Property._PROPERTY_SUBSTITUTION_PATTERN, callout_wrapper, property.value)
-
     @staticmethod
     def _is_valid_number_substitution(value: any) -> bool:
         """
-        Checks if the provided value can be converted to a number value if all referenced substitution values get
-        replaced by random integers.
+        Checks if the provided value is a valid number expression, which means that it would result in a number if
+        all referenced substitution values get replaced by numbers.
 
         :param value: Value to check.
         :type  value: any
@@ -195,18 +292,10 @@ class Property:
         valid = False
 
         if isinstance(value, str):
-            pseudo_property = Property('p', value, PropertyType.STRING)
-
-            # Substitute with pseudo data.
-            def replace(*_):
-                random_number = random.randint(1, 10)
-                return f'{random_number}'
-            Property._replace_property_value(pseudo_property, replace)
-
             try:
-                eval(pseudo_property.value)
+                SubstitutionTemplate.parse(value).number_expression()
                 valid = True
-            except Exception:
+            except InvalidNumberExpressionException:
                 # Nothing to do here, value was invalid.
                 pass
         return valid
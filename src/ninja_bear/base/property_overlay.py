@@ -0,0 +1,114 @@
+from __future__ import annotations
+from typing import Callable, Dict, Iterator, List
+
+from .property import Property
+
+
+class PropertyOverlay:
+    """
+    Copy-on-write view over a list of properties. A property only gets copied when one of its attributes actually
+    changes (e.g., by a transformer, a substitution or a rename). Unchanged properties are shared with the original
+    list, so they must not be modified directly. Use copy_all before handing the properties to code which might
+    modify them.
+    """
+
+    def __init__(self, properties: List[Property]):
+        """
+        Constructor
+
+        :param properties: Original properties.
+        :type properties:  List[Property]
+        """
+        self._properties = list(properties)
+        self._copies: Dict[int, Property] = {}  # Copies owned by the overlay (keeps them alive to keep the IDs unique).
+
+    def __len__(self) -> int:
+        return len(self._properties)
+
+    def __getitem__(self, index: int) -> Property:
+        return self._properties[index]
+
+    def __iter__(self) -> Iterator[Property]:
+        return iter(self._properties)
+
+    def update(self, index: int, **changes) -> Property:
+        """
+        Updates the attributes of the property at the provided index. If at least one attribute changes and the
+        property is still an original, it gets copied first.
+
+        :param index: Index of the property to update.
+        :type index:  int
+
+        :return: The updated property (or the original one if nothing changed).
+        :rtype:  Property
+        """
+        property = self._properties[index]
+        changes = {
+            key: value for key, value in changes.items() if not PropertyOverlay._equals(getattr(property, key), value)
+        }
+
+        if changes:
+            # Copy the property if it hasn't been copied yet.
+            if id(property) not in self._copies:
+                property = property._copy()
+                self._properties[index] = property
+                self._copies[id(property)] = property
+
+            # The copy is owned by the overlay, so updating it is not an in-place modification of a property (see
+            # Property.__setattr__).
+            for key, value in changes.items():
+                object.__setattr__(property, key, value)
+        return property
+
+    def copy_all(self) -> PropertyOverlay:
+        """
+        Copies all properties which are still originals. Afterwards, the properties of the overlay can be handed to
+        code which might modify them directly (e.g., transformer scripts) without affecting the originals.
+
+        :return: The current overlay instance.
+        :rtype:  PropertyOverlay
+        """
+        copies = self._copies
+
+        for index, property in enumerate(self._properties):
+            if id(property) not in copies:
+                property = property._copy()
+                self._properties[index] = property
+                copies[id(property)] = property
+        return self
+
+    def filter(self, predicate: Callable[[Property], bool]) -> PropertyOverlay:
+        """
+        Removes all properties which don't match the predicate.
+
+        :param predicate: Function which decides if a property shall be kept.
+        :type predicate:  Callable[[Property], bool]
+
+        :return: The current overlay instance.
+        :rtype:  PropertyOverlay
+        """
+        self._properties = [property for property in self._properties if predicate(property)]
+        return self
+
+    def copied_count(self) -> int:
+        """
+        Returns how many properties have been copied so far.
+
+        :return: Number of copies.
+        :rtype:  int
+        """
+        return len(self._copies)
+
+    def to_list(self) -> List[Property]:
+        """
+        Returns the current properties as list.
+
+        :return: List of properties.
+        :rtype:  List[Property]
+        """
+        return list(self._properties)
+
+    @staticmethod
+    def _equals(a: any, b: any) -> bool:
+        # Compare types as well, otherwise e.g. True and 1 would be considered the same.
+        return a is b or (type(a) is type(b) and a == b)
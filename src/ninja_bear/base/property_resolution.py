@@ -0,0 +1,56 @@
+from __future__ import annotations
+import threading
+from typing import Callable, Dict, List, Tuple
+
+from .property import Property
+
+
+class PropertyResolution:
+    """
+    Shares resolved (transformed, substituted and filtered) property sets between generators. Generators which use
+    the same properties and the same transformer chain produce the same resolved properties, so they only need to
+    be resolved once. The resolved properties must not be modified by the generators.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple, Tuple[List[Property], List[Property]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple, properties: List[Property], resolve: Callable[[], List[Property]]) -> List[Property]:
+        """
+        Returns the resolved properties for the provided key. If they haven't been resolved yet, the resolve function
+        is called.
+
+        :param key:        Resolution key (see GeneratorBase.resolution_key).
+        :type key:         Tuple
+        :param properties: Unresolved properties. They are kept alive as long as the entry exists to make sure the
+                           property IDs of the key don't get re-used.
+        :type properties:  List[Property]
+        :param resolve:    Function to resolve the properties.
+        :type resolve:     Callable[[], List[Property]]
+
+        :return: Resolved properties.
+        :rtype:  List[Property]
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (properties, resolve())
+            return self._entries[key][1]
+
+    def discard(self, key: Tuple) -> None:
+        """
+        Removes the resolved properties of the provided key (e.g., because the key has been superseded after the
+        properties changed). Nothing happens if no entry exists for the key.
+
+        :param key: Resolution key (see GeneratorBase.resolution_key).
+        :type key:  Tuple
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes all resolved property sets.
+        """
+        with self._lock:
+            self._entries.clear()
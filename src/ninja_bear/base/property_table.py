@@ -0,0 +1,229 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Sequence
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List
+
+from .name_converter import NameConverter, NamingConventionType
+from .property import Property
+from .property_type import PropertyType
+
+# NumPy is optional. If it's available, the columns are stored as NumPy arrays and the bulk operations are vectorized.
+try:
+    import numpy
+except ModuleNotFoundError:
+    numpy = None
+
+# Property types are stored as small integer codes.
+_TYPES = list(PropertyType)
+_TYPE_CODES = {type: code for code, type in enumerate(_TYPES)}
+
+
+class PropertyTable(Sequence):
+    """
+    Column-wise view of the resolved properties which generators can receive in DumpInfo instead of a list (see
+    GeneratorBase._use_property_table). Names, namespaces, types, hidden flags, values and comments are stored in
+    parallel columns and bulk operations (e.g., converting names or grouping by type) work on whole columns. The
+    table gets built from the resolved properties on each dump, so it doesn't replace the property objects but is
+    created in addition to them. The table is immutable and behaves like a sequence of properties. The properties get
+    created on access, so changing them doesn't change the table.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        values: Sequence[str | bool | int | float],
+        types: Sequence[int],
+        hidden: Sequence[bool],
+        comments: Sequence[str],
+        namespaces: Sequence[str],
+    ):
+        """
+        Constructor. Use PropertyTable.from_properties to create a table from properties.
+
+        :param names:      Property names.
+        :type names:       Sequence[str]
+        :param values:     Property values.
+        :type values:      Sequence[str | bool | int | float]
+        :param types:      Property type codes.
+        :type types:       Sequence[int]
+        :param hidden:     Hidden flags.
+        :type hidden:      Sequence[bool]
+        :param comments:   Property comments.
+        :type comments:    Sequence[str]
+        :param namespaces: Property namespaces.
+        :type namespaces:  Sequence[str]
+        """
+        self._names = names
+        self._values = values
+        self._types = types
+        self._hidden = hidden
+        self._comments = comments
+        self._namespaces = namespaces
+
+    @staticmethod
+    def from_properties(properties: Iterable[Property]) -> PropertyTable:
+        """
+        Creates a table from the provided properties.
+
+        :param properties: Properties to store.
+        :type properties:  Iterable[Property]
+
+        :return: Property table.
+        :rtype:  PropertyTable
+        """
+        names = []
+        values = []
+        types = array('b')
+        hidden = []
+        comments = []
+        namespaces = []
+
+        for property in properties:
+            names.append(property.name)
+            values.append(property.value)
+            types.append(_TYPE_CODES[property.type])
+            hidden.append(bool(property.hidden))
+            comments.append(property.comment)
+            namespaces.append(property.namespace)
+
+        if numpy:
+            return PropertyTable(
+                PropertyTable._object_array(names),
+                PropertyTable._object_array(values),
+                numpy.frombuffer(types, dtype=numpy.int8).copy(),
+                numpy.array(hidden, dtype=bool),
+                PropertyTable._object_array(comments),
+                PropertyTable._object_array(namespaces),
+            )
+        return PropertyTable(names, values, types, hidden, comments, namespaces)
+
+    @property
+    def names(self) -> Sequence[str]:
+        return self._names
+
+    @property
+    def values(self) -> Sequence[str | bool | int | float]:
+        return self._values
+
+    @property
+    def namespaces(self) -> Sequence[str]:
+        return self._namespaces
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, index: int | slice) -> Property | PropertyTable:
+        if isinstance(index, slice):
+            return PropertyTable(*(column[index] for column in self._columns()))
+        return self._property(index)
+
+    def __iter__(self) -> Iterator[Property]:
+        for i in range(len(self)):
+            yield self._property(i)
+
+    def type_of(self, index: int) -> PropertyType:
+        """
+        Returns the type of the property at the provided index without creating the property.
+
+        :param index: Property index.
+        :type index:  int
+
+        :return: Property type.
+        :rtype:  PropertyType
+        """
+        return _TYPES[self._types[index]]
+
+    def group_by_type(self) -> Dict[PropertyType, PropertyTable]:
+        """
+        Groups the properties by their type (e.g., to generate one lookup table per type). The properties keep their
+        order within each group.
+
+        :return: Tables per property type (in the order of PropertyType, types without properties are left out).
+        :rtype:  Dict[PropertyType, PropertyTable]
+        """
+        groups = {}
+
+        for code in numpy.unique(self._types).tolist() if numpy else sorted(set(self._types)):
+            groups[_TYPES[code]] = self._select(
+                self._types == code if numpy else [type_code == code for type_code in self._types]
+            )
+        return groups
+
+    def with_names(self, names: Sequence[str]) -> PropertyTable:
+        """
+        Returns a table with the provided names (e.g., converted names).
+
+        :param names: New names in the same order as the properties.
+        :type names:  Sequence[str]
+
+        :return: Table with replaced names.
+        :rtype:  PropertyTable
+        """
+        if len(names) != len(self):
+            raise ValueError(f'Expected {len(self)} names but got {len(names)}')
+        names = PropertyTable._object_array(names) if numpy else list(names)
+        return PropertyTable(names, self._values, self._types, self._hidden, self._comments, self._namespaces)
+
+    def convert_names(self, type: NamingConventionType) -> PropertyTable:
+        """
+        Returns a table with the names converted to the provided naming convention. Each distinct name is only
+        converted once.
+
+        :param type: Naming convention to use.
+        :type type:  NamingConventionType
+
+        :raises UnknownNamingConventionException: Raised if an unknown naming convention type is used.
+
+        :return: Table with converted names.
+        :rtype:  PropertyTable
+        """
+        if numpy and len(self):
+            unique_names, inverse = numpy.unique(self._names, return_inverse=True)
+            names = PropertyTable._object_array(NameConverter.convert_many(unique_names.tolist(), type))[inverse]
+        else:
+            names = NameConverter.convert_many(list(self._names), type)
+        return self.with_names(names)
+
+    def to_list(self) -> List[Property]:
+        """
+        Creates the properties of all rows.
+
+        :return: List of properties.
+        :rtype:  List[Property]
+        """
+        return list(self)
+
+    def _columns(self) -> tuple:
+        return self._names, self._values, self._types, self._hidden, self._comments, self._namespaces
+
+    def _property(self, index: int) -> Property:
+        return Property._unchecked(
+            self._names[index],
+            self._values[index],
+            _TYPES[self._types[index]],
+            bool(self._hidden[index]),
+            self._comments[index],
+            self._namespaces[index],
+        )
+
+    def _select(self, mask: Sequence[bool]) -> PropertyTable:
+        if numpy:
+            return PropertyTable(*(column[mask] for column in self._columns()))
+
+        names, values, types, hidden, comments, namespaces = self._columns()
+        return PropertyTable(
+            list(compress(names, mask)),
+            list(compress(values, mask)),
+            array('b', compress(types, mask)),
+            list(compress(hidden, mask)),
+            list(compress(comments, mask)),
+            list(compress(namespaces, mask)),
+        )
+
+    @staticmethod
+    def _object_array(items: Sequence[any]) -> any:
+        # Assign the items instead of passing them to numpy.array to prevent NumPy from converting them.
+        column = numpy.empty(len(items), dtype=object)
+        column[:] = items
+        return column
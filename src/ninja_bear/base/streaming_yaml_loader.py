@@ -0,0 +1,128 @@
+from __future__ import annotations
+from typing import Callable, IO
+
+from yaml.composer import Composer, ComposerError
+from yaml.constructor import SafeConstructor
+from yaml.events import SequenceEndEvent, SequenceStartEvent
+from yaml.nodes import Node, ScalarNode, SequenceNode
+from yaml.parser import Parser
+from yaml.reader import Reader
+from yaml.resolver import Resolver
+from yaml.scanner import Scanner
+
+# Use the libyaml based parser if PyYAML has been built with it as it's much faster than the pure Python one.
+try:
+    from yaml.cyaml import CParser
+except ImportError:
+    CParser = None
+
+_Consumer = Callable[[int, object], None]
+
+
+class _StreamingComposer(Composer):
+    """
+    Composer which hands the items of the sequence of a top-level mapping key to a consumer as soon as they have been
+    composed instead of adding them to the document tree. The sequence itself ends up empty.
+    """
+
+    def __init__(self, key: str, consume: _Consumer):
+        Composer.__init__(self)
+        self._key = key
+        self._consume = consume
+        self._depth = 0
+
+    def compose_node(self, parent: Node, index: Node | int) -> Node:
+        # Mapping values get composed with the key node as index.
+        if self._depth == 1 and isinstance(index, ScalarNode) and index.value == self._key and (
+            self.check_event(SequenceStartEvent)
+        ):
+            return self._compose_streamed_sequence_node()
+
+        self._depth += 1
+        try:
+            return Composer.compose_node(self, parent, index)
+        finally:
+            self._depth -= 1
+
+    def _compose_streamed_sequence_node(self) -> SequenceNode:
+        start_event = self.get_event()
+        anchor = start_event.anchor
+        tag = start_event.tag
+
+        if tag is None or tag == '!':
+            tag = self.resolve(SequenceNode, None, start_event.implicit)
+        node = SequenceNode(tag, [], start_event.start_mark, None, flow_style=start_event.flow_style)
+
+        if anchor is not None:
+            if anchor in self.anchors:
+                raise ComposerError(
+                    f'found duplicate anchor {anchor!r}; first occurrence', self.anchors[anchor].start_mark,
+                    'second occurrence', start_event.start_mark,
+                )
+            self.anchors[anchor] = node
+        index = 0
+
+        self._depth += 1
+        try:
+            while not self.check_event(SequenceEndEvent):
+                # Construct and hand over each item right away, so its node can be freed before the next one is read.
+                self._consume(index, self.construct_document(self.compose_node(node, index)))
+                index += 1
+        finally:
+            self._depth -= 1
+
+        node.end_mark = self.get_event().end_mark
+        return node
+
+
+if CParser:
+    class _Loader(CParser, _StreamingComposer, SafeConstructor, Resolver):
+        # The libyaml parser composes the document in C, use the Python composer to hook into the composition.
+        get_single_node = Composer.get_single_node
+
+        def __init__(self, stream: IO | bytes | str, key: str, consume: _Consumer):
+            CParser.__init__(self, stream)
+            _StreamingComposer.__init__(self, key, consume)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+else:
+    class _Loader(Reader, Scanner, Parser, _StreamingComposer, SafeConstructor, Resolver):
+        def __init__(self, stream: IO | bytes | str, key: str, consume: _Consumer):
+            Reader.__init__(self, stream)
+            Scanner.__init__(self)
+            Parser.__init__(self)
+            _StreamingComposer.__init__(self, key, consume)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+
+class StreamingYamlLoader:
+    """
+    Loads a YAML document like yaml.safe_load, but passes the items of a top-level sequence (e.g., the config
+    properties) to a consumer one by one. This way, huge sequences never exist as a whole, neither as YAML nodes nor as
+    Python objects.
+    """
+
+    @staticmethod
+    def load(stream: IO | bytes | str, key: str, consume: Callable[[int, object], None]) -> object:
+        """
+        Loads a single YAML document.
+
+        :param stream:  YAML string, bytes or a binary stream (e.g., a memory-mapped file) to load the document from.
+        :type stream:   IO | bytes | str
+        :param key:     Top-level key whose sequence items get streamed.
+        :type key:      str
+        :param consume: Called with the index and the constructed object of each item of the streamed sequence.
+        :type consume:  Callable[[int, object], None]
+
+        :raises yaml.YAMLError: Raised if the stream does not contain valid YAML.
+
+        :return: Loaded document. If the key maps to a sequence, the sequence is empty.
+        :rtype:  object
+        """
+        loader = _Loader(stream, key, consume)
+
+        try:
+            return loader.get_single_data()
+        finally:
+            loader.dispose()
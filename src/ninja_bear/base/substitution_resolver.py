@@ -0,0 +1,186 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple
+
+from .property import Property, RecursiveSubstitutionException, UnknownSubstitutionException
+from .property_type import PropertyType
+
+
+class CircularSubstitutionException(Exception):
+    def __init__(self, substitution_chain: List[str]):
+        super().__init__(f'Circular substitution detected ({" -> ".join(substitution_chain)})')
+
+
+class SubstitutionResolver:
+    """
+    Resolves the property value substitutions (e.g., ${myString}) of a whole property set at once. All properties
+    get indexed by their (namespace, name) key and the references between them get collected as a graph. The values
+    are then resolved in topological order, which means that each referenced property is resolved before the
+    property that references it. Direct and indirect self-references (e.g., A -> B -> A) are reported as errors.
+    """
+
+    def __init__(self, properties: List[Property]):
+        """
+        Constructor
+
+        :param properties: List of properties to get the substitution values from.
+        :type properties:  List[Property]
+        """
+        self._properties = properties
+        self._index: Dict[Tuple[str, str], Property] = {}
+        self._dependencies: Dict[int, List[Property]] = {}
+        self._values: Dict[int, any] = {}
+
+        for property in properties:
+            # If several properties share the same key, the first one wins.
+            self._index.setdefault(SubstitutionResolver._key(property.namespace, property.name), property)
+
+    def resolve(self) -> List[any]:
+        """
+        Resolves the values of all properties. The properties themselves are not modified.
+
+        :raises UnknownSubstitutionException:   Raised if a requested substitution property does not exist.
+        :raises RecursiveSubstitutionException: Raised if a property referenced itself as substitution.
+        :raises CircularSubstitutionException:  Raised if properties reference each other in a circle.
+
+        :return: Resolved values in the same order as the properties.
+        :rtype:  List[any]
+        """
+        return [self.resolve_property(property) for property in self._properties]
+
+    def resolve_property(self, property: Property) -> any:
+        """
+        Resolves the value of a single property. All properties it depends on get resolved as well.
+
+        :param property: Property which's value shall be resolved.
+        :type property:  Property
+
+        :raises UnknownSubstitutionException:   Raised if a requested substitution property does not exist.
+        :raises RecursiveSubstitutionException: Raised if a property referenced itself as substitution.
+        :raises CircularSubstitutionException:  Raised if properties reference each other in a circle.
+
+        :return: Resolved property value.
+        :rtype:  any
+        """
+        if id(property) not in self._values:
+            # Walk the reference graph iteratively (depth-first) to not run into the recursion limit on long
+            # reference chains. A property gets resolved as soon as all of its dependencies are resolved.
+            stack = [(property, iter(self._get_dependencies(property)))]
+            visiting = {id(property)}
+
+            while stack:
+                current, dependencies = stack[-1]
+
+                for dependency in dependencies:
+                    if id(dependency) in self._values:
+                        continue
+                    if id(dependency) in visiting:
+                        chain = [p for p, _ in stack]
+                        chain = chain[chain.index(dependency):] + [dependency]
+
+                        raise CircularSubstitutionException([SubstitutionResolver._full_name(p) for p in chain])
+
+                    visiting.add(id(dependency))
+                    stack.append((dependency, iter(self._get_dependencies(dependency))))
+                    break
+                else:
+                    stack.pop()
+                    visiting.discard(id(current))
+                    self._values[id(current)] = self._substitute(current)
+
+        return self._values[id(property)]
+
+    def _get_dependencies(self, property: Property) -> List[Property]:
+        """
+        Evaluates which properties are referenced by the provided property.
+
+        :param property: Property to evaluate the references for.
+        :type property:  Property
+
+        :raises UnknownSubstitutionException:   Raised if a requested substitution property does not exist.
+        :raises RecursiveSubstitutionException: Raised if a property referenced itself as substitution.
+
+        :return: Referenced properties.
+        :rtype:  List[Property]
+        """
+        key = id(property)
+
+        if key not in self._dependencies:
+            dependencies = []
+
+            for reference in SubstitutionResolver._references(property):
+                dependencies.append(self._lookup(property, reference))
+            self._dependencies[key] = dependencies
+
+        return self._dependencies[key]
+
+    def _lookup(self, property: Property, reference: str) -> Property:
+        """
+        Looks up a referenced property. References are always relative to the namespace of the referencing property.
+
+        :param property:  Referencing property.
+        :type property:   Property
+        :param reference: Reference string (e.g. myReplaceString or ti.myReplaceString).
+        :type reference:  str
+
+        :raises UnknownSubstitutionException:   Raised if the requested substitution property does not exist.
+        :raises RecursiveSubstitutionException: Raised if a property referenced itself as substitution.
+
+        :return: Referenced property.
+        :rtype:  Property
+        """
+        namespace = property.namespace if property.namespace else None
+        full_reference = f'{namespace}.{reference}' if namespace else reference
+
+        if namespace:
+            # Namespaces cannot be nested, therefore a qualified reference within a namespace can never match.
+            key = SubstitutionResolver._key(namespace, reference) if '.' not in reference else None
+        else:
+            key = SubstitutionResolver._key(*reference.split('.')) if '.' in reference else \
+                SubstitutionResolver._key(None, reference)
+
+        if key == SubstitutionResolver._key(property.namespace, property.name):
+            raise RecursiveSubstitutionException(f'Property {full_reference} must not reference itself!')
+
+        found_property = self._index.get(key) if key else None
+
+        if not found_property:
+            raise UnknownSubstitutionException(full_reference)
+        return found_property
+
+    def _substitute(self, property: Property) -> any:
+        """
+        Substitutes the references of a property value by the already resolved values of the referenced properties.
+
+        :param property: Property which's value shall be substituted.
+        :type property:  Property
+
+        :return: Substituted value.
+        :rtype:  any
+        """
+        value = property.value
+        dependencies = self._get_dependencies(property)
+
+        if dependencies:
+            template = property.template
+            inputs = [self._values[id(dependency)] for dependency in dependencies]
+
+            # IF type is some kind of number or boolean, evaluate the compiled expression with the resolved inputs.
+            # Otherwise, just put the resolved values in place of the references.
+            if property.type in [PropertyType.INT, PropertyType.FLOAT, PropertyType.DOUBLE, PropertyType.BOOL]:
+                value = Property._convert_value(template.number_expression().evaluate(inputs), property.type)
+            else:
+                value = template.render([f'{input}' for input in inputs])
+        return value
+
+    @staticmethod
+    def _references(property: Property) -> Tuple[str, ...]:
+        template = property.template
+        return template.references if template else ()
+
+    @staticmethod
+    def _key(namespace: str, name: str) -> Tuple[str, str]:
+        return namespace if namespace else None, name
+
+    @staticmethod
+    def _full_name(property: Property) -> str:
+        return f'{property.namespace}.{property.name}' if property.namespace else property.name
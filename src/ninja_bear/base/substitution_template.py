@@ -0,0 +1,116 @@
+from __future__ import annotations
+from functools import lru_cache
+import re
+from typing import List, Tuple
+
+from .number_expression import InvalidNumberExpressionException, NumberExpression
+
+_SUBSTITUTION_MARKER = '${'
+_SUBSTITUTION_PATTERN = r'\${((_|[a-zA-Z])(\w|-)*((\.(_|[a-zA-Z])(\w|-)*))?)}'
+_SUBSTITUTION_REGEX = re.compile(_SUBSTITUTION_PATTERN)
+
+
+class SubstitutionTemplate:
+    """
+    Pre-parsed representation of a property value which might contain substitutions (e.g., ${myString}). The value
+    gets split into literal and reference segments once so it can be rendered over and over again without any
+    further RegEx processing.
+    """
+
+    def __init__(self, literals: Tuple[str, ...], references: Tuple[str, ...]):
+        """
+        Constructor
+
+        :param literals:   Literal segments. There's always one more literal than references (surrounding the
+                           references).
+        :type literals:    Tuple[str, ...]
+        :param references: Reference segments (e.g. myString or ti.myString).
+        :type references:  Tuple[str, ...]
+        """
+        self.literals = literals
+        self.references = references
+        self._number_expression: NumberExpression = None
+        self._number_expression_error: InvalidNumberExpressionException = None
+
+    @staticmethod
+    def parse(value: str) -> SubstitutionTemplate:
+        """
+        Tokenizes a value into literal and reference segments. The results are cached, so parsing the same value
+        again is cheap.
+
+        :param value: Value to parse.
+        :type value:  str
+
+        :return: Parsed template.
+        :rtype:  SubstitutionTemplate
+        """
+        # Values without substitution marker don't need any RegEx processing.
+        if _SUBSTITUTION_MARKER not in value:
+            return SubstitutionTemplate((value,), ())
+        return _parse_cached(value)
+
+    def has_references(self) -> bool:
+        """
+        Returns if the template contains any references.
+
+        :return: True if the template contains references.
+        :rtype:  bool
+        """
+        return len(self.references) > 0
+
+    def number_expression(self) -> NumberExpression:
+        """
+        Returns the template compiled as number expression (e.g., ${myInteger} * ${myFloat}). The expression gets
+        compiled only once and is cached on the template.
+
+        :raises InvalidNumberExpressionException: Raised if the template is not a valid number expression.
+
+        :return: Compiled number expression.
+        :rtype:  NumberExpression
+        """
+        if not self._number_expression and not self._number_expression_error:
+            try:
+                self._number_expression = NumberExpression.compile(self.literals)
+            except InvalidNumberExpressionException as e:
+                self._number_expression_error = e
+
+        if self._number_expression_error:
+            raise self._number_expression_error
+        return self._number_expression
+
+    def render(self, replacements: List[str]) -> str:
+        """
+        Renders the template by putting the provided replacements in place of the references.
+
+        :param replacements: Replacement strings in the same order as the references.
+        :type replacements:  List[str]
+
+        :return: Rendered string.
+        :rtype:  str
+        """
+        literals = self.literals
+
+        if not self.references:
+            return literals[0]
+
+        parts = [literals[0]]
+
+        for replacement, literal in zip(replacements, literals[1:]):
+            parts.append(replacement)
+            parts.append(literal)
+        return ''.join(parts)
+
+
+@lru_cache(maxsize=2 ** 16)
+def _parse_cached(value: str) -> SubstitutionTemplate:
+    literals = []
+    references = []
+    position = 0
+
+    for match in _SUBSTITUTION_REGEX.finditer(value):
+        literals.append(value[position:match.start()])
+        references.append(match.group(1))
+        position = match.end()
+    literals.append(value[position:])
+
+    return SubstitutionTemplate(tuple(literals), tuple(references))
@@ -0,0 +1,42 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Transformer:
+    """
+    Encapsulates a user defined transformer script.
+    """
+    script: str
+    """
+    Python script to transform property values. To reflect changes to the outside of the script, the value variable
+    (or the values list for batch transformers) must be modified.
+    """
+    batch: bool = False
+    """
+    If False, the script runs once per property and has access to the following variables.
+    - name: Property name.
+    - value: Property value.
+    - type: Property type value (see values PropertyType).
+    - properties: List of all properties (must not be modified).
+
+    If True, the script runs only once for all properties and has access to the following variables.
+    - names: List of all property names.
+    - values: List of all property values (same order as names).
+    - types: List of all property type values (same order as names).
+    - properties: List of all properties (must not be modified).
+    """
+
+    @staticmethod
+    def from_definition(definition: str | Transformer) -> Transformer:
+        """
+        Turns a transformer definition into a Transformer instance. Plain strings are treated as per-property
+        transformer scripts.
+
+        :param definition: Transformer definition.
+        :type definition:  str | Transformer
+
+        :return: Transformer instance.
+        :rtype:  Transformer
+        """
+        return definition if isinstance(definition, Transformer) else Transformer(definition)
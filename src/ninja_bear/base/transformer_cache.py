@@ -0,0 +1,118 @@
+from __future__ import annotations
+import hashlib
+from importlib.util import MAGIC_NUMBER
+import marshal
+import os
+import threading
+from types import CodeType
+from typing import Dict
+
+_TRANSFORMER_FILE_NAME = '<transformer>'
+_CACHE_SUB_DIRECTORY = 'transformers'
+_CACHE_FILE_EXTENSION = 'bin'
+
+
+class TransformerCache:
+    """
+    Process-wide cache of compiled transformer scripts. Each script gets compiled only once per process into a code
+    object which is keyed by the hash of its source. Optionally, the compiled code objects can be persisted to disk
+    (see set_cache_dir) to let subsequent runs skip the compilation as well.
+    """
+    _code_objects: Dict[str, CodeType] = {}
+    _cache_dir: str = None
+
+    @staticmethod
+    def set_cache_dir(directory: str) -> None:
+        """
+        Enables the on-disk cache. The compiled transformers are stored in a subdirectory of the provided directory.
+
+        :param directory: Cache directory. If None or empty, the on-disk cache gets disabled.
+        :type directory:  str
+        """
+        TransformerCache._cache_dir = os.path.join(directory, _CACHE_SUB_DIRECTORY) if directory else None
+
+    @staticmethod
+    def compile(source: str) -> CodeType:
+        """
+        Returns the compiled code object of a transformer script. If the script has been compiled before, the cached
+        code object is returned.
+
+        :param source: Transformer script.
+        :type source:  str
+
+        :return: Compiled transformer script.
+        :rtype:  CodeType
+        """
+        key = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        code = TransformerCache._code_objects.get(key)
+
+        if not code:
+            code = TransformerCache._load(key)
+
+            if not code:
+                code = compile(source, _TRANSFORMER_FILE_NAME, 'exec')
+                TransformerCache._store(key, code)
+            TransformerCache._code_objects[key] = code
+        return code
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Clears the in-memory cache (the on-disk cache stays untouched).
+        """
+        TransformerCache._code_objects.clear()
+
+    @staticmethod
+    def _cache_file_path(key: str) -> str:
+        return os.path.join(TransformerCache._cache_dir, f'{key}.{_CACHE_FILE_EXTENSION}')
+
+    @staticmethod
+    def _load(key: str) -> CodeType:
+        """
+        Loads a compiled transformer from the on-disk cache (if enabled).
+
+        :param key: Transformer source hash.
+        :type key:  str
+
+        :return: Compiled transformer script or None if it's not cached.
+        :rtype:  CodeType
+        """
+        code = None
+
+        if TransformerCache._cache_dir:
+            try:
+                with open(TransformerCache._cache_file_path(key), 'rb') as f:
+                    data = f.read()
+
+                # Marshal data is only valid for the Python version it was created with.
+                if data.startswith(MAGIC_NUMBER):
+                    code = marshal.loads(data[len(MAGIC_NUMBER):])
+            except (OSError, EOFError, ValueError, TypeError):
+                # Nothing to do here, the transformer just gets compiled again.
+                pass
+        return code
+
+    @staticmethod
+    def _store(key: str, code: CodeType) -> None:
+        """
+        Stores a compiled transformer in the on-disk cache (if enabled).
+
+        :param key:  Transformer source hash.
+        :type key:   str
+        :param code: Compiled transformer script.
+        :type code:  CodeType
+        """
+        if TransformerCache._cache_dir:
+            path = TransformerCache._cache_file_path(key)
+            temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'  # Unique per process and thread.
+
+            try:
+                os.makedirs(TransformerCache._cache_dir, exist_ok=True)
+
+                # Write to a temporary file first to make sure other processes never read a half-written file.
+                with open(temp_path, 'wb') as f:
+                    f.write(MAGIC_NUMBER + marshal.dumps(code))
+                os.replace(temp_path, path)
+            except OSError:
+                # The cache is just an optimization, so don't fail if it can't be written.
+                pass
@@ -1,17 +1,29 @@
+from __future__ import annotations
 import argparse
 from os import path
-from typing import List
 
-from .base.orchestrator import Orchestrator
-from .base.distributor_credentials import DistributorCredentials
+# Keep the module imports light so that --help and argument errors return quickly. Everything which is needed to
+# actually generate the constants gets imported after the arguments have been parsed.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import List
+    from .base.distributor_credentials import DistributorCredentials
 
 _CONFIG_PARAMETER = 'config'
 _OUTPUT_PARAMETER = 'output'
 _SECRET_PARAMETER = 'secret'
 _DISTRIBUTE_PARAMETER = 'distribute'
+_CACHE_DIR_PARAMETER = 'cache_dir'
+_INCLUDE_WORKERS_PARAMETER = 'include_workers'
+_JOBS_PARAMETER = 'jobs'
+_COMMAND_PARAMETER = 'command'
+
+_REBUILD_PLUGIN_INDEX_COMMAND = 'rebuild-plugin-index'
 
 
 def _parse_credentials(credential_strings: List[str]) -> List[DistributorCredentials]:
+    from .base.distributor_credentials import DistributorCredentials
     credentials = []
 
     for credential_string in credential_strings if credential_strings else []:
@@ -31,28 +43,79 @@ def _parse_credentials(credential_strings: List[str]) -> List[DistributorCredent
     return credentials
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'{value} is not a positive integer')
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser()
 
-    parser.add_argument('-c', f'--{_CONFIG_PARAMETER}', help='Path to configuration file', required=True, type=str)
+    # The config is only required if no command is used, which is checked after parsing.
+    parser.add_argument('-c', f'--{_CONFIG_PARAMETER}', help='Path to configuration file', required=False, type=str)
     parser.add_argument('-o', f'--{_OUTPUT_PARAMETER}', help='Output location', required=False, type=str, default='.')
     parser.add_argument('-s', f'--{_SECRET_PARAMETER}',
         help='Credential for distributions in the form of <alias>=[<username>:]<password>',
         required=False, action='append')
     parser.add_argument('-d', f'--{_DISTRIBUTE_PARAMETER}',
         help='Distribute the generated constants to the specified locations', required=False, action='store_true')
+    parser.add_argument('--cache-dir', dest=_CACHE_DIR_PARAMETER,
+        help='Directory to cache parsed configs, compiled transformers and the plugin index in to speed up '
+             'subsequent runs',
+        required=False, type=str)
+    parser.add_argument('--include-workers', dest=_INCLUDE_WORKERS_PARAMETER,
+        help='Maximum number of threads to load included files with (1 loads them one after another)',
+        required=False, type=_positive_int)
+    parser.add_argument('-j', f'--{_JOBS_PARAMETER}',
+        help='Maximum number of language configs to generate and write concurrently', required=False,
+        type=_positive_int, default=1)
+
+    subparsers = parser.add_subparsers(dest=_COMMAND_PARAMETER)
+    rebuild_plugin_index_parser = subparsers.add_parser(_REBUILD_PLUGIN_INDEX_COMMAND,
+        help='Rebuild the index of installed plugins')
+    rebuild_plugin_index_parser.add_argument('--cache-dir', dest=_CACHE_DIR_PARAMETER,
+        help='Directory to store the plugin index in', required=True, type=str)
 
     args = parser.parse_args()
+    cache_dir = getattr(args, _CACHE_DIR_PARAMETER)
+
+    from .base.plugin_index import PluginIndex
+
+    if getattr(args, _COMMAND_PARAMETER) == _REBUILD_PLUGIN_INDEX_COMMAND:
+        PluginIndex.set_cache_dir(cache_dir)
+        print(f'Indexed {len(PluginIndex.rebuild())} plugin entry points')
+        return
+    elif not getattr(args, _CONFIG_PARAMETER):
+        parser.error(f'the following arguments are required: -c/--{_CONFIG_PARAMETER}')
 
     # TODO: Might also strip backslashes.
     output_dir = f'{str(getattr(args, _OUTPUT_PARAMETER)).strip("/")}/' if hasattr(args, _OUTPUT_PARAMETER) else ''
 
     if output_dir and not path.isdir(output_dir):
         raise Exception(f'Output directory {output_dir} does not exist')
-    
+
+    from .base.orchestrator import Orchestrator
+    from .base.transformer_cache import TransformerCache
+    from .base.parse_cache import ParseCache
+
+    if cache_dir:
+        TransformerCache.set_cache_dir(cache_dir)
+        ParseCache.set_cache_dir(cache_dir)
+        PluginIndex.set_cache_dir(cache_dir)
+
     credentials = _parse_credentials(getattr(args, _SECRET_PARAMETER) if hasattr(args, _SECRET_PARAMETER) else [])
-    config = Orchestrator.read_config(getattr(args, _CONFIG_PARAMETER), credentials)
-    config.write(output_dir)
+    config = Orchestrator.read_config(
+        getattr(args, _CONFIG_PARAMETER),
+        credentials,
+        include_workers=getattr(args, _INCLUDE_WORKERS_PARAMETER),
+    )
+    config.write(output_dir, jobs=getattr(args, _JOBS_PARAMETER))
 
     if getattr(args, _DISTRIBUTE_PARAMETER):
         config.distribute()
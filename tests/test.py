@@ -1,16 +1,66 @@
+import io
+import json
 from os import path
 import os
 import pathlib
+import pickle
 import shutil
-from typing import Dict, List, Type
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, Iterator, List, Type
 import unittest
+from unittest import mock
+import warnings
 
-from src.ninja_bear import GeneratorBase, PropertyType, NamingConventionType, DumpInfo, DistributeInfo, Plugin
+from importlib_metadata import EntryPoint
+import yaml
+from schema import SchemaError
+
+from src.ninja_bear import (
+    GeneratorBase,
+    Property,
+    PropertyType,
+    NamingConventionType,
+    DumpInfo,
+    DistributeInfo,
+    IncludeCache,
+    NameConverter,
+    Plugin,
+    PluginType,
+    Transformer,
+)
+from src.ninja_bear import cli
 from src.ninja_bear.base.orchestrator import Orchestrator
+from src.ninja_bear.base.config import AliasAlreadyInUseException, Config
+from src.ninja_bear.base.config_validator import ConfigValidationException
+from src.ninja_bear.base.generator_base import InvalidBatchTransformerResultException, PropertyAlreadyExistsException
 from src.ninja_bear.base.generator_configuration import GeneratorConfiguration
+from src.ninja_bear.base.info import VERSION
 from src.ninja_bear.base.language_config_base import LanguageConfigBase
+from src.ninja_bear.base.language_config_naming_conventions import LanguageConfigNamingConventions
 from src.ninja_bear.base.distributor_base import DistributorBase
 from src.ninja_bear.base.distributor_credentials import DistributorCredentials
+from src.ninja_bear.base.meta_data_settings import MetaDataSettings
+from src.ninja_bear.base.number_expression import InvalidNumberExpressionException, NumberExpression
+from src.ninja_bear.base.parse_cache import ParseCache
+from src.ninja_bear.base.plugin_index import PluginIndex
+from src.ninja_bear.base.plugin_manager import PluginManager, PluginRegistry
+from src.ninja_bear.base.property_overlay import PropertyOverlay
+from src.ninja_bear.base.property_resolution import PropertyResolution
+from src.ninja_bear.base import property_table
+from src.ninja_bear.base.property_table import PropertyTable
+from src.ninja_bear.base.property import (
+    InvalidNamespaceException,
+    InvalidVariableNameException,
+    RecursiveSubstitutionException,
+    UnknownSubstitutionException,
+)
+from src.ninja_bear.base.streaming_yaml_loader import StreamingYamlLoader
+from src.ninja_bear.base.substitution_resolver import CircularSubstitutionException, SubstitutionResolver
+from src.ninja_bear.base.substitution_template import SubstitutionTemplate
+from src.ninja_bear.base.transformer_cache import TransformerCache
 
 
 _COMPARE_FILE_CONTENT = """
@@ -25,6 +75,26 @@ struct TestConfig:
     string myCombinedString = 'I am telling you that this string got included from test-include.yaml.'
 """
 
+# Naming convention results (snake, screaming-snake, camel, pascal, kebap, dot, train) of several edge cases.
+_NAMING_CONVENTION_CORPUS = {
+    'myProperty': ['my_property', 'MY_PROPERTY', 'myProperty', 'MyProperty', 'my-property', 'my.property',
+                   'My-Property'],
+    'MyHTTPServer': ['my_httpserver', 'MY_HTTPSERVER', 'myHttpserver', 'MyHttpserver', 'my-httpserver',
+                     'my.httpserver', 'My-Httpserver'],
+    'MY-PROPERTY': ['my__property', 'MY__PROPERTY', 'myProperty', 'MyProperty', 'my-property', 'my.property',
+                    'My-Property'],
+    'my  property': ['my_property', 'MY_PROPERTY', 'myProperty', 'MyProperty', 'my-property', 'my.property',
+                     'My-Property'],
+    '_private': ['_private', '_PRIVATE', 'Private', 'Private', '-private', '.private', '-Private'],
+    'trailing_': ['trailing_', 'TRAILING_', 'trailing_', 'Trailing_', 'trailing-', 'trailing.', 'Trailing-'],
+    'a-_-b': ['a___b', 'A___B', 'aB', 'AB', 'a-b', 'a.b', 'A-B'],
+    'version2Name': ['version2_name', 'VERSION2_NAME', 'version2Name', 'Version2Name', 'version2-name',
+                     'version2.name', 'Version2-Name'],
+    'é_name': ['é_name', 'É_NAME', 'éName', 'ÉName', 'é-name', 'é.name', 'É-Name'],
+    'x': ['x', 'X', 'x', 'X', 'x', 'x', 'X'],
+    '': ['', '', '', '', '', '', ''],
+}
+
 
 class ExampleScriptGenerator(GeneratorBase):
     """
@@ -66,6 +136,28 @@ class ExampleScriptGenerator(GeneratorBase):
         return code
 
 
+class StreamingExampleScriptGenerator(ExampleScriptGenerator):
+    """
+    ExampleScript generator which only implements _dump_iter to create its output fragment by fragment.
+    """
+    _dump = GeneratorBase._dump
+
+    def _dump_iter(self, info: DumpInfo) -> Iterator[str]:
+        yield f'struct {info.type_name}:\n'
+
+        for property in info.properties:
+            yield f'{" " * info.indent}{property.name} = {property.value}\n'
+
+
+class TableExampleScriptGenerator(ExampleScriptGenerator):
+    """
+    ExampleScript generator which receives its properties as PropertyTable.
+    """
+
+    def _use_property_table(self) -> bool:
+        return True
+
+
 class ExampleScriptConfig(LanguageConfigBase):
     """
     ExampleScript specific config. For more information about the config methods, refer to LanguageConfigBase.
@@ -92,6 +184,16 @@ class ExampleDistributor(DistributorBase):
         return self
 
 
+class _PickledCall:
+    # Calls the function with the argument when it gets unpickled.
+    def __init__(self, function, argument):
+        self._function = function
+        self._argument = argument
+
+    def __reduce__(self):
+        return self._function, (self._argument,)
+
+
 class Test(unittest.TestCase):
     def __init__(self, methodName: str = "runTest") -> None:
         super().__init__(methodName)
@@ -115,6 +217,332 @@ class Test(unittest.TestCase):
 
         self._evaluate_configs(orchestrator.language_configs)
 
+    def test_read_formats(self):
+        with open(self._test_config_path, 'r') as f:
+            config = yaml.safe_load(f)
+
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = path.join(directory, 'test-config.json')
+            include_path = path.join(directory, 'test-include.toml')
+
+            # Include a TOML version of test-include.yaml from a JSON version of test-config.yaml.
+            config['includes'][0]['path'] = 'test-include.toml'
+            config.pop('meta')  # Remove meta data as it contains the current time.
+
+            with open(config_path, 'w') as f:
+                json.dump(config, f)
+            with open(include_path, 'w') as f:
+                f.write(
+                    '[[properties]]\n'
+                    'type = "string"\n'
+                    'name = "myIncludedString"\n'
+                    'value = "this string got included from test-include.yaml"\n'
+                )
+            orchestrator = Orchestrator.read_config(config_path, plugins=self._plugins)
+
+            # Make sure JSON and TOML parse results can be cached as well.
+            with tempfile.TemporaryDirectory() as cache_dir:
+                try:
+                    ParseCache.set_cache_dir(cache_dir)
+
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('error')
+                        Orchestrator.read_config(config_path, plugins=self._plugins)
+
+                    with mock.patch.object(Config, '_load_content') as load_content:
+                        cached_orchestrator = Orchestrator.read_config(config_path, plugins=self._plugins)
+                    self.assertEqual(load_content.call_count, 0)
+
+                    # Make sure data which can't be cached is reported.
+                    with self.assertWarnsRegex(RuntimeWarning, 'could not be cached'):
+                        ParseCache.put('enum', PropertyType.STRING)
+                finally:
+                    ParseCache.set_cache_dir(None)
+
+        for orchestrator in [orchestrator, cached_orchestrator]:
+            self._evaluate_configs(orchestrator.language_configs)
+            self.assertEqual(orchestrator.language_configs[0].dump().strip(), _COMPARE_FILE_CONTENT.strip())
+
+    def test_config_validator(self):
+        with open(self._test_config_path, 'r') as f:
+            config = yaml.safe_load(f)
+
+        validated = Config._validator().validate(config)
+        self.assertEqual(validated, Config._schema().validate(config))
+        self.assertEqual(validated['properties'][0]['type'], PropertyType.BOOL)
+
+        # Make sure errors name the failing key.
+        invalid_config = {'properties': [{'type': 'int', 'name': 'a', 'value': 1}, {'type': 'int', 'name': 'b'}]}
+
+        with self.assertRaises(ConfigValidationException) as context:
+            Config._validator().validate(invalid_config)
+        self.assertEqual(context.exception.path, ('properties', 1))
+        self.assertEqual(str(context.exception), 'properties[1]: Missing key: \'value\'')
+
+        with self.assertRaises(SchemaError) as context:
+            Config._validator().validate({'properties': [{'type': 'int', 'name': 'a', 'value': [1]}]})
+        self.assertTrue(str(context.exception).startswith('properties[0].value: '))
+
+        # Trusted input only gets converted.
+        trusted_config = {'properties': [{'type': 'int', 'name': 'a', 'value': 1, 'unchecked': True}]}
+        validated = Config._validator().validate(trusted_config, trusted=True)
+
+        self.assertEqual(validated['properties'][0]['type'], PropertyType.INT)
+        self.assertIsInstance(validated['properties'][0]['type'], PropertyType)
+
+    def test_streaming_yaml_loader(self):
+        content = (
+            'base: &base {type: int}\n'
+            'properties:\n'
+            '  - {<<: *base, name: a, value: 1}\n'
+            '  - &b {type: int, name: b, value: 2}\n'
+            'languages: []\n'
+            'nested: {properties: [*b]}\n'
+        )
+        items = []
+        loaded = StreamingYamlLoader.load(content, 'properties', lambda index, item: items.append((index, item)))
+
+        # Streamed items are handed over one by one and don't end up in the loaded document.
+        self.assertEqual(items, [
+            (0, {'type': 'int', 'name': 'a', 'value': 1}),
+            (1, {'type': 'int', 'name': 'b', 'value': 2}),
+        ])
+        self.assertEqual(loaded['properties'], [])
+        self.assertEqual(loaded['nested'], {'properties': [items[1][1]]})
+        self.assertEqual({**loaded, 'properties': [item for _, item in items]}, yaml.safe_load(content))
+
+        # YAML config strings are always streamed, other formats keep the properties in the loaded object.
+        config_items = []
+        loaded = Config._load_content(content, lambda index, item: config_items.append((index, item)))
+
+        self.assertEqual((loaded['properties'], config_items), ([], items))
+        self.assertEqual(
+            Config._load_content(json.dumps(yaml.safe_load(content)), config_items.append, 'json'),
+            yaml.safe_load(content),
+        )
+        self.assertEqual(len(config_items), 2)
+
+        # Memory-mapped config files produce the same properties as config strings.
+        with open(self._test_config_path, 'r') as f:
+            content = f.read()
+        properties = Config._load_file(self._test_config_path).properties
+
+        self.assertEqual(
+            [(p.name, p.value, p.type, p.hidden, p.comment) for p in properties],
+            [(p.name, p.value, p.type, p.hidden, p.comment) for p in Config._load(content).properties],
+        )
+
+        # Errors of streamed properties name the failing property.
+        with self.assertRaises(ConfigValidationException) as context:
+            Config._load('properties:\n  - {type: int, name: a, value: 1}\n  - {type: int, name: b}\n')
+        self.assertEqual(str(context.exception), 'properties[1]: Missing key: \'value\'')
+
+    def test_plugin_registry(self):
+        PluginRegistry.reset()
+
+        try:
+            with mock.patch.object(PluginRegistry, '_discover', return_value=[]) as discover:
+                for _ in range(3):
+                    Orchestrator.read_config(self._test_config_path, plugins=self._plugins)
+
+            # Make sure installed plugins are only discovered once and caller-provided plugins are not registered
+            # process-wide.
+            self.assertEqual(discover.call_count, 1)
+            self.assertEqual(PluginRegistry.default().get_plugins(), [])
+
+            registry = PluginRegistry.default().overlay(self._plugins)
+            first = Plugin('example-script', ExampleScriptConfig)
+            second = Plugin('example_script', ExampleScriptConfig)
+
+            self.assertEqual(registry.find(PluginType.LANGUAGE_CONFIG, ['examplescript']), [self._plugins[0]])
+            self.assertEqual(registry.find(PluginType.DISTRIBUTOR, ['examplescript']), [])
+
+            # Plugins with the same normalized name replace each other.
+            overlay = registry.overlay([first, second])
+
+            self.assertEqual(overlay.get_plugins(), [*self._plugins, second])
+            self.assertEqual(overlay.find(PluginType.LANGUAGE_CONFIG, ['example-script', 'example_script']), [second])
+        finally:
+            PluginRegistry.reset()
+
+    def test_lazy_plugin_loading(self):
+        def entry_point(group: str, class_type: Type) -> mock.Mock:
+            return mock.Mock(group=group, load=mock.Mock(return_value=class_type))
+
+        requested = entry_point('ninja-bear-language-examplescript', ExampleScriptConfig)
+        other = entry_point('ninja-bear-language-other', ExampleScriptConfig)
+        distributor = entry_point('ninja_bear_distributor_exampledistributor', ExampleDistributor)
+        unrelated = entry_point('console_scripts', None)
+
+        PluginRegistry.reset()
+
+        try:
+            with mock.patch(
+                'importlib_metadata.entry_points',
+                return_value=[requested, other, distributor, unrelated],
+            ):
+                language_config = Config._evaluate_language_config(PluginManager(), 'examplescript')
+
+            # Make sure only the requested plugin got imported.
+            self.assertIs(language_config, ExampleScriptConfig)
+            self.assertEqual(requested.load.call_count, 1)
+            self.assertEqual(other.load.call_count, 0)
+            self.assertEqual(distributor.load.call_count, 0)
+            self.assertEqual(unrelated.load.call_count, 0)
+
+            # Listing all plugins imports the remaining ones.
+            self.assertEqual(len(PluginManager().get_distributor_plugins()), 1)
+            self.assertEqual(requested.load.call_count, 1)
+            self.assertEqual(other.load.call_count, 1)
+            PluginRegistry.reset()
+
+            # Make sure an invalid entry point with the same name doesn't shadow a valid plugin.
+            broken = entry_point('ninja_bear_language_examplescript', None)
+            unknown = entry_point('ninja-bear-language-examplescript', ExampleScriptGenerator)
+
+            with mock.patch('importlib_metadata.entry_points', return_value=[requested, broken, unknown]):
+                language_config = Config._evaluate_language_config(PluginManager(), 'examplescript')
+
+            self.assertIs(language_config, ExampleScriptConfig)
+            self.assertEqual(len(PluginManager().get_plugins()), 1)
+        finally:
+            PluginRegistry.reset()
+
+    def test_plugin_index(self):
+        installed = [
+            EntryPoint(name='config', value='example.language:Config', group='ninja-bear-language-example'),
+            EntryPoint(name='console', value='example.cli:main', group='console_scripts'),
+        ]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            try:
+                PluginIndex.set_cache_dir(cache_dir)
+
+                with mock.patch('importlib_metadata.entry_points', return_value=installed) as discover:
+                    self.assertEqual(PluginIndex.entry_points(), installed[:1])
+
+                    # Make sure the index is used as long as the installed distributions don't change.
+                    self.assertEqual(PluginIndex.entry_points(), installed[:1])
+                    self.assertEqual(discover.call_count, 1)
+
+                    with mock.patch.object(PluginIndex, 'fingerprint', return_value='changed'):
+                        self.assertEqual(PluginIndex.entry_points(), installed[:1])
+                    self.assertEqual(discover.call_count, 2)
+            finally:
+                PluginIndex.set_cache_dir(None)
+
+    def test_cli_startup(self):
+        root_path = path.join(self._test_path, '..')
+
+        def run(*args: str) -> subprocess.CompletedProcess:
+            return subprocess.run([sys.executable, *args], cwd=root_path, capture_output=True, text=True)
+
+        # Make sure importing the package or the CLI doesn't import the config machinery and its dependencies (checked
+        # in a fresh interpreter as this process has imported everything already).
+        heavy_modules = [
+            'yaml',
+            'schema',
+            'importlib_metadata',
+            'src.ninja_bear.base.config',
+            'src.ninja_bear.base.generator_base',
+            'src.ninja_bear.base.language_config_base',
+            'src.ninja_bear.base.plugin_manager',
+        ]
+
+        for module in ['src.ninja_bear', 'src.ninja_bear.cli']:
+            result = run('-c', f'import sys, {module}; print([m for m in {heavy_modules} if m in sys.modules])')
+            self.assertEqual(result.stdout.strip(), '[]', module)
+
+        # --help and argument errors don't need the heavy modules either.
+        self.assertEqual(run('-m', 'src.ninja_bear.cli', '--help').returncode, 0)
+        self.assertEqual(run('-m', 'src.ninja_bear.cli').returncode, 2)
+
+    def test_include_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            def write(name: str, content: str):
+                with open(path.join(directory, name), 'w') as f:
+                    f.write(content)
+
+            write('base.yaml', 'properties:\n  - type: int\n    name: value\n    value: 1\n')
+            write('common.yaml', (
+                'includes:\n  - path: base.yaml\n    as: base\n'
+                'properties:\n  - type: int\n    name: value\n    value: ${base.value}\n'
+            ))
+            write('first.yaml', (
+                'includes:\n  - path: common.yaml\n    as: common\n'
+                'properties:\n  - type: int\n    name: value\n    value: ${common.value}\n'
+            ))
+            write('second.yaml', (
+                'includes:\n  - path: common.yaml\n    as: shared\n'
+                'properties:\n  - type: int\n    name: value\n    value: ${shared.value}\n'
+            ))
+            include_cache = IncludeCache()
+
+            with mock.patch.object(Config, '_load_content', wraps=Config._load_content) as load_content:
+                first = Config._read(path.join(directory, 'first.yaml'), include_cache=include_cache)[1]
+                second = Config._read(path.join(directory, 'second.yaml'), include_cache=include_cache)[1]
+
+            # Each included file is only loaded once.
+            self.assertEqual(load_content.call_count, 4)
+            self.assertEqual([(p.namespace, p.hidden) for p in first], [('base', True), ('common', True), ('', None)])
+            self.assertEqual([(p.namespace, p.hidden) for p in second], [('base', True), ('shared', True), ('', None)])
+
+            # Cached properties are copies.
+            self.assertFalse(set(map(id, first)) & set(map(id, second)))
+
+            # Aliases of nested includes are still checked.
+            write('third.yaml', (
+                'includes:\n  - path: base.yaml\n    as: base\n  - path: common.yaml\n    as: common\n'
+                'properties: []\n'
+            ))
+            with self.assertRaises(AliasAlreadyInUseException):
+                Config._read(path.join(directory, 'third.yaml'), include_cache=include_cache)
+
+    def test_parallel_includes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            includes = ''
+
+            for i in range(8):
+                with open(path.join(directory, f'include{i}.yaml'), 'w') as f:
+                    f.write(f'properties:\n  - type: int\n    name: value\n    value: {i}\n')
+                includes += f'  - path: include{i}.yaml\n    as: include{i}\n'
+
+            config_path = path.join(directory, 'config.yaml')
+
+            with open(config_path, 'w') as f:
+                f.write(f'includes:\n{includes}properties: []\n')
+
+            def evaluate(include_workers: int):
+                properties = Config._read(config_path, include_workers=include_workers)[1]
+                return [(p.namespace, p.value) for p in properties]
+
+            # The merge order does not depend on the number of workers.
+            self.assertEqual(evaluate(4), [(f'include{i}', i) for i in range(8)])
+            self.assertEqual(evaluate(4), evaluate(1))
+
+            # Aliases are still checked in include order.
+            with open(config_path, 'w') as f:
+                f.write(f'includes:\n{includes}  - path: missing.yaml\n    as: include3\nproperties: []\n')
+
+            with self.assertRaises(AliasAlreadyInUseException):
+                Config._read(config_path, include_workers=4)
+
+            # Make sure invalid worker counts are rejected instead of crashing in the thread pool.
+            for include_workers in [0, -1]:
+                with self.assertRaisesRegex(ValueError, 'include_workers'):
+                    Orchestrator.read_config(config_path, include_workers=include_workers)
+
+                with self.assertRaisesRegex(ValueError, 'include_workers'):
+                    Orchestrator.parse_config('properties: []', 'test-config', include_workers=include_workers)
+
+                argv = ['ninja-bear', '-c', config_path, '--include-workers', str(include_workers)]
+
+                with mock.patch.object(sys, 'argv', argv), mock.patch.object(sys, 'stderr', io.StringIO()) as stderr:
+                    with self.assertRaises(SystemExit) as context:
+                        cli.main()
+                self.assertEqual(context.exception.code, 2)
+                self.assertIn('not a positive integer', stderr.getvalue())
+
     def test_run_generators(self):
         orchestrator = Orchestrator.read_config(self._test_config_path, plugins=self._plugins)
         language_configs = orchestrator.language_configs
@@ -140,6 +568,391 @@ class Test(unittest.TestCase):
         self.assertEqual(local_generator.dump().strip(), _COMPARE_FILE_CONTENT.strip())
         self.maxDiff = original_max_diff
 
+    def test_add_properties(self):
+        generator = ExampleScriptGenerator(
+            GeneratorConfiguration(type_name='test'),
+            properties=[
+                Property('a', 1, PropertyType.INT),
+                Property('a', 2, PropertyType.INT, namespace='ns'),
+            ],
+        )
+
+        # Make sure a batch containing a duplicate is rejected as a whole.
+        with self.assertRaises(PropertyAlreadyExistsException):
+            generator.add_properties([Property('b', 3, PropertyType.INT), Property('b', 4, PropertyType.INT)])
+        with self.assertRaises(PropertyAlreadyExistsException):
+            generator.add_property(Property('a', 5, PropertyType.INT, namespace='ns'))
+
+        generator.add_property(Property('c', 6, PropertyType.INT))
+        self.assertEqual([property.value for property in generator._properties], [1, 2, 6])
+
+        # Make sure direct modifications of the properties list are kept and update the index.
+        generator._properties.append(Property('d', 7, PropertyType.INT))
+        generator._properties.sort(key=lambda property: -property.value)
+
+        self.assertEqual([property.value for property in generator._properties], [7, 6, 2, 1])
+        self.assertIn('d = 7', generator.dump())
+
+        with self.assertRaises(PropertyAlreadyExistsException):
+            generator.add_property(Property('d', 8, PropertyType.INT))
+
+        del generator._properties[0]
+        generator.add_property(Property('d', 8, PropertyType.INT))
+        self.assertEqual([property.value for property in generator._properties], [6, 2, 1, 8])
+
+    def test_property_overlay(self):
+        properties = [Property('a', 1, PropertyType.INT), Property('b', 'B', PropertyType.STRING)]
+        overlay = PropertyOverlay(properties)
+
+        # Make sure unchanged properties are shared and changed ones are copied only once.
+        self.assertIs(overlay.update(0, value=1), properties[0])
+        self.assertIsNot(overlay.update(1, value='C'), properties[1])
+        self.assertIs(overlay.update(1, name='c'), overlay[1])
+        self.assertEqual(overlay.copied_count(), 1)
+        self.assertEqual((overlay[1].name, overlay[1].value), ('c', 'C'))
+        self.assertEqual((properties[1].name, properties[1].value), ('b', 'B'))
+
+        # Make sure generators and transformers which modify the properties directly only modify copies.
+        class ModifyingGenerator(ExampleScriptGenerator):
+            def _dump(self, info: DumpInfo) -> str:
+                for property in info.properties:
+                    property.value = f'<{property.value}>'
+                return super()._dump(info)
+
+        originals = [Property('greeting', 'Hi', PropertyType.STRING), Property('other', 'Ho', PropertyType.STRING)]
+        generator = ModifyingGenerator(GeneratorConfiguration(type_name='test'), properties=originals)
+
+        self.assertIn("greeting = '<Hi>'", generator.dump())
+        self.assertIn("greeting = '<Hi>'", generator.dump())
+
+        generator = ExampleScriptGenerator(
+            GeneratorConfiguration(
+                type_name='test',
+                transformers=[
+                    'properties[1].value = "changed"',
+                    Transformer('properties[0].comment = "batch"', batch=True),
+                ],
+            ),
+            properties=originals,
+        )
+        dump = generator.dump()
+
+        self.assertIn("other = 'changed'", dump)
+        self.assertIn('-- batch', dump)
+        self.assertEqual([(p.value, p.comment) for p in originals], [('Hi', None), ('Ho', None)])
+
+    def test_property_slots(self):
+        property = Property('greeting', 'Hello ${name}', PropertyType.STRING, comment='Greeting', namespace='ns')
+        template = property.template
+
+        self.assertFalse(hasattr(property, '__dict__'))
+        self.assertIs(property.namespace, Property('other', 1, PropertyType.INT, namespace=''.join('ns')).namespace)
+
+        # Copies and pickled properties keep all attributes.
+        for copy in [property._copy(), pickle.loads(pickle.dumps(property, pickle.HIGHEST_PROTOCOL))]:
+            self.assertEqual(
+                (copy.name, copy.value, copy.type, copy.hidden, copy.comment, copy.namespace),
+                ('greeting', 'Hello ${name}', PropertyType.STRING, False, 'Greeting', 'ns'),
+            )
+        self.assertIs(property._copy().template, template)
+
+        # Trusted properties skip the name checks but still get their values converted.
+        with self.assertRaises(InvalidVariableNameException):
+            Property('1invalid', 1, PropertyType.INT)
+        self.assertEqual(Property('1trusted', '42px', PropertyType.INT, trusted=True).value, 42)
+
+        # Make sure the naming patterns can still be changed.
+        with mock.patch.object(Property, '_PROPERTY_NAME_PATTERN', r'^\d\w*$'):
+            self.assertEqual(Property('1valid', 1, PropertyType.INT).name, '1valid')
+
+            with self.assertRaises(InvalidVariableNameException):
+                Property('invalid', 1, PropertyType.INT)
+        with mock.patch.object(Property, '_NAMESPACE_NAME_PATTERN', r'^[a-z]+$'):
+            with self.assertRaises(InvalidNamespaceException):
+                Property('valid', 1, PropertyType.INT, namespace='Invalid')
+
+    def test_transformer_cache(self):
+        SOURCE = 'value = value * 2'
+
+        # Make sure the same code object is returned for the same source.
+        code = TransformerCache.compile(SOURCE)
+        self.assertIs(TransformerCache.compile(SOURCE), code)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            try:
+                TransformerCache.set_cache_dir(cache_dir)
+                TransformerCache.clear()
+                TransformerCache.compile(SOURCE)
+                TransformerCache.clear()
+
+                # Make sure the transformer gets loaded from disk.
+                local_variables = {'value': 21}
+                exec(TransformerCache.compile(SOURCE), None, local_variables)
+
+                self.assertEqual(len(os.listdir(os.path.join(cache_dir, 'transformers'))), 1)
+                self.assertEqual(local_variables['value'], 42)
+            finally:
+                TransformerCache.set_cache_dir(None)
+
+    def test_parse_cache(self):
+        with open(self._test_config_path, 'r') as f:
+            content = f.read().replace('test-include.yaml', os.path.join(os.getcwd(), 'example', 'test-include.yaml'))
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            try:
+                ParseCache.set_cache_dir(cache_dir)
+                Orchestrator.parse_config(content, 'test-config', plugins=self._plugins)
+
+                # Make sure the config and its include are not loaded again.
+                with mock.patch.object(Config, '_load_content') as load_content:
+                    orchestrator = Orchestrator.parse_config(content, 'test-config', plugins=self._plugins)
+                self.assertEqual(load_content.call_count, 0)
+                self._evaluate_configs(orchestrator.language_configs)
+
+                # Make sure that pickled entries (e.g., planted by someone else) are not executed but just ignored.
+                marker_path = os.path.join(cache_dir, 'marker')
+                entries_dir = os.path.join(cache_dir, 'configs')
+
+                for entry in os.listdir(entries_dir):
+                    with open(os.path.join(entries_dir, entry), 'wb') as f:
+                        f.write(pickle.dumps(_PickledCall(os.makedirs, marker_path)))
+                orchestrator = Orchestrator.parse_config(content, 'test-config', plugins=self._plugins)
+
+                self.assertFalse(os.path.exists(marker_path))
+                self._evaluate_configs(orchestrator.language_configs)
+
+                # Make sure the least recently used entries get evicted if the cache grows too big.
+                ParseCache.set_cache_dir(cache_dir, max_size=1)
+                Config.parse('properties: []', 'test-config')
+                self.assertEqual(len(os.listdir(os.path.join(cache_dir, 'configs'))), 0)
+            finally:
+                ParseCache.set_cache_dir(None)
+
+    def test_batch_transformer(self):
+        generator = ExampleScriptGenerator(
+            GeneratorConfiguration(
+                type_name='test',
+                transformers=[
+                    'value = value + 1 if name == "count" else value',
+                    Transformer('values[:] = [v * 2 if t == "int" else v for v, t in zip(values, types)]', batch=True),
+                ],
+            ),
+            properties=[
+                Property('count', 1, PropertyType.INT),
+                Property('greeting', 'Hello', PropertyType.STRING),
+            ],
+        )
+        self.assertIn('int count = 4', generator.dump())
+
+        # Make sure a value must be provided for each property.
+        generator.transformers = [Transformer('values = values[1:]', batch=True)]
+
+        with self.assertRaises(InvalidBatchTransformerResultException):
+            generator.dump()
+
+    def test_shared_property_resolution(self):
+        properties = [
+            Property('greeting', 'Hello ${name}', PropertyType.STRING),
+            Property('name', 'World', PropertyType.STRING, hidden=True),
+        ]
+        mars_transformer = Transformer('value = "Mars" if name == "name" else value')
+        orchestrator = Orchestrator([
+            ExampleScriptConfig('test.yaml', properties),
+            ExampleScriptConfig('test.yaml', properties, naming_conventions=LanguageConfigNamingConventions()),
+            ExampleScriptConfig('test.yaml', properties, transformers=[mars_transformer]),
+        ])
+        resolve_properties = GeneratorBase._resolve_properties
+        resolved_generators = []
+
+        def count_resolutions(generator: GeneratorBase):
+            resolved_generators.append(generator)
+            return resolve_properties(generator)
+
+        # Make sure the properties are only resolved once per transformer chain.
+        with mock.patch.object(GeneratorBase, '_resolve_properties', count_resolutions):
+            dumps = orchestrator.dump()
+
+        self.assertEqual(len(resolved_generators), 2)
+        self.assertIn('Hello World', dumps[1])
+        self.assertIn('Hello Mars', dumps[2])
+
+        # Make sure generators only share resolved properties if their classes resolve them the same way.
+        class UpperCaseGenerator(ExampleScriptGenerator):
+            def _resolve_properties(self) -> List[Property]:
+                properties = super()._resolve_properties()
+
+                for property in properties:
+                    property.value = property.value.upper()
+                return properties
+
+        resolution = PropertyResolution()
+        configuration = GeneratorConfiguration(type_name='test')
+        generators = [
+            generator_type(configuration, properties=properties).set_property_resolution(resolution)
+            for generator_type in [ExampleScriptGenerator, StreamingExampleScriptGenerator, UpperCaseGenerator]
+        ]
+
+        self.assertEqual(generators[0].resolution_key(), generators[1].resolution_key())
+        self.assertNotEqual(generators[0].resolution_key(), generators[2].resolution_key())
+        for generator, expected in zip(generators, ['Hello World', 'Hello World', 'HELLO WORLD']):
+            self.assertIn(expected, generator.dump())
+
+        # Make sure superseded resolutions get dropped.
+        for value in ['Hi', 'Ho', 'Hey']:
+            properties[1].value = value
+
+            greeting = f'Hello {value}'
+
+            for generator, expected in zip(generators, [greeting, greeting, greeting.upper()]):
+                self.assertIn(expected, generator.dump())
+        self.assertEqual(len(resolution._entries), 2)
+
+    def test_streaming_dump(self):
+        generator = StreamingExampleScriptGenerator(
+            GeneratorConfiguration(type_name='test', meta_data_settings=MetaDataSettings(version=True)),
+            properties=[Property('count', 1, PropertyType.INT), Property('other', 2, PropertyType.INT)],
+        )
+        stream = io.StringIO()
+        generator.dump_to(stream)
+
+        self.assertEqual(stream.getvalue(), generator.dump())
+        self.assertEqual(
+            stream.getvalue(),
+            f'struct Test:\n    count = 1\n    other = 2\n\n-- version: {VERSION}\n',
+        )
+
+        # Make sure generators which implement neither _dump nor _dump_iter can't be instantiated.
+        class IncompleteGenerator(GeneratorBase):
+            def _default_type_naming_convention(self) -> NamingConventionType:
+                return NamingConventionType.PASCAL_CASE
+
+            def _line_comment(self, string: str) -> str:
+                return f'-- {string}'
+
+        with self.assertRaisesRegex(TypeError, '_dump'):
+            IncompleteGenerator(GeneratorConfiguration(type_name='test'))
+
+    def test_property_table(self):
+        properties = [
+            Property('firstValue', 1, PropertyType.INT),
+            Property('hiddenValue', 'x', PropertyType.STRING, hidden=True, namespace='ns'),
+            Property('second_value', 'Hello', PropertyType.STRING, comment='Greeting'),
+            Property('thirdValue', 2.5, PropertyType.FLOAT),
+        ]
+
+        # Test the pure Python columns and the NumPy columns (if NumPy is installed).
+        for numpy in [None, property_table.numpy] if property_table.numpy else [None]:
+            with mock.patch.object(property_table, 'numpy', numpy):
+                table = PropertyTable.from_properties(properties)
+                self.assertEqual(len(table), 4)
+                self.assertEqual((table[1].name, table[1].namespace, table[1].hidden), ('hiddenValue', 'ns', True))
+
+                self.assertEqual(table[2:][0].comment, 'Greeting')
+
+                groups = table.group_by_type()
+                self.assertEqual(list(groups), [PropertyType.INT, PropertyType.FLOAT, PropertyType.STRING])
+                self.assertEqual([p.value for p in groups[PropertyType.FLOAT]], [2.5])
+                self.assertEqual([p.name for p in groups[PropertyType.STRING]], ['hiddenValue', 'second_value'])
+
+                converted = table.convert_names(NamingConventionType.SNAKE_CASE)
+                self.assertEqual(list(converted.names), ['first_value', 'hidden_value', 'second_value', 'third_value'])
+                self.assertEqual(list(table.names), ['firstValue', 'hiddenValue', 'second_value', 'thirdValue'])
+
+        # Generators which use a table produce the same output and only receive the resolved (not hidden) properties.
+        configuration = GeneratorConfiguration(type_name='test')
+        dumps = [
+            generator_type(configuration, properties=properties).dump()
+            for generator_type in [ExampleScriptGenerator, TableExampleScriptGenerator]
+        ]
+        self.assertEqual(dumps[0], dumps[1])
+        self.assertNotIn('hiddenValue', dumps[1])
+
+    def test_dump_cache(self):
+        OUTPUT_DIR = path.join(self._test_path, 'test_output_cache')
+        credential = DistributorCredentials('example-alias', None, 'password')
+        orchestrator = Orchestrator.read_config(self._test_config_path, [credential], plugins=self._plugins)
+        generator_dump = GeneratorBase.dump
+        dumped_generators = []
+
+        def count_dumps(generator: GeneratorBase):
+            dumped_generators.append(generator)
+            return generator_dump(generator)
+
+        if not os.path.isdir(OUTPUT_DIR):
+            os.mkdir(OUTPUT_DIR)
+
+        try:
+            # Make sure write and distribute share the same generation result.
+            with mock.patch.object(GeneratorBase, 'dump', count_dumps):
+                orchestrator.write(OUTPUT_DIR)
+                orchestrator.distribute()
+                self.assertEqual(len(dumped_generators), 1)
+
+                # Make sure changes invalidate the cached result.
+                language_config = orchestrator.language_configs[0]
+                language_config.generator.add_property(Property('myAddedInteger', 7, PropertyType.INT))
+
+                self.assertIn('myAddedInteger', language_config.dump())
+                self.assertEqual(len(dumped_generators), 2)
+
+                # Make sure properties which are modified in place invalidate the cached result as well.
+                property = language_config.generator._properties[-1]
+                property.value = 8
+                property.comment = 'Modified'
+
+                self.assertIn('myAddedInteger = 8 -- Modified', language_config.dump())
+                self.assertEqual(len(dumped_generators), 3)
+
+                # Dumping again doesn't generate the config again, not even if unrelated properties are modified.
+                unrelated_property = Property('unrelated', 1, PropertyType.INT)
+                unrelated_property.value = 2
+                pickle.loads(pickle.dumps(property)).value = 9
+
+                language_config.dump()
+                self.assertEqual(len(dumped_generators), 3)
+
+                # Make sure in-place modifications of the additional props invalidate the cached result.
+                language_config.generator._additional_props['added'] = True
+
+                language_config.dump()
+                self.assertEqual(len(dumped_generators), 4)
+
+                # Make sure renamed properties are indexed by their new name.
+                property.name = 'myRenamedInteger'
+
+                self.assertIn('myRenamedInteger = 8', language_config.dump())
+                self.assertEqual(len(dumped_generators), 5)
+                self.assertIn((None, 'myRenamedInteger'), language_config.generator._property_map)
+        finally:
+            shutil.rmtree(OUTPUT_DIR)
+
+    def test_name_converter_cache(self):
+        NameConverter.clear_cache()
+
+        names = ['myProperty', 'MY_PROPERTY', 'my-property']
+        converted_names = NameConverter.convert_many(names, NamingConventionType.SNAKE_CASE)
+
+        self.assertEqual(converted_names, ['my_property', 'my_property', 'my_property'])
+        self.assertEqual(
+            NameConverter.convert_many(names, NamingConventionType.CAMEL_CASE),
+            [NameConverter.convert(name, NamingConventionType.CAMEL_CASE) for name in names],
+        )
+
+    def test_naming_conventions(self):
+        naming_conventions = [
+            NamingConventionType.SNAKE_CASE,
+            NamingConventionType.SCREAMING_SNAKE_CASE,
+            NamingConventionType.CAMEL_CASE,
+            NamingConventionType.PASCAL_CASE,
+            NamingConventionType.KEBAP_CASE,
+            NamingConventionType.DOT_CASE,
+            NamingConventionType.TRAIN_CASE,
+        ]
+
+        for name, expected_names in _NAMING_CONVENTION_CORPUS.items():
+            for naming_convention, expected_name in zip(naming_conventions, expected_names):
+                self.assertEqual(NameConverter.convert(name, naming_convention), expected_name)
+
     def test_write_constants(self):
         OUTPUT_DIR = path.join(self._test_path, 'test_output')
         orchestrator = Orchestrator.read_config(self._test_config_path, plugins=self._plugins)
@@ -160,6 +973,52 @@ class Test(unittest.TestCase):
         for config in orchestrator.language_configs:
             self.assertIn(config.config_info.file_name_full, files)
 
+    def test_parallel_write(self):
+        content = 'languages:\n'
+
+        for file_naming in ['snake', 'screaming-snake', 'camel', 'pascal', 'kebap']:
+            content += f'  - language: examplescript\n    file_naming: {file_naming}\n'
+        content += 'properties:\n  - type: int\n    name: myValue\n    value: 1\n'
+
+        orchestrator = Orchestrator.parse_config(content, 'test-config', plugins=self._plugins)
+        outputs = []
+
+        for jobs in [1, 4]:
+            with tempfile.TemporaryDirectory() as directory:
+                orchestrator.write(directory, jobs=jobs)
+
+                outputs.append({})
+                for file_name in os.listdir(directory):
+                    with open(path.join(directory, file_name), 'r') as f:
+                        outputs[-1][file_name] = f.read()
+        self.assertEqual(len(outputs[0]), 5)
+        self.assertEqual(outputs[0], outputs[1])
+
+        # Make sure the error of the first language config is raised, even if another one fails earlier.
+        def fail_later(path: str):
+            time.sleep(0.1)
+            raise ValueError('first')
+
+        first, second = orchestrator.language_configs[:2]
+
+        with mock.patch.object(first, 'write', side_effect=fail_later), \
+                mock.patch.object(second, 'write', side_effect=ValueError('second')):
+            with tempfile.TemporaryDirectory() as directory:
+                with self.assertRaisesRegex(ValueError, 'first'):
+                    orchestrator.write(directory, jobs=4)
+
+        # Make sure invalid job counts are rejected instead of crashing in the thread pool.
+        for jobs in [0, -1]:
+            with self.assertRaisesRegex(ValueError, 'jobs'):
+                orchestrator.write('', jobs=jobs)
+
+            with mock.patch.object(sys, 'argv', ['ninja-bear', '-c', 'config.yaml', '-j', str(jobs)]), \
+                    mock.patch.object(sys, 'stderr', io.StringIO()) as stderr:
+                with self.assertRaises(SystemExit) as context:
+                    cli.main()
+            self.assertEqual(context.exception.code, 2)
+            self.assertIn('not a positive integer', stderr.getvalue())
+
     def test_distribution(self):
         # Get secret from environment variables.
         credential = DistributorCredentials('example-alias', None, 'password')
@@ -168,6 +1027,84 @@ class Test(unittest.TestCase):
         self._evaluate_configs(orchestrator.language_configs)
         orchestrator.distribute()
 
+    def test_substitution_order(self):
+        properties = [
+            Property('first', 'A${second}', PropertyType.STRING),
+            Property('second', 'B${third}', PropertyType.STRING),
+            Property('third', 'C', PropertyType.STRING),
+            Property('number', '${count} * 2', PropertyType.INT),
+            Property('count', 21, PropertyType.INT),
+            Property('other', '${third}', PropertyType.STRING, namespace='ns'),
+            Property('third', 'D', PropertyType.STRING, namespace='ns'),
+        ]
+        values = SubstitutionResolver(properties).resolve()
+
+        # Make sure the resolved values don't depend on the property order and the originals stay untouched.
+        self.assertEqual(values, ['ABC', 'BC', 'C', 42, 21, 'D', 'D'])
+        self.assertEqual(properties[0].value, 'A${second}')
+
+    def test_substitution_errors(self):
+        with self.assertRaises(RecursiveSubstitutionException) as context:
+            SubstitutionResolver([Property('a', '${a}', PropertyType.STRING)]).resolve()
+        self.assertEqual(
+            str(context.exception),
+            'It\'s not allowed for a property to reference itself (Property a must not reference itself!)',
+        )
+
+        with self.assertRaises(CircularSubstitutionException):
+            SubstitutionResolver([
+                Property('a', '${b}', PropertyType.STRING),
+                Property('b', '${c}', PropertyType.STRING),
+                Property('c', '${a}', PropertyType.STRING),
+            ]).resolve()
+
+        with self.assertRaises(UnknownSubstitutionException):
+            SubstitutionResolver([
+                Property('a', '${ns.b}', PropertyType.STRING, namespace='ns'),
+                Property('b', 'b', PropertyType.STRING, namespace='ns'),
+            ]).resolve()
+
+    def test_substitution_template(self):
+        template = SubstitutionTemplate.parse('Hello ${ti.name}, meet ${other}!')
+
+        self.assertEqual(template.literals, ('Hello ', ', meet ', '!'))
+        self.assertEqual(template.references, ('ti.name', 'other'))
+        self.assertEqual(template.render(['Mars', 'Venus']), 'Hello Mars, meet Venus!')
+        self.assertFalse(SubstitutionTemplate.parse('No substitution').has_references())
+
+        # Make sure the template is cached on the property until its value changes.
+        property = Property('greeting', 'Hello ${name}', PropertyType.STRING)
+
+        self.assertIs(property.template, property.template)
+        property.value = 'Bye ${name}'
+        self.assertEqual(property.template.literals, ('Bye ', ''))
+
+    def test_number_expression(self):
+        expression = SubstitutionTemplate.parse('(${a} + ${b}) * 2 ** ${c} - -1').number_expression()
+
+        self.assertEqual(expression.evaluate([1, 2.5, 3]), 29.0)
+        self.assertEqual(expression.evaluate([1, '2', True]), 7)
+        self.assertEqual(NumberExpression.compile(('', ' > 1 and ', ' or False')).evaluate([2, 0]), 0)
+        self.assertTrue(NumberExpression.compile(('1 < ', ' <= 3',)).evaluate([3]))
+
+        # Make sure only supported operations are allowed.
+        for invalid_expression in ['__import__("os")', '${a}.real', '[${a}]', 'lambda: 1', '${a} if 1 else 2']:
+            with self.assertRaises(InvalidNumberExpressionException):
+                SubstitutionTemplate.parse(invalid_expression).number_expression()
+
+        # Make sure references next to each other or next to digits are concatenated like in a text substitution.
+        for value, expected in [('${a}${b}', 12), ('1${a}', 11), ('${a}0', 10)]:
+            properties = [
+                Property('a', 1, PropertyType.INT),
+                Property('b', 2, PropertyType.INT),
+                Property('c', value, PropertyType.INT),
+            ]
+            self.assertEqual(SubstitutionResolver(properties).resolve()[2], expected, value)
+
+        # Make sure the validation is deterministic.
+        self.assertEqual(Property('p', '${a} / (${b} - 5)', PropertyType.FLOAT).value, '${a} / (${b} - 5)')
+        self.assertEqual(Property('p', '322f', PropertyType.FLOAT).value, 322.0)
+
     def _evaluate_configs(self, configs: List[LanguageConfigBase]):
         self.assertEqual(len(configs), 1)
         self._evaluate_config(configs[0])